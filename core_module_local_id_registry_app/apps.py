@@ -0,0 +1,21 @@
+"""Apps file for setting the local id registry module when app is ready"""
+
+from django.apps import AppConfig
+
+
+class LocalIdRegistryModuleAppConfig(AppConfig):
+    """Core module local id registry application settings"""
+
+    name = "core_module_local_id_registry_app"
+    verbose_name = "Core Module Local Id Registry App"
+
+    def ready(self):
+        """Run when the app is ready.
+
+        Returns:
+
+        """
+        from core_module_local_id_registry_app import config, watch
+
+        config.reload_config()
+        watch.init()
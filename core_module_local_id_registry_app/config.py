@@ -0,0 +1,147 @@
+"""Configuration snapshot of the local id registry module
+
+The configuration is built once, when the application is ready, so that
+requests only read attributes of the snapshot.
+"""
+
+from threading import Lock
+
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.utils.prefixes import PrefixIndex
+
+
+class _FrozenSlots:
+    """Base class of objects whose slots cannot be set after initialization"""
+
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("%s is read-only." % type(self).__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("%s is read-only." % type(self).__name__)
+
+
+class PidSettings(_FrozenSlots):
+    """PID settings of linked records"""
+
+    __slots__ = (
+        "path",
+        "format",
+        "system",
+        "prefixes",
+        "prefix_set",
+        "prefix_index",
+    )
+
+    def __init__(self, path, pid_format, system, prefixes):
+        """Initialize the PID settings
+
+        Args:
+            path: str - Value of `PID_PATH`.
+            pid_format: str - Value of `PID_FORMAT`.
+            system: str - Value of `ID_PROVIDER_SYSTEM_NAME`.
+            prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        """
+        prefix_index = PrefixIndex(prefixes)
+
+        super().__init__(
+            path=path,
+            format=pid_format,
+            system=system,
+            prefixes=tuple(prefixes),
+            prefix_set=prefix_index.prefix_set,
+            prefix_index=prefix_index,
+        )
+
+
+class LocalIdRegistryConfig(_FrozenSlots):
+    """Configuration of the local id registry module"""
+
+    __slots__ = (
+        "linked_records_installed",
+        "pid_settings",
+        "placeholder",
+        "styles",
+        "scripts",
+        "disabled",
+        "data_system_api",
+        "get_value_from_dot_notation",
+    )
+
+
+def build_config():
+    """Build the configuration from the current settings.
+
+    Returns:
+        LocalIdRegistryConfig
+    """
+    if "core_linked_records_app" not in settings.INSTALLED_APPS:
+        return LocalIdRegistryConfig(
+            linked_records_installed=False,
+            pid_settings=None,
+            placeholder=None,
+            styles=(),
+            scripts=(),
+            disabled=True,
+            data_system_api=None,
+            get_value_from_dot_notation=None,
+        )
+
+    from core_linked_records_app import settings as linked_records_settings
+    from core_linked_records_app.system.data import api as data_system_api
+    from core_linked_records_app.utils.dict import get_value_from_dot_notation
+
+    return LocalIdRegistryConfig(
+        linked_records_installed=True,
+        pid_settings=PidSettings(
+            linked_records_settings.PID_PATH,
+            linked_records_settings.PID_FORMAT,
+            linked_records_settings.ID_PROVIDER_SYSTEM_NAME,
+            linked_records_settings.ID_PROVIDER_PREFIXES,
+        ),
+        placeholder="A PID will be generated for this resource",
+        styles=("core_module_local_id_registry_app/css/module_local_id.css",),
+        scripts=("core_module_local_id_registry_app/js/module_local_id.js",),
+        disabled=False,
+        # Module, rather than its functions, so that patched functions are
+        # used.
+        data_system_api=data_system_api,
+        get_value_from_dot_notation=get_value_from_dot_notation,
+    )
+
+
+_config = None
+_config_lock = Lock()
+
+
+def reload_config():
+    """Build the configuration again, after the settings have changed.
+
+    Returns:
+        LocalIdRegistryConfig
+    """
+    global _config
+
+    with _config_lock:
+        _config = build_config()
+
+    return _config
+
+
+def get_config():
+    """Return the configuration, building it on first use.
+
+    Returns:
+        LocalIdRegistryConfig
+    """
+    config = _config
+
+    if config is None:
+        config = reload_config()
+
+    return config
@@ -0,0 +1,196 @@
+"""Audit local ids command"""
+
+import json
+import os
+from argparse import BooleanOptionalAction
+from time import perf_counter
+
+from django.core.management import BaseCommand, CommandError
+
+from core_module_local_id_registry_app.config import get_config
+from core_module_local_id_registry_app.utils.audit import audit_stored_pids
+from core_module_local_id_registry_app.utils.data import iter_pid_values
+from core_module_local_id_registry_app.utils.providers import (
+    get_resolved_provider,
+)
+
+
+def _load_checkpoint(checkpoint_path):
+    """Load the progress of a previous audit.
+
+    Args:
+        checkpoint_path: str
+
+    Returns:
+        dict - Last audited primary key, offset of the end of the report,
+        counters and elapsed time of the previous audit.
+    """
+    with open(checkpoint_path) as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def _save_checkpoint(checkpoint_path, checkpoint):
+    """Replace the checkpoint in a single step, so that an interrupted audit
+    never leaves a partial checkpoint.
+
+    Args:
+        checkpoint_path: str
+        checkpoint: dict
+    """
+    temporary_path = "%s.tmp" % checkpoint_path
+
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+
+    os.replace(temporary_path, checkpoint_path)
+
+
+class Command(BaseCommand):
+    """Audit local ids command"""
+
+    help = (
+        "Check that the PIDs stored in the data match the PID format, a "
+        "configured prefix and the provider host"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--report",
+            required=True,
+            type=str,
+            help="Path to the JSONL report of the violations",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            type=str,
+            help="Path to the checkpoint saved after each chunk",
+        )
+        parser.add_argument(
+            "--resume",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Resume the audit from the checkpoint",
+        )
+        parser.add_argument(
+            "--workers",
+            default=os.cpu_count(),
+            type=int,
+            help="Number of validation processes",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            default=1000,
+            type=int,
+            help="Number of PIDs validated by a task",
+        )
+
+    def handle(self, *args, **options):
+        """Audit the PIDs stored at `PID_PATH` in all the data.
+
+        Violations are written to the report, one JSON object per line, with
+        the data primary key, the PID and the verdict. Data without PID are
+        counted but not reported.
+
+        Examples:
+            auditlocalids --report audit.jsonl --checkpoint audit.json
+            auditlocalids --report audit.jsonl --checkpoint audit.json --resume
+
+        Args:
+            args:
+            options:
+
+        """
+        config = get_config()
+
+        if not config.linked_records_installed:
+            raise CommandError("Local IDs can only be audited with PIDs.")
+
+        if options["resume"] and not options["checkpoint"]:
+            raise CommandError("--resume requires --checkpoint.")
+
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        checkpoint = {
+            "last_data_id": None,
+            "report_offset": 0,
+            "records": 0,
+            "violations": 0,
+            "missing": 0,
+            "elapsed": 0.0,
+        }
+
+        if options["resume"] and os.path.exists(options["checkpoint"]):
+            checkpoint = _load_checkpoint(options["checkpoint"])
+
+        pid_settings = config.pid_settings
+        host_url = get_resolved_provider(
+            pid_settings.system, pid_settings.prefixes
+        ).lookup_url
+        start_time = perf_counter() - checkpoint["elapsed"]
+
+        with open(
+            options["report"], "r+" if checkpoint["report_offset"] else "w"
+        ) as report_file:
+            # Drop the violations written after the checkpoint.
+            report_file.seek(checkpoint["report_offset"])
+            report_file.truncate()
+
+            for last_data_id, count, violations, missing in audit_stored_pids(
+                iter_pid_values(
+                    pid_settings.path,
+                    start_after=checkpoint["last_data_id"],
+                    chunk_size=options["chunk_size"],
+                ),
+                pid_settings.format,
+                pid_settings.prefixes,
+                host_url,
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+            ):
+                for violation in violations:
+                    report_file.write(json.dumps(violation) + "\n")
+
+                report_file.flush()
+                checkpoint.update(
+                    last_data_id=last_data_id,
+                    report_offset=report_file.tell(),
+                    records=checkpoint["records"] + count,
+                    violations=checkpoint["violations"] + len(violations),
+                    missing=checkpoint["missing"] + missing,
+                    elapsed=perf_counter() - start_time,
+                )
+
+                if options["checkpoint"]:
+                    _save_checkpoint(options["checkpoint"], checkpoint)
+
+                if options["verbosity"] > 1:
+                    self.stdout.write(self._format_stats(checkpoint))
+
+        checkpoint["elapsed"] = perf_counter() - start_time
+        self.stdout.write(self.style.SUCCESS(self._format_stats(checkpoint)))
+
+    @staticmethod
+    def _format_stats(checkpoint):
+        """Describe the progress of the audit.
+
+        Args:
+            checkpoint: dict
+
+        Returns:
+            str
+        """
+        elapsed = checkpoint["elapsed"]
+
+        return (
+            "Audited %d data (%d violations, %d without PID) in %.1fs "
+            "(%.0f data/s)."
+            % (
+                checkpoint["records"],
+                checkpoint["violations"],
+                checkpoint["missing"],
+                elapsed,
+                checkpoint["records"] / elapsed if elapsed else 0,
+            )
+        )
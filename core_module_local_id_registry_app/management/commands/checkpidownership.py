@@ -0,0 +1,94 @@
+"""Check PID ownership command"""
+
+import json
+from collections import Counter
+
+from django.core.management import BaseCommand, CommandError
+
+from core_module_local_id_registry_app.config import get_config
+from core_module_local_id_registry_app.utils.data import iter_pid_values
+from core_module_local_id_registry_app.utils.ownership import (
+    PidOwnershipIndex,
+)
+
+
+class Command(BaseCommand):
+    """Check PID ownership command"""
+
+    help = (
+        "Check that the PID ownership index matches the PIDs stored in the "
+        "data"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--report",
+            default=None,
+            type=str,
+            help="Path to the JSONL report of the inconsistencies",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            default=1000,
+            type=int,
+            help="Number of data fetched from the database at once",
+        )
+
+    def handle(self, *args, **options):
+        """Build a PID ownership index from the PIDs stored at `PID_PATH`,
+        as the module does, then compare it with a second pass over them.
+
+        The check runs on an index built by the command: it does not inspect
+        the indexes of the running processes. Inconsistencies are PIDs held
+        by several data, for which ownership is ambiguous, and data modified
+        between the passes. They are written to the report, one JSON object
+        per line, and the command fails if any is found.
+
+        Examples:
+            checkpidownership --report ownership.jsonl
+
+        Args:
+            args:
+            options:
+
+        """
+        config = get_config()
+
+        if not config.linked_records_installed:
+            raise CommandError("PID ownership can only be checked with PIDs.")
+
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        pid_path = config.pid_settings.path
+        index = PidOwnershipIndex(0)
+        index.build(
+            iter_pid_values(pid_path, chunk_size=options["chunk_size"]),
+            pid_path,
+        )
+        issues = index.verify(
+            iter_pid_values(pid_path, chunk_size=options["chunk_size"])
+        )
+
+        if options["report"]:
+            with open(options["report"], "w") as report_file:
+                for issue in issues:
+                    report_file.write(json.dumps(issue) + "\n")
+
+        if issues:
+            counts = Counter(issue["issue"] for issue in issues)
+            raise CommandError(
+                "Found %d inconsistencies in %d stored PIDs (%s)."
+                % (
+                    len(issues),
+                    len(index),
+                    ", ".join(
+                        "%d %s" % (count, issue)
+                        for issue, count in sorted(counts.items())
+                    ),
+                )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS("Checked %d stored PIDs." % len(index))
+        )
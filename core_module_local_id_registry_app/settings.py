@@ -20,3 +20,219 @@ INSTALLED_APPS = getattr(settings, "INSTALLED_APPS", [])
 SERVER_URI = getattr(settings, "SERVER_URI", "http://localhost")
 """ str: URI of the server
 """
+
+DATA_STRUCTURE_CACHE_ALIAS = getattr(
+    settings, "DATA_STRUCTURE_CACHE_ALIAS", None
+)
+""" str: alias, in CACHES, of the Django cache storing the link between a
+module and its curate data structure, shared between workers.
+"""
+
+DATA_STRUCTURE_CACHE_TTL = getattr(
+    settings,
+    "DATA_STRUCTURE_CACHE_TTL",
+    60 if DATA_STRUCTURE_CACHE_ALIAS else 0,
+)
+""" int: lifetime, in seconds, of the cached link between a module and its
+curate data structure. Disabled by default unless DATA_STRUCTURE_CACHE_ALIAS is
+set. Set to 0 to disable the cache.
+"""
+
+PID_VALUE_CACHE_ALIAS = getattr(settings, "PID_VALUE_CACHE_ALIAS", None)
+""" str: alias, in CACHES, of the Django cache storing the PID values read from
+the data, shared between workers, so that the value cleared by the worker
+saving a data is cleared for all.
+"""
+
+PID_VALUE_CACHE_TTL = getattr(
+    settings, "PID_VALUE_CACHE_TTL", 60 if PID_VALUE_CACHE_ALIAS else 0
+)
+""" int: lifetime, in seconds, of the cached PID value read from a data.
+Disabled by default unless PID_VALUE_CACHE_ALIAS is set: values cached in the
+process are only cleared by the data saved in the process, and may stay
+outdated in the other workers until they expire. Set to 0 to disable the cache.
+"""
+
+LOCAL_ID_POOL_LOW_WATERMARK = getattr(
+    settings, "LOCAL_ID_POOL_LOW_WATERMARK", 10
+)
+""" int: number of pre-generated local ids under which the pool is refilled.
+"""
+
+LOCAL_ID_POOL_HIGH_WATERMARK = getattr(
+    settings, "LOCAL_ID_POOL_HIGH_WATERMARK", 100
+)
+""" int: number of pre-generated local ids kept in the pool after a refill. Set
+to 0 to generate each local id on demand.
+"""
+
+LOCAL_ID_GENERATOR = getattr(settings, "LOCAL_ID_GENERATOR", "random")
+""" str: strategy generating the local ids. "random" local ids are checked
+against the stored data. "sortable" local ids are built from the time, the node
+id of the process and a sequence, and sort by creation time. They are unique by
+construction, and built without query, when each process leases its node id in
+LOCAL_ID_NODE_CACHE_ALIAS; with LOCAL_ID_NODE_ID, they are checked against the
+stored data.
+"""
+
+LOCAL_ID_NODE_CACHE_ALIAS = getattr(
+    settings, "LOCAL_ID_NODE_CACHE_ALIAS", None
+)
+""" str: alias, in CACHES, of the Django cache in which each process generating
+sortable local ids leases its own node id. The cache must be shared by all the
+processes sharing the data, and must not evict the leases, e.g. Redis without
+an eviction policy.
+"""
+
+LOCAL_ID_NODE_LEASE_TTL = getattr(settings, "LOCAL_ID_NODE_LEASE_TTL", 3600)
+""" int: lifetime, in seconds, of the node id leased by a process, renewed
+while it generates sortable local ids.
+"""
+
+LOCAL_ID_NODE_ID = getattr(settings, "LOCAL_ID_NODE_ID", None)
+""" int: id, lower than 2 ** LOCAL_ID_NODE_BITS, of the processes generating
+sortable local ids when LOCAL_ID_NODE_CACHE_ALIAS is not set. Processes forked
+after the settings are loaded share it, so their local ids are checked against
+the stored data.
+"""
+
+LOCAL_ID_NODE_BITS = getattr(settings, "LOCAL_ID_NODE_BITS", 10)
+""" int: number of bits of the node id in sortable local ids.
+"""
+
+LOCAL_ID_SEQUENCE_BITS = getattr(settings, "LOCAL_ID_SEQUENCE_BITS", 12)
+""" int: number of bits of the sequence in sortable local ids, bounding the
+number of local ids generated by a process in each millisecond.
+"""
+
+PID_VERDICT_CACHE_ALIAS = getattr(settings, "PID_VERDICT_CACHE_ALIAS", None)
+""" str: alias, in CACHES, of the Django cache storing PID existence checks,
+shared between workers, so that the result cleared by the worker saving a data
+is cleared for all.
+"""
+
+PID_VERDICT_CACHE_TTL = getattr(
+    settings, "PID_VERDICT_CACHE_TTL", 30 if PID_VERDICT_CACHE_ALIAS else 0
+)
+""" int: lifetime, in seconds, of the cached result of a PID existence check.
+Disabled by default unless PID_VERDICT_CACHE_ALIAS is set: results cached in
+the process may stay outdated in the other workers until they expire. Set to 0
+to disable the cache.
+"""
+
+ASYNC_MODULE_VIEW = getattr(settings, "ASYNC_MODULE_VIEW", False)
+""" bool: serve the module requests with the asynchronous view in ASGI
+deployments, so that a worker waiting on PID existence checks keeps serving
+other requests.
+"""
+
+PHASE_TIMING_ENABLED = getattr(settings, "PHASE_TIMING_ENABLED", False)
+""" bool: time the phases of the module requests and report them in a
+Server-Timing header, in the logs and to the timing sinks.
+"""
+
+PHASE_TIMING_SINKS = getattr(settings, "PHASE_TIMING_SINKS", [])
+""" :py:class:`list`: dotted paths to the classes recording the phase
+durations, e.g. "core_module_local_id_registry_app.utils.timing.HistogramSink".
+"""
+
+PREFIX_SELECT_MAX_OPTIONS = getattr(settings, "PREFIX_SELECT_MAX_OPTIONS", 100)
+""" int: maximum number of prefixes rendered in the module. Above it, only the
+selected prefix is rendered and the others are searched from the prefix
+endpoint.
+"""
+
+PREFIX_SEARCH_PAGE_SIZE = getattr(settings, "PREFIX_SEARCH_PAGE_SIZE", 20)
+""" int: default number of prefixes returned by a page of the prefix endpoint.
+"""
+
+PREFIX_SEARCH_MAX_PAGE_SIZE = getattr(
+    settings, "PREFIX_SEARCH_MAX_PAGE_SIZE", 100
+)
+""" int: maximum number of prefixes returned by a page of the prefix endpoint.
+"""
+
+BATCH_VALIDATION_MAX_ITEMS = getattr(
+    settings, "BATCH_VALIDATION_MAX_ITEMS", 100
+)
+""" int: maximum number of local ids validated by a request to the batch
+endpoint.
+"""
+
+REMOTE_PID_CHECK_ENABLED = getattr(settings, "REMOTE_PID_CHECK_ENABLED", False)
+""" bool: check the existence of a PID by resolving it with the provider,
+rather than by searching the data. A PID is defined unless the resolver answers
+404 or 410.
+"""
+
+REMOTE_PID_CHECK_TIMEOUT = getattr(settings, "REMOTE_PID_CHECK_TIMEOUT", 5)
+""" float: timeout, in seconds, of a request resolving a PID.
+"""
+
+REMOTE_PID_CHECK_MAX_CONNECTIONS = getattr(
+    settings, "REMOTE_PID_CHECK_MAX_CONNECTIONS", 10
+)
+""" int: maximum number of connections kept alive with each resolver host,
+shared by the threads of the process. It also bounds the concurrent checks of a
+batch.
+"""
+
+REMOTE_PID_CHECK_RETRIES = getattr(settings, "REMOTE_PID_CHECK_RETRIES", 0)
+""" int: number of retries of the connections to the resolver which fail.
+"""
+
+PID_CHECK_DEADLINE = getattr(settings, "PID_CHECK_DEADLINE", 0)
+""" float: time, in seconds, allowed to a module request to validate its local
+id. Once exceeded, the last known verdict is returned, marked as stale, while
+the check goes on in the background. Set to 0 to wait for the check.
+"""
+
+PID_CHECK_WORKERS = getattr(settings, "PID_CHECK_WORKERS", 4)
+""" int: number of threads running the PID existence checks bounded by
+PID_CHECK_DEADLINE.
+"""
+
+PID_STALE_VERDICT_TTL = getattr(settings, "PID_STALE_VERDICT_TTL", 86400)
+""" int: lifetime, in seconds, of the last known result of a PID existence
+check, used when the provider is slow or unavailable.
+"""
+
+PID_CHECK_FAILURE_THRESHOLD = getattr(
+    settings, "PID_CHECK_FAILURE_THRESHOLD", 5
+)
+""" int: number of consecutive failed or late PID existence checks after which
+the provider is skipped. Set to 0 to always call the provider.
+"""
+
+PID_CHECK_RECOVERY_TIMEOUT = getattr(
+    settings, "PID_CHECK_RECOVERY_TIMEOUT", 30
+)
+""" float: time, in seconds, during which the provider is skipped before being
+called again.
+"""
+
+VALIDATION_MANIFEST_MAX_AGE = getattr(
+    settings, "VALIDATION_MANIFEST_MAX_AGE", 300
+)
+""" int: time, in seconds, during which clients reuse the validation manifest
+without revalidating it.
+"""
+
+PID_CHECK_ASYNC_TASKS = getattr(settings, "PID_CHECK_ASYNC_TASKS", False)
+""" bool: check the existence and ownership of the local ids saved by the
+module in Celery tasks, polled by the module, instead of in the request.
+Requires a Celery result backend.
+"""
+
+PID_OWNERSHIP_INDEX = getattr(settings, "PID_OWNERSHIP_INDEX", False)
+""" bool: keep an in-memory index of the data holding each PID, built once in
+the background and kept current by the data saved and deleted in the process.
+Ownership is still confirmed by reading the data edited, and the index entries
+found outdated are corrected.
+"""
+
+PID_OWNERSHIP_INDEX_TTL = getattr(settings, "PID_OWNERSHIP_INDEX_TTL", 0)
+""" int: time, in seconds, after which the PID ownership index is built again,
+to catch up with the data saved by other processes. Each build scans all the
+data, in each process. Set to 0 to never build it again.
+"""
@@ -1,23 +1,422 @@
 const moduleLocalIdClass = ".mod-local-id";
+const moduleLocalIdSaveDelay = 300;  // Delay (ms) used to coalesce edits.
+const moduleLocalIdSearchDelay = 200;  // Delay (ms) used to coalesce searches.
+const moduleLocalIdPollDelay = 1000;  // Delay (ms) before the first check of a task.
+const moduleLocalIdPollMaxDelay = 8000;  // Delay (ms) between the last checks of a task.
+const moduleLocalIdPollMaxAttempts = 10;  // Checks of a task before giving up.
+const moduleLocalIdMessagePlaceholder = "__LOCAL_ID_STATUS_BOX_MESSAGE__";
+const moduleLocalIdVerdictType = "application/vnd.local-id-verdict+json";
 
-// Send module data for saving
+// Retrieve the saving state attached to a module
+let getLocalIdModuleState = function($module) {
+    let moduleState = $module.data("localIdState");
+
+    if(moduleState === undefined) {
+        moduleState = {
+            "timer": null,
+            "xhr": null,
+            "pollTimer": null,
+            "lastSentData": null
+        };
+        $module.data("localIdState", moduleState);
+    }
+
+    return moduleState;
+};
+
+// Build the local ID from the host, prefix and value of the module
+let getLocalIdModuleData = function($module) {
+    return [
+        $module.find("div.pid-host-url").text(),
+        $module.find("select.pid-prefix").val(),
+        $module.find(".mod_input input").val()
+    ].join("/");
+};
+
+// Validation manifests loaded, by URL. A manifest being loaded is null.
+let localIdModuleManifests = {};
+
+// Load the manifest of the checks which can be done without the server
+let loadLocalIdModuleManifest = function(manifestURL) {
+    if(manifestURL === undefined || manifestURL in localIdModuleManifests) {
+        return;
+    }
+
+    localIdModuleManifests[manifestURL] = null;
+    $.ajax({
+        url: manifestURL,
+        type: "GET",
+        dataType: "json",
+        success: function(manifest) {
+            manifest.prefixSet = manifest.prefixes === null ? null : new Set(manifest.prefixes);
+            manifest.formatRegex = null;
+
+            if(manifest.format !== null) {
+                try {
+                    manifest.formatRegex = new RegExp(manifest.format.source, manifest.format.flags);
+                } catch(error) {
+                    // Record names are then only checked by the server.
+                    console.warn("PID format cannot be checked by the browser");
+                }
+            }
+
+            localIdModuleManifests[manifestURL] = manifest;
+        },
+        error: function() {
+            // Allow the manifest to be loaded again.
+            delete localIdModuleManifests[manifestURL];
+            console.error("An error occurred when loading the validation manifest");
+        }
+    });
+};
+
+// Load the manifest of a module when it is first edited
+let prepareLocalIdModule = function() {
+    loadLocalIdModuleManifest($(this).closest(moduleLocalIdClass).data("manifestUrl"));
+};
+
+// Check local ID data as the server first does, returning false if it is
+// known to be invalid. Unknown checks are left to the server.
+let checkLocalIdModuleData = function($module, localIdData) {
+    let manifest = getLocalIdModuleManifest($module);
+
+    if(manifest === undefined) {
+        return true;
+    }
+
+    // Split the local ID as host/prefix/record.
+    let recordStart = localIdData.lastIndexOf("/");
+
+    if(recordStart < 0) {
+        return false;
+    }
+
+    let prefixStart = recordStart > 0 ? localIdData.lastIndexOf("/", recordStart - 1) : -1;
+    let hostURL = prefixStart < 0 ? "" : localIdData.slice(0, prefixStart);
+    let prefix = localIdData.slice(prefixStart + 1, recordStart);
+    let record = localIdData.slice(recordStart + 1).replace(/^ +| +$/g, "");
+
+    if(hostURL !== manifest.host_url) {
+        return false;
+    }
+
+    if(manifest.prefixSet !== null && !manifest.prefixSet.has(prefix)) {
+        return false;
+    }
+
+    // Character classes of the format may match more non-ASCII characters
+    // on the server.
+    if(manifest.formatRegex !== null && /^[\x00-\x7f]*$/.test(record)) {
+        return manifest.formatRegex.test(record);
+    }
+
+    return true;
+};
+
+// Return the manifest of a module, or undefined if it is not loaded
+let getLocalIdModuleManifest = function($module) {
+    let manifest = localIdModuleManifests[$module.find(moduleLocalIdClass).data("manifestUrl")];
+
+    return manifest === null ? undefined : manifest;
+};
+
+// Characters escaped by the server in the local ID of a status box
+const moduleLocalIdEscapes = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"};
+
+// Display the status box of a module state. The box of invalid local IDs
+// contains the placeholder in place of the local ID.
+let displayLocalIdModuleState = function($module, manifest, state, localIdData) {
+    let escapedData = String(localIdData).replace(/[&<>"']/g, function(char) {
+        return moduleLocalIdEscapes[char];
+    });
+
+    $module.find(".moduleDisplay").html(
+        manifest.status_boxes[state].split(moduleLocalIdMessagePlaceholder).join(escapedData)
+    );
+};
+
+// Abort the request in flight and stop polling the checks of a saved value
+let abortLocalIdModuleRequests = function(moduleState) {
+    if(moduleState.xhr !== null) {
+        moduleState.xhr.abort();
+    }
+
+    clearTimeout(moduleState.pollTimer);
+    moduleState.pollTimer = null;
+};
+
+// Give up on the checks left to a task, which may have been lost: display
+// the failure box and allow the same value to be sent again
+let abandonLocalIdModuleCheck = function($module) {
+    let manifest = getLocalIdModuleManifest($module);
+
+    getLocalIdModuleState($module).lastSentData = null;
+
+    if(manifest !== undefined) {
+        displayLocalIdModuleState($module, manifest, "failure", "");
+    } else {
+        $module.find(".moduleDisplay").text("The record availability could not be checked.");
+    }
+};
+
+// Poll the outcome of the checks left to a task, with an increasing delay,
+// until they are done, a newer value is sent or the attempts are exhausted
+let pollLocalIdModuleCheck = function($module, taskId, attempt) {
+    let moduleState = getLocalIdModuleState($module);
+
+    attempt = attempt || 0;
+
+    if(attempt >= moduleLocalIdPollMaxAttempts) {
+        abandonLocalIdModuleCheck($module);
+        return;
+    }
+
+    moduleState.pollTimer = setTimeout(function() {
+        moduleState.pollTimer = null;
+        moduleState.xhr = $.ajax({
+            url: $module.find(moduleLocalIdClass).data("checkUrl"),
+            type: "GET",
+            dataType: "json",
+            data: {"task_id": taskId},
+            success: function(data) {
+                if(data.state === "checking") {
+                    pollLocalIdModuleCheck($module, taskId, attempt + 1);
+                    return;
+                }
+
+                $module.find(".moduleDisplay").html(data.html);
+            },
+            error: function(jqXHR, textStatus) {
+                if(textStatus === "abort") {
+                    return;
+                }
+
+                abandonLocalIdModuleCheck($module);
+                console.error("An error occurred when checking module data");
+            },
+            complete: function(jqXHR) {
+                if(moduleState.xhr === jqXHR) {
+                    moduleState.xhr = null;
+                }
+            }
+        });
+    }, Math.min(moduleLocalIdPollDelay * Math.pow(2, attempt), moduleLocalIdPollMaxDelay));
+};
+
+// Display the status box of an invalid local ID without calling the server
+let rejectLocalIdModuleData = function($module, localIdData) {
+    let moduleState = getLocalIdModuleState($module);
+
+    abortLocalIdModuleRequests(moduleState);
+
+    // Allow any later value to be sent.
+    moduleState.lastSentData = null;
+    displayLocalIdModuleState($module, getLocalIdModuleManifest($module), "invalid", localIdData);
+};
+
+// Apply the verdict of the server: display the status box of the state and
+// the local ID as retained by the server
+let applyLocalIdModuleVerdict = function($module, manifest, localIdData, verdict) {
+    let moduleState = getLocalIdModuleState($module);
+
+    if(verdict.prefix !== null && verdict.value !== null && verdict.state !== "invalid") {
+        $module.find("select.pid-prefix").val(verdict.prefix);
+        $module.find(".mod_input input").val(verdict.value);
+        moduleState.lastSentData = getLocalIdModuleData($module);
+    }
+
+    displayLocalIdModuleState($module, manifest, verdict.state, localIdData);
+};
+
+// Send module data for saving, superseding any request in flight. A
+// synchronous save is done before the next event is handled.
+let sendLocalIdModuleData = function($module, localIdData, synchronous) {
+    let moduleState = getLocalIdModuleState($module);
+    let moduleURL = $module.find(".moduleURL").text();
+
+    if(moduleURL === "") {
+        console.error("moduleURL is not defined");
+        return;
+    }
+
+    abortLocalIdModuleRequests(moduleState);
+
+    // With the status boxes of the manifest, the verdict of the server is
+    // enough to update the module.
+    let manifest = getLocalIdModuleManifest($module);
+
+    moduleState.lastSentData = localIdData;
+    moduleState.xhr = $.ajax({
+        url: "/" + moduleURL,
+        type: "POST",
+        dataType: "json",
+        async: !synchronous,
+        headers: manifest === undefined ? {} : {"Accept": moduleLocalIdVerdictType},
+        data: {
+            "data": localIdData,
+            "module_id": $module.attr("id")
+        },
+        success: function(data) {
+            if(data.state !== undefined) {
+                applyLocalIdModuleVerdict($module, manifest, localIdData, data);
+            } else {
+                let $html = $(data.html);
+
+                $module.find(".moduleDisplay").html($html.find(".moduleDisplay").html());
+                $module.find(".moduleResult").html($html.find(".moduleResult").html());
+            }
+
+            if(data.task_id !== undefined) {
+                pollLocalIdModuleCheck($module, data.task_id);
+            }
+        },
+        error: function(jqXHR, textStatus) {
+            if(textStatus === "abort") {
+                return;
+            }
+
+            // Allow the same value to be sent again.
+            moduleState.lastSentData = null;
+            console.error("An error occurred when saving module data");
+        },
+        complete: function(jqXHR) {
+            if(moduleState.xhr === jqXHR) {
+                moduleState.xhr = null;
+            }
+        }
+    });
+};
+
+// Save the current module data, skipping unchanged values unless a save is
+// pending
+let saveLocalIdModuleState = function($module, synchronous) {
+    let moduleState = getLocalIdModuleState($module);
+    let localIdData = getLocalIdModuleData($module);
+
+    if(localIdData === moduleState.lastSentData && !(synchronous && moduleState.xhr !== null)) {
+        return;
+    }
+
+    if(checkLocalIdModuleData($module, localIdData)) {
+        sendLocalIdModuleData($module, localIdData, synchronous);
+    } else {
+        rejectLocalIdModuleData($module, localIdData);
+    }
+};
+
+// Save module data once edits have settled
 let saveLocalIdModuleData = function(event) {
     event.stopPropagation();
 
     let $module = $(this).parents(".module");
-    let moduleLocalIdData = {
-        "data": [
-            $module.find("div.pid-host-url").text(),
-            $module.find("select.pid-prefix").val(),
-            $module.find(".mod_input input").val()
-        ].join("/")
-    };
+    let moduleState = getLocalIdModuleState($module);
+
+    clearTimeout(moduleState.timer);
+    moduleState.timer = setTimeout(function() {
+        moduleState.timer = null;
+        saveLocalIdModuleState($module, false);
+    }, moduleLocalIdSaveDelay);
+};
+
+// Save module data synchronously when the module loses focus. Blur is
+// handled before the click which caused it, so that the form actions (save,
+// validate, download) read the saved data.
+let flushLocalIdModuleData = function(event) {
+    event.stopPropagation();
+
+    let $module = $(this).parents(".module");
+    let moduleState = getLocalIdModuleState($module);
+
+    clearTimeout(moduleState.timer);
+    moduleState.timer = null;
+    saveLocalIdModuleState($module, true);
+};
+// Replace the prefix options with the prefixes matching a query, keeping the
+// selected prefix
+let loadLocalIdModulePrefixes = function($select, query) {
+    let searchState = $select.data("prefixSearchState");
+
+    if(searchState === undefined) {
+        searchState = {"xhr": null, "lastQuery": null};
+        $select.data("prefixSearchState", searchState);
+    }
+
+    if(query === searchState.lastQuery) {
+        return;
+    }
+
+    if(searchState.xhr !== null) {
+        searchState.xhr.abort();
+    }
+
+    searchState.lastQuery = query;
+    searchState.xhr = $.ajax({
+        url: $select.data("prefixSearchUrl"),
+        type: "GET",
+        dataType: "json",
+        data: {"q": query},
+        success: function(data) {
+            let selectedPrefix = $select.val();
+            let prefixes = data.results.filter(function(prefix) {
+                return prefix !== selectedPrefix;
+            });
 
-    saveModuleData($module, moduleLocalIdData);
+            $select.empty().append($("<option>").text(selectedPrefix).prop("selected", true));
+            prefixes.forEach(function(prefix) {
+                $select.append($("<option>").text(prefix));
+            });
+
+            if(data.has_more) {
+                $select.append(
+                    $("<option>").text("Refine the search to see more prefixes").prop("disabled", true)
+                );
+            }
+        },
+        error: function(jqXHR, textStatus) {
+            if(textStatus === "abort") {
+                return;
+            }
+
+            // Allow the same query to be sent again.
+            searchState.lastQuery = null;
+            console.error("An error occurred when searching prefixes");
+        },
+        complete: function(jqXHR) {
+            if(searchState.xhr === jqXHR) {
+                searchState.xhr = null;
+            }
+        }
+    });
+};
+
+// Load the first prefixes when a lazily filled list is opened
+let openLocalIdModulePrefixes = function() {
+    let $select = $(this);
+
+    if($select.data("prefixSearchState") === undefined) {
+        loadLocalIdModulePrefixes($select, "");
+    }
 };
+
+// Search the prefixes once typing has settled
+let searchLocalIdModulePrefixes = function(event) {
+    event.stopPropagation();
+
+    let $search = $(this);
+    let $select = $search.siblings("select.pid-prefix");
+
+    clearTimeout($search.data("prefixSearchTimer"));
+    $search.data("prefixSearchTimer", setTimeout(function() {
+        loadLocalIdModulePrefixes($select, $search.val());
+    }, moduleLocalIdSearchDelay));
+};
+
 $(document).ready(function() {
     // Register events on module widgets once the page is loaded.
     let $body = $("body");
-    $body.on("blur", moduleLocalIdClass + " input[type='text']", saveLocalIdModuleData);
+    $body.on("focusin", moduleLocalIdClass + "[data-manifest-url]", prepareLocalIdModule);
+    $body.on("blur", moduleLocalIdClass + " input[type='text'], " + moduleLocalIdClass + " select", flushLocalIdModuleData);
     $body.on("change", moduleLocalIdClass + " select", saveLocalIdModuleData);
+    $body.on("focus", moduleLocalIdClass + " select[data-prefix-search-url]", openLocalIdModulePrefixes);
+    $body.on("input", moduleLocalIdClass + " input.pid-prefix-search", searchLocalIdModulePrefixes);
 });
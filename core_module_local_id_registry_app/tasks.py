@@ -0,0 +1,35 @@
+"""Local id registry tasks"""
+
+from celery import shared_task
+
+
+@shared_task
+def check_local_id_task(data, data_id):
+    """Check that the record of a local id is available, as the module does
+    for a save.
+
+    Args:
+        data: str - Local id.
+        data_id: Primary key of the data being edited, if saved.
+
+    Returns:
+        dict - Verdict of the local id, as returned to the module saves, with
+        its status box `html`.
+    """
+    # The views enqueue the task: they are loaded once the task is run.
+    from core_module_local_id_registry_app.views.request_state import (
+        RequestState,
+    )
+    from core_module_local_id_registry_app.views.views import (
+        LocalIdRegistryModule,
+    )
+
+    module = LocalIdRegistryModule.get_shared_instance()
+    request_state = RequestState()
+    module._check_local_id(data, data_id, request_state)
+    verdict = module._get_verdict(request_state)
+    verdict["html"] = module._render_status_box(
+        verdict["state"], request_state.error_data
+    )
+
+    return verdict
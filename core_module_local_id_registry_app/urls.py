@@ -1,13 +1,51 @@
 """Url router for the local id registry module"""
 
-from django.urls import re_path
+from django.urls import include, re_path
 
-from core_module_local_id_registry_app.views.views import LocalIdRegistryModule
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.views.views import (
+    AsyncLocalIdRegistryModule,
+    LocalIdRegistryModule,
+    get_local_id_check,
+    get_validation_manifest,
+    search_prefixes,
+    validate_local_ids,
+)
+
+# Views which are not modules are nested, to be skipped by the discovery of
+# modules.
+api_urlpatterns = [
+    re_path(
+        r"batch",
+        validate_local_ids,
+        name="core_module_local_id_registry_batch",
+    ),
+    re_path(
+        r"prefixes",
+        search_prefixes,
+        name="core_module_local_id_registry_prefixes",
+    ),
+    re_path(
+        r"manifest",
+        get_validation_manifest,
+        name="core_module_local_id_registry_manifest",
+    ),
+    re_path(
+        r"check",
+        get_local_id_check,
+        name="core_module_local_id_registry_check",
+    ),
+]
 
 urlpatterns = [
+    re_path(r"module-local-id-registry/", include(api_urlpatterns)),
     re_path(
         r"module-local-id-registry",
-        LocalIdRegistryModule.as_view(),
+        (
+            AsyncLocalIdRegistryModule.as_view()
+            if settings.ASYNC_MODULE_VIEW
+            else LocalIdRegistryModule.as_view()
+        ),
         name="core_module_local_id_registry_view",
     ),
 ]
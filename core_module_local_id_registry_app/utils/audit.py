@@ -0,0 +1,158 @@
+"""Audit utilities for the local id registry module
+
+Workers of the process pool import this module in a new interpreter: it must
+not depend on Django being set up.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from core_module_local_id_registry_app.utils.validators import (
+    PidValidator,
+    PidVerdict,
+)
+
+# Validator of the worker process, built once by `init_audit_worker`.
+_worker_validator = None
+
+
+def audit_pids(pid_validator, records):
+    """Validate stored PIDs with the rules applied by the module.
+
+    Args:
+        pid_validator: PidValidator
+        records: list - Primary key of each data and its stored PID.
+
+    Returns:
+        tuple - Violations, as dicts with the data primary key, the PID and
+        the verdict, and number of data without PID.
+    """
+    violations = list()
+    missing = 0
+
+    for data_id, pid in records:
+        if pid is None:
+            missing += 1
+            continue
+
+        verdict = (
+            pid_validator.validate(pid)[3]
+            if isinstance(pid, str)
+            else PidVerdict.INVALID_STRUCTURE
+        )
+
+        if verdict != PidVerdict.VALID:
+            violations.append(
+                {"data_id": data_id, "pid": pid, "verdict": verdict}
+            )
+
+    return violations, missing
+
+
+def init_audit_worker(pid_format, prefixes, host_url):
+    """Build the validator of a worker process.
+
+    Args:
+        pid_format: str - Value of `PID_FORMAT`.
+        prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        host_url: str - Lookup URL of the provider.
+    """
+    global _worker_validator
+
+    _worker_validator = PidValidator(pid_format, prefixes, host_url)
+
+
+def audit_worker_pids(records):
+    """Validate stored PIDs with the validator of the worker process.
+
+    Args:
+        records: list - Primary key of each data and its stored PID.
+
+    Returns:
+        tuple - Violations and number of data without PID.
+    """
+    return audit_pids(_worker_validator, records)
+
+
+def _iter_chunks(records, chunk_size):
+    """Split the records in lists of `chunk_size` records.
+
+    Args:
+        records: iterable
+        chunk_size: int
+
+    Yields:
+        list
+    """
+    records = iter(records)
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def audit_stored_pids(
+    records, pid_format, prefixes, host_url, chunk_size=1000, workers=1
+):
+    """Validate stored PIDs by chunks, over a pool of processes.
+
+    Results are yielded in the order of the records, so that all the records
+    up to the last primary key of a chunk have been audited when it is
+    yielded. At most two chunks per worker are in flight.
+
+    Args:
+        records: iterable - Primary key of each data and its stored PID,
+            sorted by primary key.
+        pid_format: str - Value of `PID_FORMAT`.
+        prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        host_url: str - Lookup URL of the provider.
+        chunk_size: int - Number of records validated by a task.
+        workers: int - Number of processes. Records are validated in the
+            current process if lower than 2.
+
+    Yields:
+        tuple - Last primary key of the chunk, number of records, violations
+        and number of data without PID.
+    """
+    validator_args = (pid_format, tuple(prefixes), host_url)
+
+    if workers < 2:
+        pid_validator = PidValidator(*validator_args)
+
+        for chunk in _iter_chunks(records, chunk_size):
+            yield (chunk[-1][0], len(chunk), *audit_pids(pid_validator, chunk))
+
+        return
+
+    # Workers are spawned rather than forked, so that they do not share the
+    # database connection of the current process.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_audit_worker,
+        initargs=validator_args,
+    ) as executor:
+        pending = deque()
+
+        for chunk in _iter_chunks(records, chunk_size):
+            pending.append(
+                (
+                    chunk[-1][0],
+                    len(chunk),
+                    executor.submit(audit_worker_pids, chunk),
+                )
+            )
+
+            if len(pending) >= 2 * workers:
+                last_data_id, count, future = pending.popleft()
+                yield (last_data_id, count, *future.result())
+
+        while pending:
+            last_data_id, count, future = pending.popleft()
+            yield (last_data_id, count, *future.result())
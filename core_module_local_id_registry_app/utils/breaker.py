@@ -0,0 +1,94 @@
+"""Circuit breaker utilities for the local id registry module"""
+
+from threading import Lock
+from time import monotonic
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker guarding calls to an unreliable service.
+
+    The circuit opens after `failure_threshold` consecutive failures, and
+    calls are then skipped. Once `recovery_timeout` seconds have elapsed, a
+    single call is allowed to probe the service: the circuit closes if it
+    succeeds and opens again if it fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold, recovery_timeout):
+        """Initialize the breaker
+
+        Args:
+            failure_threshold: int - Number of consecutive failures opening
+                the circuit. A value lower or equal to 0 disables the
+                breaker.
+            recovery_timeout: float - Time, in seconds, before probing the
+                service again.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = None
+
+    @property
+    def state(self):
+        """Current state of the circuit"""
+        return self._state
+
+    def allow(self):
+        """Determine if a call to the service can be made.
+
+        Returns:
+            bool
+        """
+        if self._state == self.CLOSED:
+            return True
+
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and monotonic() - self._opened_at >= self.recovery_timeout
+            ):
+                # Only the caller switching to half-open probes the service.
+                self._state = self.HALF_OPEN
+                return True
+
+            return self._state == self.CLOSED
+
+    def record_success(self):
+        """Record a successful call, closing the circuit"""
+        if self._state == self.CLOSED and self._failures == 0:
+            return
+
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit once the threshold is
+        reached.
+        """
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            self._failures += 1
+
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = monotonic()
+
+    def clear(self):
+        """Close the circuit and forget the failures"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = None
@@ -0,0 +1,183 @@
+"""Cache utilities for the local id registry module"""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from weakref import WeakKeyDictionary
+
+from django.core.cache import caches
+
+
+class TTLCache:
+    """Thread-safe, size-bounded cache whose entries expire after a given
+    number of seconds.
+    """
+
+    def __init__(self, ttl, max_size=1024):
+        """Initialize the cache
+
+        Args:
+            ttl: int - Lifetime of an entry, in seconds. A value lower or
+                equal to 0 disables the cache.
+            max_size: int - Maximum number of entries kept in the cache.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """Return the value stored for the key if it has not expired.
+
+        Args:
+            key:
+            default:
+
+        Returns:
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            if entry[0] < monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        """Store a value for the key, evicting the least recently used entry if
+        the cache is full.
+
+        Args:
+            key:
+            value:
+        """
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Remove the key from the cache.
+
+        Args:
+            key:
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SharedTTLCache:
+    """Cache whose entries expire after a given number of seconds, stored in
+    the process or, when an alias is given, in a Django cache shared between
+    workers.
+
+    Entries stored in the process are only removed by the process itself:
+    a cache shared between workers lets each of them see the removals made by
+    the others.
+    """
+
+    key_prefix = "core_module_local_id_registry_app:"
+
+    def __init__(self, ttl, cache_alias=None):
+        """Initialize the cache
+
+        Args:
+            ttl: int - Lifetime of an entry, in seconds. A value lower or
+                equal to 0 disables the cache.
+            cache_alias: str - Alias of the Django cache to use.
+        """
+        self.ttl = ttl
+        self.cache_alias = cache_alias
+        self._local_cache = TTLCache(ttl) if cache_alias is None else None
+
+    def _get_key(self, key):
+        return self.key_prefix + str(key)
+
+    def get(self, key):
+        """Return the value stored for the key.
+
+        Args:
+            key:
+
+        Returns:
+            Value stored, or `None` if not cached.
+        """
+        if self._local_cache is not None:
+            return self._local_cache.get(key)
+
+        return caches[self.cache_alias].get(self._get_key(key))
+
+    def set(self, key, value):
+        """Store a value for the key.
+
+        Args:
+            key:
+            value:
+        """
+        if self.ttl <= 0:
+            return
+
+        if self._local_cache is not None:
+            self._local_cache.set(key, value)
+        else:
+            caches[self.cache_alias].set(self._get_key(key), value, self.ttl)
+
+    def delete(self, key):
+        """Remove the value stored for the key.
+
+        Args:
+            key:
+        """
+        if self._local_cache is not None:
+            self._local_cache.delete(key)
+        else:
+            caches[self.cache_alias].delete(self._get_key(key))
+
+    def clear(self):
+        """Remove all the entries stored in the process. Entries stored in a
+        Django cache expire on their own.
+        """
+        if self._local_cache is not None:
+            self._local_cache.clear()
+
+
+_request_caches = WeakKeyDictionary()
+_request_caches_lock = Lock()
+
+
+def get_request_cache(request):
+    """Return a dictionary living as long as the request, used to memoize
+    values computed while processing it.
+
+    Args:
+        request:
+
+    Returns:
+        dict
+    """
+    with _request_caches_lock:
+        request_cache = _request_caches.get(request)
+
+        if request_cache is None:
+            request_cache = dict()
+            _request_caches[request] = request_cache
+
+    return request_cache
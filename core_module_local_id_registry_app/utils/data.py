@@ -0,0 +1,164 @@
+"""Data utilities for the local id registry module"""
+
+from django.conf import settings as conf_settings
+
+from core_main_app.components.data.models import Data
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.utils.cache import SharedTTLCache
+
+
+class PidValueCache(SharedTTLCache):
+    """Cache of the PID value read from each data.
+
+    Values are stored in the process or, when an alias is given, in a Django
+    cache shared between workers.
+    """
+
+    key_prefix = "core_module_local_id_registry_app:pid_value:"
+
+
+pid_value_cache = PidValueCache(
+    settings.PID_VALUE_CACHE_TTL, settings.PID_VALUE_CACHE_ALIAS
+)
+
+
+def _get_document_pid_value(document, pid_path):
+    """Read the value located at `pid_path` from a projected Mongo document.
+
+    Args:
+        document: dict - Document, projected on `pid_path`.
+        pid_path: str - Dot notation path to the PID.
+
+    Returns:
+        Value at `pid_path`, or `None` if the path does not exist.
+    """
+    value = document.get("dict_content") if document else None
+
+    for key in pid_path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+
+    return value
+
+
+def _query_pid_value(data_id, pid_path):
+    """Project the value located at `pid_path` from the stored dict content of
+    a data, without loading the rest of the document.
+
+    Args:
+        data_id:
+        pid_path: str - Dot notation path to the PID.
+
+    Returns:
+        Value at `pid_path`, or `None` if the data or the path does not exist.
+    """
+    if conf_settings.MONGODB_INDEXING:
+        from core_main_app.components.mongo.models import MongoData
+
+        document = MongoData._get_collection().find_one(
+            {"_id": data_id}, {f"dict_content.{pid_path}": 1}
+        )
+        return _get_document_pid_value(document, pid_path)
+
+    return (
+        Data.objects.filter(pk=data_id)
+        .values_list(f"dict_content__{pid_path.replace('.', '__')}", flat=True)
+        .first()
+    )
+
+
+def iter_pid_values(pid_path, start_after=None, chunk_size=1000):
+    """Stream the value located at `pid_path` in each data, in primary key
+    order. Values are read through a server-side cursor, so that the data are
+    never loaded all at once.
+
+    Args:
+        pid_path: str - Dot notation path to the PID.
+        start_after: Primary key after which to start, if set.
+        chunk_size: int - Number of data fetched from the cursor at once.
+
+    Yields:
+        tuple - Primary key of the data and value at `pid_path`, `None` if
+        the path does not exist.
+    """
+    if conf_settings.MONGODB_INDEXING:
+        from core_main_app.components.mongo.models import MongoData
+
+        cursor = (
+            MongoData._get_collection()
+            .find(
+                {} if start_after is None else {"_id": {"$gt": start_after}},
+                {f"dict_content.{pid_path}": 1},
+            )
+            .sort("_id", 1)
+            .batch_size(chunk_size)
+        )
+
+        for document in cursor:
+            yield document["_id"], _get_document_pid_value(document, pid_path)
+
+        return
+
+    queryset = Data.objects.order_by("pk")
+
+    if start_after is not None:
+        queryset = queryset.filter(pk__gt=start_after)
+
+    yield from queryset.values_list(
+        "pk", f"dict_content__{pid_path.replace('.', '__')}"
+    ).iterator(chunk_size=chunk_size)
+
+
+def get_pid_value_for_data_id(data_id, pid_path, use_cache=True):
+    """Return the value located at `pid_path` in a data. Values are cached for
+    each data and invalidated when the data is saved or deleted.
+
+    Args:
+        data_id:
+        pid_path: str - Dot notation path to the PID.
+        use_cache: bool - Read and cache the value through the cache, or
+            read the stored value only.
+
+    Returns:
+        Value at `pid_path`, or `None` if the data or the path does not exist.
+    """
+    if not use_cache:
+        return _query_pid_value(data_id, pid_path)
+
+    cached_entry = pid_value_cache.get(data_id)
+
+    if cached_entry is not None and cached_entry[0] == pid_path:
+        return cached_entry[1]
+
+    pid_value = _query_pid_value(data_id, pid_path)
+    pid_value_cache.set(data_id, (pid_path, pid_value))
+
+    return pid_value
+
+
+def get_cached_pid_value_for_data_id(data_id, pid_path):
+    """Return the value located at `pid_path` in a data if it is cached.
+
+    Args:
+        data_id:
+        pid_path: str - Dot notation path to the PID.
+
+    Returns:
+        Cached value at `pid_path`, or `None` if it is not cached.
+    """
+    cached_entry = pid_value_cache.get(data_id)
+
+    if cached_entry is not None and cached_entry[0] == pid_path:
+        return cached_entry[1]
+
+    return None
+
+
+def clear_pid_value_for_data_id(data_id):
+    """Remove the cached PID values of a data.
+
+    Args:
+        data_id:
+    """
+    pid_value_cache.delete(data_id)
@@ -0,0 +1,115 @@
+"""Data structure utilities for the local id registry module"""
+
+from core_curate_app.components.curate_data_structure import (
+    api as curate_data_structure_api,
+)
+from core_main_app.commons.exceptions import DoesNotExist
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.utils.cache import (
+    SharedTTLCache,
+    get_request_cache,
+)
+from core_parser_app.components.data_structure_element import (
+    api as data_structure_element_api,
+)
+
+
+class CurateDataStructureIdCache(SharedTTLCache):
+    """Cache of the curate data structure id of each module and user.
+
+    Ids are stored in the process or, when an alias is given, in a Django
+    cache shared between workers.
+    """
+
+    key_prefix = "core_module_local_id_registry_app:curate_data_structure_id:"
+
+    def _get_key(self, key):
+        return self.key_prefix + ":".join(key)
+
+
+curate_data_structure_id_cache = CurateDataStructureIdCache(
+    settings.DATA_STRUCTURE_CACHE_TTL, settings.DATA_STRUCTURE_CACHE_ALIAS
+)
+
+
+def get_curate_data_structure_by_id(curate_data_structure_id, request):
+    """Return the curate data structure with the given id, fetched and access
+    checked once per request.
+
+    The request cache acts as an identity map: every stage processing the
+    request shares the same authorized object.
+
+    Args:
+        curate_data_structure_id:
+        request:
+
+    Returns:
+        CurateDataStructure
+    """
+    key = ("curate_data_structure", str(curate_data_structure_id))
+    request_cache = get_request_cache(request)
+
+    if key not in request_cache:
+        request_cache[key] = curate_data_structure_api.get_by_id(
+            curate_data_structure_id, request.user
+        )
+
+    return request_cache[key]
+
+
+def get_curate_data_structure_from_module_id(
+    module_id, request, module_element=None
+):
+    """Return the curate data structure containing the given module.
+
+    The module element belongs to the data structure of the form, which is
+    the curate data structure itself: it is retrieved with a single lookup on
+    its primary key instead of walking up to the root element. Results are
+    memoized for the request and the curate data structure id is cached for
+    the user, so repeated edits in a form skip the element lookup entirely.
+
+    Args:
+        module_id:
+        request:
+        module_element: DataStructureElement - Element of the module, already
+            retrieved and access checked by the request, if any.
+
+    Returns:
+        CurateDataStructure
+    """
+    key = (str(module_id), str(request.user.id))
+    request_cache = get_request_cache(request)
+
+    if key in request_cache:
+        return request_cache[key]
+
+    curate_data_structure = None
+
+    if module_element is not None:
+        curate_data_structure = get_curate_data_structure_by_id(
+            module_element.data_structure_id, request
+        )
+    else:
+        curate_data_structure_id = curate_data_structure_id_cache.get(key)
+
+        if curate_data_structure_id is not None:
+            try:
+                curate_data_structure = get_curate_data_structure_by_id(
+                    curate_data_structure_id, request
+                )
+            except DoesNotExist:
+                curate_data_structure_id_cache.delete(key)
+
+    if curate_data_structure is None:
+        # Access control for the module is checked while retrieving the
+        # element.
+        module_element = data_structure_element_api.get_by_id(
+            module_id, request
+        )
+        curate_data_structure = get_curate_data_structure_by_id(
+            module_element.data_structure_id, request
+        )
+
+    curate_data_structure_id_cache.set(key, curate_data_structure.pk)
+    request_cache[key] = curate_data_structure
+    return curate_data_structure
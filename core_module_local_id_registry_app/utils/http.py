@@ -0,0 +1,84 @@
+"""HTTP utilities for the local id registry module"""
+
+import os
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core_module_local_id_registry_app import settings
+
+
+def build_session(max_connections, retries):
+    """Build a session keeping connections alive between requests.
+
+    Each host gets a pool of at most `max_connections` connections. Threads
+    wait for a free connection rather than opening more.
+
+    Args:
+        max_connections: int - Maximum number of connections to each host.
+        retries: int - Number of retries of failed connections.
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max_connections,
+        pool_maxsize=max_connections,
+        pool_block=True,
+        max_retries=retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+_session = None
+_session_lock = Lock()
+
+
+def get_session():
+    """Return the session shared by the threads of the process, built on
+    first use from `REMOTE_PID_CHECK_MAX_CONNECTIONS` and
+    `REMOTE_PID_CHECK_RETRIES`.
+
+    Returns:
+        requests.Session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session(
+                    settings.REMOTE_PID_CHECK_MAX_CONNECTIONS,
+                    settings.REMOTE_PID_CHECK_RETRIES,
+                )
+
+    return _session
+
+
+def reset_session():
+    """Close the shared session, to build it again on next use"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+
+        _session = None
+
+
+def _forget_session():
+    """Drop the session inherited by a forked process without closing it, as
+    its connections are still used by the parent process.
+    """
+    global _session, _session_lock
+
+    _session = None
+    _session_lock = Lock()
+
+
+os.register_at_fork(after_in_child=_forget_session)
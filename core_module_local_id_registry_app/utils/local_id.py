@@ -0,0 +1,425 @@
+"""Local id utilities for the local id registry module"""
+
+import os
+import random
+import string
+import time
+from collections import deque
+from threading import Lock
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+
+from core_main_app.components.data.models import Data
+from core_main_app.settings import MONGODB_INDEXING
+from core_main_registry_app.components.data.api import generate_unique_local_id
+from core_module_local_id_registry_app import settings
+
+LOCAL_ID_CHARACTERS = string.ascii_uppercase + string.digits
+
+# Same characters, in ASCII order, so that encoded numbers sort as strings.
+SORTABLE_LOCAL_ID_CHARACTERS = "".join(sorted(LOCAL_ID_CHARACTERS))
+SORTABLE_LOCAL_ID_EPOCH_MS = 1577836800000  # 2020-01-01T00:00:00Z
+SORTABLE_LOCAL_ID_TIME_BITS = 42  # Milliseconds until 2159.
+
+
+def get_used_local_ids(local_id_list):
+    """Return the local ids, among the ones given, already used by a data.
+
+    Args:
+        local_id_list: list - Local ids to check, in a single query.
+
+    Returns:
+        set - Local ids already used.
+    """
+    if MONGODB_INDEXING:
+        from core_main_app.components.mongo.models import MongoData
+
+        query_result = MongoData.objects(
+            __raw__={"dict_content.Resource.@localid": {"$in": local_id_list}}
+        ).scalar("dict_content")
+
+        return {
+            dict_content["Resource"]["@localid"]
+            for dict_content in query_result
+        }
+
+    return set(
+        Data.objects.filter(
+            Q(**{"dict_content__Resource__@localid__in": local_id_list})
+        ).values_list("dict_content__Resource__@localid", flat=True)
+    )
+
+
+class LocalIdPool:
+    """Reservoir of pre-generated local ids, verified as unused.
+
+    The pool is refilled up to its high watermark, with a single existence
+    query, whenever it goes below its low watermark. Each local id is removed
+    from the pool when reserved, so it cannot be issued twice by the process.
+    """
+
+    def __init__(self, length, low_watermark, high_watermark):
+        """Initialize the pool
+
+        Args:
+            length: int - Length of the local ids.
+            low_watermark: int - Size under which the pool is refilled.
+            high_watermark: int - Size of the pool after a refill.
+        """
+        self.length = length
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self._lock = Lock()
+        self._local_ids = deque()
+
+    def _generate_local_id(self):
+        return "".join(
+            random.choice(LOCAL_ID_CHARACTERS) for _ in range(self.length)
+        )
+
+    def _refill(self):
+        """Fill the pool up to its high watermark. Must be called with the
+        lock held.
+        """
+        while len(self._local_ids) < self.high_watermark:
+            available_local_ids = set(self._local_ids)
+            candidate_list = list(
+                {
+                    self._generate_local_id()
+                    for _ in range(self.high_watermark - len(self._local_ids))
+                }
+                - available_local_ids
+            )
+            used_local_ids = get_used_local_ids(candidate_list)
+
+            self._local_ids.extend(
+                local_id
+                for local_id in candidate_list
+                if local_id not in used_local_ids
+            )
+
+    def reserve(self):
+        """Remove a local id from the pool and return it.
+
+        Returns:
+            str - Unused local id.
+        """
+        with self._lock:
+            if len(self._local_ids) <= self.low_watermark:
+                self._refill()
+
+            return self._local_ids.popleft()
+
+    def clear(self):
+        """Empty the pool"""
+        with self._lock:
+            self._local_ids.clear()
+
+    def __len__(self):
+        return len(self._local_ids)
+
+
+class SortableLocalIdGenerator:
+    """Generator of local ids unique by construction.
+
+    Each local id encodes, from the most significant bits, the time in
+    milliseconds, the node id and a per-process sequence, so that local ids
+    sort by creation time. Local ids of distinct nodes never collide, and no
+    query is needed.
+
+    The clock is never followed backwards: a late clock or an exhausted
+    sequence reuses the last time, or the following millisecond.
+    """
+
+    def __init__(self, length, node_id, node_bits, sequence_bits):
+        """Initialize the generator
+
+        Args:
+            length: int - Length of the local ids.
+            node_id: int - Id of the process, lower than `2 ** node_bits`.
+            node_bits: int - Number of bits of the node id.
+            sequence_bits: int - Number of bits of the sequence.
+
+        Raises:
+            ValueError: If the node id or the local ids do not fit.
+        """
+        total_bits = SORTABLE_LOCAL_ID_TIME_BITS + node_bits + sequence_bits
+
+        if len(SORTABLE_LOCAL_ID_CHARACTERS) ** length < 1 << total_bits:
+            raise ValueError(
+                "Local ids of %d characters cannot hold %d bits."
+                % (length, total_bits)
+            )
+
+        if not 0 <= node_id < 1 << node_bits:
+            raise ValueError(
+                "Node id should be between 0 and %d." % ((1 << node_bits) - 1)
+            )
+
+        self.length = length
+        self.node_id = node_id
+        self.sequence_bits = sequence_bits
+        self._node_part = node_id << sequence_bits
+        self._time_shift = node_bits + sequence_bits
+        self._sequence_mask = (1 << sequence_bits) - 1
+        self._lock = Lock()
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    @staticmethod
+    def _get_timestamp():
+        return time.time_ns() // 1000000 - SORTABLE_LOCAL_ID_EPOCH_MS
+
+    def _encode(self, number):
+        """Encode a number on the length of the local ids.
+
+        Args:
+            number: int
+
+        Returns:
+            str
+        """
+        base = len(SORTABLE_LOCAL_ID_CHARACTERS)
+        characters = list()
+
+        for _ in range(self.length):
+            number, index = divmod(number, base)
+            characters.append(SORTABLE_LOCAL_ID_CHARACTERS[index])
+
+        return "".join(reversed(characters))
+
+    def generate(self):
+        """Return a new local id.
+
+        Returns:
+            str
+        """
+        with self._lock:
+            timestamp = max(self._get_timestamp(), self._last_timestamp)
+
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & self._sequence_mask
+
+                if self._sequence == 0:
+                    timestamp += 1
+            else:
+                self._sequence = 0
+
+            self._last_timestamp = timestamp
+            sequence = self._sequence
+
+        return self._encode(
+            (timestamp << self._time_shift) | self._node_part | sequence
+        )
+
+
+class NodeIdLease:
+    """Node id of the process, leased in a Django cache shared between the
+    processes, so that no two processes generate sortable local ids with the
+    same node id.
+
+    The lease expires after `ttl` seconds unless renewed, so that the node
+    ids of stopped processes are eventually leased again.
+    """
+
+    key_prefix = "core_module_local_id_registry_app:local_id_node:"
+
+    def __init__(self, cache_alias, node_bits, ttl):
+        """Initialize the lease
+
+        Args:
+            cache_alias: str - Alias of the Django cache to use.
+            node_bits: int - Number of bits of the node id.
+            ttl: int - Lifetime of the lease, in seconds.
+        """
+        self.cache_alias = cache_alias
+        self.node_bits = node_bits
+        self.ttl = ttl
+        self.node_id = None
+        self._token = uuid4().hex
+        self._renew_at = None
+
+    def _get_key(self, node_id):
+        return self.key_prefix + str(node_id)
+
+    def acquire(self):
+        """Lease the first node id not leased by another process.
+
+        Returns:
+            int - Node id.
+
+        Raises:
+            ImproperlyConfigured: If all the node ids are leased.
+        """
+        cache = caches[self.cache_alias]
+
+        for node_id in range(1 << self.node_bits):
+            if cache.add(self._get_key(node_id), self._token, self.ttl):
+                self.node_id = node_id
+                self._renew_at = time.monotonic() + self.ttl / 2
+                return node_id
+
+        raise ImproperlyConfigured(
+            "All the %d local id node ids are leased: LOCAL_ID_NODE_BITS "
+            "should be increased." % (1 << self.node_bits)
+        )
+
+    def renew(self):
+        """Extend the lease once half of its lifetime has elapsed.
+
+        Returns:
+            bool - `False` if the lease has expired, the node id being then
+            free or leased by another process.
+        """
+        if time.monotonic() < self._renew_at:
+            return True
+
+        cache = caches[self.cache_alias]
+        key = self._get_key(self.node_id)
+
+        if cache.get(key) != self._token:
+            return False
+
+        cache.touch(key, self.ttl)
+        self._renew_at = time.monotonic() + self.ttl / 2
+
+        return True
+
+
+_node_id_lease = None
+_sortable_local_id_generators = dict()
+_sortable_local_id_generators_lock = Lock()
+
+
+def _forget_sortable_local_id_generators():
+    """Drop the generators and the node id lease inherited by a forked
+    process, so that it leases its own node id and does not continue the
+    sequence of the parent process.
+    """
+    global _node_id_lease
+
+    _node_id_lease = None
+    _sortable_local_id_generators.clear()
+
+
+os.register_at_fork(after_in_child=_forget_sortable_local_id_generators)
+
+
+def _get_node_id():
+    """Return the node id of the process, leased in
+    `LOCAL_ID_NODE_CACHE_ALIAS` if set, or `LOCAL_ID_NODE_ID`. The generators
+    are dropped when the lease is lost. Must be called with the lock held.
+
+    Returns:
+        int
+
+    Raises:
+        ImproperlyConfigured: If neither setting is set.
+    """
+    global _node_id_lease
+
+    if settings.LOCAL_ID_NODE_CACHE_ALIAS is None:
+        # Node ids drawn at random could collide between processes, which
+        # would then generate the same local ids in the same millisecond.
+        if settings.LOCAL_ID_NODE_ID is None:
+            raise ImproperlyConfigured(
+                "LOCAL_ID_NODE_CACHE_ALIAS or LOCAL_ID_NODE_ID must be set to "
+                'use the "sortable" LOCAL_ID_GENERATOR.'
+            )
+
+        return settings.LOCAL_ID_NODE_ID
+
+    if _node_id_lease is None or not _node_id_lease.renew():
+        _sortable_local_id_generators.clear()
+        _node_id_lease = NodeIdLease(
+            settings.LOCAL_ID_NODE_CACHE_ALIAS,
+            settings.LOCAL_ID_NODE_BITS,
+            settings.LOCAL_ID_NODE_LEASE_TTL,
+        )
+        _node_id_lease.acquire()
+
+    return _node_id_lease.node_id
+
+
+def get_sortable_local_id_generator(length):
+    """Return the generator of sortable local ids of the given length, built
+    from the node id of the process, `LOCAL_ID_NODE_BITS` and
+    `LOCAL_ID_SEQUENCE_BITS`.
+
+    Args:
+        length: int - Length of the local ids.
+
+    Returns:
+        SortableLocalIdGenerator
+
+    Raises:
+        ImproperlyConfigured: If the process has no node id.
+    """
+    with _sortable_local_id_generators_lock:
+        node_id = _get_node_id()
+        generator = _sortable_local_id_generators.get(length)
+
+        if generator is None:
+            generator = SortableLocalIdGenerator(
+                length,
+                node_id,
+                settings.LOCAL_ID_NODE_BITS,
+                settings.LOCAL_ID_SEQUENCE_BITS,
+            )
+            _sortable_local_id_generators[length] = generator
+
+    return generator
+
+
+_local_id_pools = dict()
+_local_id_pools_lock = Lock()
+
+
+def reserve_local_id(length):
+    """Return an unused local id of the given length, generated by the
+    `LOCAL_ID_GENERATOR` strategy. Random local ids are taken from the pool
+    of pre-generated local ids when it is enabled. Sortable local ids are
+    checked against the stored data unless the node id of the process is
+    leased.
+
+    Args:
+        length: int - Length of the local id.
+
+    Returns:
+        str - Unused local id.
+    """
+    if settings.LOCAL_ID_GENERATOR == "sortable":
+        generator = get_sortable_local_id_generator(length)
+        local_id = generator.generate()
+
+        # Processes given the same LOCAL_ID_NODE_ID, such as the workers
+        # forked by a server, may generate the same local ids.
+        while (
+            settings.LOCAL_ID_NODE_CACHE_ALIAS is None
+            and get_used_local_ids([local_id])
+        ):
+            local_id = generator.generate()
+
+        return local_id
+
+    if settings.LOCAL_ID_POOL_HIGH_WATERMARK <= 0:
+        return generate_unique_local_id(length)
+
+    with _local_id_pools_lock:
+        local_id_pool = _local_id_pools.get(length)
+
+        if local_id_pool is None:
+            local_id_pool = LocalIdPool(
+                length,
+                min(
+                    settings.LOCAL_ID_POOL_LOW_WATERMARK,
+                    settings.LOCAL_ID_POOL_HIGH_WATERMARK - 1,
+                ),
+                settings.LOCAL_ID_POOL_HIGH_WATERMARK,
+            )
+            _local_id_pools[length] = local_id_pool
+
+    return local_id_pool.reserve()
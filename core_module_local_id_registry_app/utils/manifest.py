@@ -0,0 +1,176 @@
+"""Validation manifest utilities for the local id registry module"""
+
+import hashlib
+import json
+import re
+from threading import Lock
+
+from core_module_local_id_registry_app import settings
+
+_GLOBAL_FLAGS_REGEX = re.compile(r"^\(\?([aiLmsux]+)\)")
+_GROUP_NAME_REGEX = re.compile(r"\(\?P=(\w+)\)")
+
+# Group extensions shared by Python and JavaScript.
+_JS_GROUP_EXTENSIONS = (":", "=", "!", "<=", "<!")
+
+
+def to_js_pattern(pid_format):
+    """Convert `PID_FORMAT` to an equivalent JavaScript regular expression.
+
+    Named groups and anchors are translated. Constructs without equivalent
+    (verbose or inline flags, atomic groups, possessive quantifiers,
+    conditionals, comments) prevent the conversion.
+
+    Args:
+        pid_format: str - Value of `PID_FORMAT`.
+
+    Returns:
+        tuple - Source and flags of the JavaScript expression, matching the
+        whole record name as `PidValidator`, or None if the format cannot be
+        converted.
+    """
+    flags = ""
+    flags_match = _GLOBAL_FLAGS_REGEX.match(pid_format)
+
+    if flags_match is not None:
+        if set(flags_match.group(1)) - set("imsu"):
+            return None
+
+        flags = "".join(sorted(set(flags_match.group(1)) & set("ims")))
+        flags_end = flags_match.end()
+        pid_format = pid_format[flags_end:]
+
+    parts = list()
+    index = 0
+    in_class = False
+
+    while index < len(pid_format):
+        char = pid_format[index]
+        next_char = (
+            pid_format[index + 1] if index + 1 < len(pid_format) else ""
+        )
+
+        if char == "\\":
+            escape = char + next_char
+            parts.append({"\\A": "^", "\\Z": "$"}.get(escape, escape))
+            index += 2
+            continue
+
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            # A leading "]" is literal in Python, and closes the class in
+            # JavaScript.
+            if pid_format.startswith(("[]", "[^]"), index):
+                return None
+
+            in_class = True
+        elif char == "(" and next_char == "?":
+            if pid_format.startswith("(?P<", index):
+                parts.append("(?<")
+                index += 4
+                continue
+
+            name_match = _GROUP_NAME_REGEX.match(pid_format, index)
+
+            if name_match is not None:
+                parts.append("\\k<%s>" % name_match.group(1))
+                index = name_match.end()
+                continue
+
+            if not pid_format.startswith(_JS_GROUP_EXTENSIONS, index + 2):
+                return None
+        elif char in "*+?}" and next_char == "+":
+            return None
+        elif char == "{" and next_char == ",":
+            parts.append("{0")
+            index += 1
+            continue
+
+        parts.append(char)
+        index += 1
+
+    return "^(%s|)$" % "".join(parts), flags
+
+
+def build_validation_manifest(pid_format, prefixes, host_url, status_boxes):
+    """Build the manifest of the checks done by `PidValidator`.
+
+    Prefixes are omitted above `PREFIX_SELECT_MAX_OPTIONS`, as the client
+    then only selects prefixes listed by the server.
+
+    Args:
+        pid_format: str - Value of `PID_FORMAT`.
+        prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        host_url: str - Lookup URL of the provider.
+        status_boxes: dict - Status box of each module state. The box of
+            invalid local ids contains `STATUS_BOX_MESSAGE_PLACEHOLDER` in
+            place of the local id.
+
+    Returns:
+        dict - Manifest, with its `version`.
+    """
+    prefixes = sorted(prefixes)
+    js_pattern = to_js_pattern(pid_format)
+    manifest = {
+        "host_url": host_url,
+        "prefixes": (
+            prefixes
+            if len(prefixes) <= settings.PREFIX_SELECT_MAX_OPTIONS
+            else None
+        ),
+        "format": (
+            {"source": js_pattern[0], "flags": js_pattern[1]}
+            if js_pattern is not None
+            else None
+        ),
+        "status_boxes": status_boxes,
+    }
+    manifest["version"] = hashlib.sha256(
+        json.dumps(manifest, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+    return manifest
+
+
+class ValidationManifestCache:
+    """Cache of the validation manifest, serialized once for each combination
+    of settings.
+    """
+
+    def __init__(self):
+        """Initialize the cache"""
+        self._lock = Lock()
+        self._entry = None
+
+    def get(self, pid_format, prefixes, host_url, status_boxes):
+        """Return the serialized manifest.
+
+        Args:
+            pid_format: str - Value of `PID_FORMAT`.
+            prefixes: frozenset - Value of `ID_PROVIDER_PREFIXES`.
+            host_url: str - Lookup URL of the provider.
+            status_boxes: dict - Status box of each module state.
+
+        Returns:
+            tuple - Version and JSON content of the manifest.
+        """
+        key = (pid_format, prefixes, host_url, status_boxes)
+        entry = self._entry
+
+        if entry is None or entry[0] != key:
+            manifest = build_validation_manifest(*key)
+            entry = key, manifest["version"], json.dumps(manifest)
+
+            with self._lock:
+                self._entry = entry
+
+        return entry[1], entry[2]
+
+    def clear(self):
+        """Remove the serialized manifest"""
+        with self._lock:
+            self._entry = None
+
+
+validation_manifest_cache = ValidationManifestCache()
@@ -0,0 +1,272 @@
+"""PID ownership utilities for the local id registry module"""
+
+import logging
+from threading import Lock, Thread
+from time import monotonic
+
+from django.db import connections
+
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.utils.data import iter_pid_values
+
+logger = logging.getLogger(__name__)
+
+
+class PidOwnershipIndex:
+    """Thread-safe index of the data holding each PID stored at `PID_PATH`.
+
+    The index is built in a single pass over the stored data, in a background
+    thread started on first use, then kept up to date with the data saved and
+    deleted by the process. With a positive `ttl`, it is built again once
+    `ttl` seconds have elapsed, to catch up with the data modified by other
+    processes.
+    """
+
+    def __init__(self, ttl):
+        """Initialize the index
+
+        Args:
+            ttl: int - Time, in seconds, after which the index is built
+                again. A value lower or equal to 0 disables the rebuilds.
+        """
+        self.ttl = ttl
+        self._lock = Lock()
+        self._build_lock = Lock()
+        self._pid_path = None
+        self._expires_at = None
+        self._owners = dict()
+        self._pids = dict()
+        # Updates received while the index is built, applied once it is.
+        self._pending = None
+
+    def _is_current(self, pid_path):
+        """Determine if the index is built for `pid_path` and has not expired.
+
+        Args:
+            pid_path: str - Dot notation path to the PID.
+
+        Returns:
+            bool
+        """
+        return self._pid_path == pid_path and monotonic() < self._expires_at
+
+    def _build_in_thread(self, pid_path):
+        """Build the index for `pid_path`, in the background thread started
+        by `get_owner`.
+
+        Args:
+            pid_path: str - Dot notation path to the PID.
+        """
+        try:
+            if not self._is_current(pid_path):
+                self.build(iter_pid_values(pid_path), pid_path)
+        except Exception as exc:
+            logger.warning(
+                "Unable to build the PID ownership index: %s", str(exc)
+            )
+        finally:
+            self._build_lock.release()
+            connections.close_all()
+
+    def _start_build(self, pid_path):
+        """Start building the index in a background thread, unless it is
+        already being built.
+
+        Args:
+            pid_path: str - Dot notation path to the PID.
+        """
+        if not self._build_lock.acquire(blocking=False):
+            return
+
+        try:
+            Thread(
+                target=self._build_in_thread,
+                args=(pid_path,),
+                name="pid_ownership_index",
+                daemon=True,
+            ).start()
+        except Exception:
+            self._build_lock.release()
+            raise
+
+    def build(self, records, pid_path):
+        """Replace the content of the index with the stored PIDs.
+
+        A PID held by several data is indexed for the first of them.
+
+        Args:
+            records: iterable - Primary key of each data and its stored PID,
+                sorted by primary key.
+            pid_path: str - Dot notation path to the PID.
+        """
+        with self._lock:
+            self._pending = list()
+
+        owners = dict()
+        pids = dict()
+
+        try:
+            for data_id, pid in records:
+                if not isinstance(pid, str):
+                    continue
+
+                pids[data_id] = pid
+                owners.setdefault(pid, data_id)
+        except Exception:
+            with self._lock:
+                self._pending = None
+
+            raise
+
+        with self._lock:
+            self._owners = owners
+            self._pids = pids
+
+            for data_id, pid in self._pending:
+                self._set(data_id, pid)
+
+            self._pending = None
+            self._pid_path = pid_path
+            self._expires_at = (
+                monotonic() + self.ttl if self.ttl > 0 else float("inf")
+            )
+
+    def get_owner(self, pid, pid_path):
+        """Return the data holding a PID.
+
+        The index is built in the background if it is not built for
+        `pid_path` or has expired, without waiting for it: an expired index is
+        used in the meantime.
+
+        Args:
+            pid: str
+            pid_path: str - Dot notation path to the PID.
+
+        Returns:
+            Primary key of the data, or `None` if the PID is not indexed or
+            the index is not built yet.
+        """
+        if not self._is_current(pid_path):
+            self._start_build(pid_path)
+
+        with self._lock:
+            if self._pid_path != pid_path:
+                return None
+
+            return self._owners.get(pid)
+
+    def _set(self, data_id, pid):
+        """Index the PID of a data, the lock being held.
+
+        Args:
+            data_id:
+            pid: Value at `PID_PATH`, `None` if the data has no PID.
+        """
+        previous_pid = self._pids.pop(data_id, None)
+
+        if (
+            previous_pid is not None
+            and self._owners.get(previous_pid) == data_id
+        ):
+            del self._owners[previous_pid]
+
+        if isinstance(pid, str):
+            self._pids[data_id] = pid
+            self._owners[pid] = data_id
+
+    def update(self, data_id, pid):
+        """Index the PID of a saved data, if the index is built or being
+        built.
+
+        Args:
+            data_id:
+            pid: Value at `PID_PATH`, `None` if the data has no PID.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((data_id, pid))
+
+            if self._pid_path is not None:
+                self._set(data_id, pid)
+
+    def remove(self, data_id):
+        """Remove the PID of a deleted data from the index.
+
+        Args:
+            data_id:
+        """
+        self.update(data_id, None)
+
+    def verify(self, records):
+        """Compare the index with the stored PIDs.
+
+        Args:
+            records: iterable - Primary key of each data and its stored PID,
+                sorted by primary key.
+
+        Returns:
+            list - Inconsistencies, as dicts with the PID, the data holding it,
+            the data it is indexed for and the issue: "missing" if the PID is
+            not indexed, "owner" if it is indexed for another data,
+            "duplicate" if it is held by several data and "extra" if no data
+            holds it.
+        """
+        with self._lock:
+            owners = dict(self._owners)
+
+        issues = list()
+        holders = dict()
+
+        for data_id, pid in records:
+            if not isinstance(pid, str):
+                continue
+
+            indexed_data_id = owners.get(pid)
+
+            if pid in holders:
+                issue = "duplicate"
+            else:
+                holders[pid] = data_id
+
+                if indexed_data_id is None:
+                    issue = "missing"
+                elif indexed_data_id != data_id:
+                    issue = "owner"
+                else:
+                    continue
+
+            issues.append(
+                {
+                    "pid": pid,
+                    "data_id": data_id,
+                    "indexed_data_id": indexed_data_id,
+                    "issue": issue,
+                }
+            )
+
+        for pid, indexed_data_id in owners.items():
+            if pid not in holders:
+                issues.append(
+                    {
+                        "pid": pid,
+                        "data_id": None,
+                        "indexed_data_id": indexed_data_id,
+                        "issue": "extra",
+                    }
+                )
+
+        return issues
+
+    def clear(self):
+        """Remove the content of the index, to build it again on next use"""
+        with self._lock:
+            self._pid_path = None
+            self._expires_at = None
+            self._owners = dict()
+            self._pids = dict()
+
+    def __len__(self):
+        return len(self._owners)
+
+
+pid_ownership_index = PidOwnershipIndex(settings.PID_OWNERSHIP_INDEX_TTL)
@@ -0,0 +1,330 @@
+"""PID utilities for the local id registry module"""
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from hashlib import sha1
+from threading import Lock
+from time import monotonic
+
+from django.db import close_old_connections
+
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.config import get_config
+from core_module_local_id_registry_app.utils.breaker import CircuitBreaker
+from core_module_local_id_registry_app.utils.cache import (
+    SharedTTLCache,
+    TTLCache,
+)
+from core_module_local_id_registry_app.utils.http import get_session
+
+
+class PidCheckUnavailableError(Exception):
+    """Raised when the provider is skipped and no verdict is known"""
+
+
+def normalize_pid(pid):
+    """Normalize a PID before checking its existence.
+
+    Args:
+        pid: str
+
+    Returns:
+        str
+    """
+    return pid.strip()
+
+
+class PidVerdictCache(SharedTTLCache):
+    """Cache of the PID existence checks, positive and negative.
+
+    Results are stored in the process or, when an alias is given, in a Django
+    cache shared between workers.
+    """
+
+    key_prefix = "core_module_local_id_registry_app:pid_defined:"
+
+    def _get_key(self, pid):
+        return self.key_prefix + sha1(pid.encode("utf-8")).hexdigest()
+
+
+pid_verdict_cache = PidVerdictCache(
+    settings.PID_VERDICT_CACHE_TTL, settings.PID_VERDICT_CACHE_ALIAS
+)
+
+
+def resolve_pid(pid):
+    """Determine if a PID exists by resolving it with the provider, over the
+    connections kept alive by the shared session.
+
+    Args:
+        pid: str - Normalized PID.
+
+    Returns:
+        bool
+
+    Raises:
+        requests.RequestException: If the resolver cannot answer.
+    """
+    response = get_session().head(
+        pid,
+        timeout=settings.REMOTE_PID_CHECK_TIMEOUT,
+        allow_redirects=False,
+    )
+
+    if response.status_code in (404, 410):
+        return False
+
+    response.raise_for_status()
+    return True
+
+
+def _check_pid_defined(pid):
+    """Determine if a PID exists, without cache.
+
+    Args:
+        pid: str - Normalized PID.
+
+    Returns:
+        bool
+    """
+    if settings.REMOTE_PID_CHECK_ENABLED:
+        return resolve_pid(pid)
+
+    return get_config().data_system_api.is_pid_defined(pid)
+
+
+# Last known verdicts, kept after their expiry in `pid_verdict_cache` to be
+# used while the provider is slow or unavailable.
+stale_pid_verdict_cache = TTLCache(
+    settings.PID_STALE_VERDICT_TTL, max_size=4096
+)
+
+provider_breaker = CircuitBreaker(
+    settings.PID_CHECK_FAILURE_THRESHOLD, settings.PID_CHECK_RECOVERY_TIMEOUT
+)
+
+
+def _refresh_pid_verdict(pid):
+    """Check the existence of a PID with the provider and store the verdict.
+
+    The outcome of the call is recorded by `provider_breaker`: a call taking
+    longer than `PID_CHECK_DEADLINE` counts as a failure.
+
+    Args:
+        pid: str - Normalized PID.
+
+    Returns:
+        bool
+    """
+    start_time = monotonic()
+
+    try:
+        pid_defined = _check_pid_defined(pid)
+    except Exception:
+        provider_breaker.record_failure()
+        raise
+
+    # A provider exceeding the budget of the requests is as unhealthy as a
+    # failing one.
+    if 0 < settings.PID_CHECK_DEADLINE < monotonic() - start_time:
+        provider_breaker.record_failure()
+    else:
+        provider_breaker.record_success()
+
+    pid_verdict_cache.set(pid, pid_defined)
+    stale_pid_verdict_cache.set(pid, pid_defined)
+
+    return pid_defined
+
+
+def is_pid_defined(pid):
+    """Determine if a given PID already exists, using cached results when
+    available.
+
+    Args:
+        pid: str
+
+    Returns:
+        bool
+
+    Raises:
+        PidCheckUnavailableError: If the provider is skipped.
+    """
+    pid = normalize_pid(pid)
+    pid_defined = pid_verdict_cache.get(pid)
+
+    if pid_defined is None:
+        if not provider_breaker.allow():
+            raise PidCheckUnavailableError("PID provider is unavailable.")
+
+        pid_defined = _refresh_pid_verdict(pid)
+
+    return pid_defined
+
+
+class PidCheckExecutor:
+    """Threads running the PID existence checks which can outlive the request
+    waiting for them. Concurrent checks of the same PID share a single call to
+    the provider.
+    """
+
+    def __init__(self):
+        """Initialize the executor"""
+        self._lock = Lock()
+        self._executor = None
+        self._futures = dict()
+
+    def _run(self, pid):
+        try:
+            return _refresh_pid_verdict(pid)
+        finally:
+            # Threads are not managed by Django: release their connection.
+            close_old_connections()
+
+    def _forget(self, pid, future):
+        with self._lock:
+            if self._futures.get(pid) is future:
+                del self._futures[pid]
+
+    def submit(self, pid):
+        """Start checking a PID, unless it is already being checked.
+
+        Args:
+            pid: str - Normalized PID.
+
+        Returns:
+            Future - Verdict of the check.
+        """
+        with self._lock:
+            future = self._futures.get(pid)
+
+            if future is not None:
+                return future
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.PID_CHECK_WORKERS,
+                    thread_name_prefix="pid_check",
+                )
+
+            future = self._executor.submit(self._run, pid)
+            self._futures[pid] = future
+
+        future.add_done_callback(lambda done: self._forget(pid, done))
+        return future
+
+    def shutdown(self):
+        """Wait for the running checks and stop the threads"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown()
+
+
+pid_check_executor = PidCheckExecutor()
+
+
+def get_pid_verdict(pid, timeout=None):
+    """Determine if a given PID already exists within a time budget.
+
+    If the budget is exceeded, or the provider is skipped, the last known
+    verdict is returned, marked as stale, and the check goes on in the
+    background.
+
+    Args:
+        pid: str
+        timeout: float - Time, in seconds, to wait for the provider. Wait
+            for the check, in the current thread, if not set.
+
+    Returns:
+        tuple - Verdict, `None` if it is still unknown, and whether it is
+        stale.
+
+    Raises:
+        PidCheckUnavailableError: If the provider is skipped and no verdict
+            is known.
+    """
+    pid = normalize_pid(pid)
+    pid_defined = pid_verdict_cache.get(pid)
+
+    if pid_defined is not None:
+        return pid_defined, False
+
+    if not provider_breaker.allow():
+        pid_defined = stale_pid_verdict_cache.get(pid)
+
+        if pid_defined is None:
+            raise PidCheckUnavailableError("PID provider is unavailable.")
+
+        return pid_defined, True
+
+    if timeout is None:
+        return _refresh_pid_verdict(pid), False
+
+    try:
+        return (
+            pid_check_executor.submit(pid).result(timeout=max(timeout, 0)),
+            False,
+        )
+    except TimeoutError:
+        # The check itself records its outcome once it is done.
+        return stale_pid_verdict_cache.get(pid), True
+
+
+def _try_is_pid_defined(pid):
+    """Call `is_pid_defined`, returning `None` if the check fails.
+
+    Args:
+        pid: str
+
+    Returns:
+        bool
+    """
+    try:
+        return is_pid_defined(pid)
+    except Exception:  # Check done again, and reported, by the caller.
+        return None
+
+
+def are_pids_defined(pids):
+    """Determine which of the given PIDs already exist. With remote checks,
+    the PIDs are resolved concurrently over the connections of the shared
+    session.
+
+    Args:
+        pids: iterable - Distinct PIDs.
+
+    Returns:
+        dict - `is_pid_defined` result for each PID whose check succeeded.
+    """
+    pids = list(pids)
+
+    if settings.REMOTE_PID_CHECK_ENABLED and len(pids) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(
+                len(pids), settings.REMOTE_PID_CHECK_MAX_CONNECTIONS
+            )
+        ) as executor:
+            pids_defined = zip(pids, executor.map(_try_is_pid_defined, pids))
+    else:
+        pids_defined = ((pid, _try_is_pid_defined(pid)) for pid in pids)
+
+    return {
+        pid: pid_defined
+        for pid, pid_defined in pids_defined
+        if pid_defined is not None
+    }
+
+
+def clear_pid_verdict(pid):
+    """Remove the cached result of a PID, after it has been assigned or
+    released.
+
+    Args:
+        pid: str
+    """
+    if isinstance(pid, str):
+        pid = normalize_pid(pid)
+        pid_verdict_cache.delete(pid)
+        stale_pid_verdict_cache.delete(pid)
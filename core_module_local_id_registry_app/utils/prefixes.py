@@ -0,0 +1,55 @@
+"""Prefix utilities for the local id registry module"""
+
+from bisect import bisect_left
+
+
+class PrefixIndex:
+    """Sorted index of the PID prefixes.
+
+    Membership is checked against a frozenset. Prefixes starting with a query
+    are found by bisecting the case-folded prefixes, so that a search only
+    reads the requested page of matches.
+    """
+
+    __slots__ = ("prefix_set", "keys", "prefixes")
+
+    def __init__(self, prefixes):
+        """Initialize the index
+
+        Args:
+            prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        """
+        self.prefix_set = frozenset(prefixes)
+        entries = sorted((prefix.casefold(), prefix) for prefix in prefixes)
+        self.keys = tuple(key for key, _ in entries)
+        self.prefixes = tuple(prefix for _, prefix in entries)
+
+    def __contains__(self, prefix):
+        return prefix in self.prefix_set
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    def search(self, query, offset=0, limit=20):
+        """Return a page of the prefixes starting with the query, ignoring
+        case.
+
+        Args:
+            query: str - Start of the prefixes. All prefixes match an empty
+                query.
+            offset: int - Number of matches to skip.
+            limit: int - Maximum number of matches to return.
+
+        Returns:
+            tuple - Matches of the page, sorted, and total number of matches.
+        """
+        key = query.casefold()
+        start = bisect_left(self.keys, key)
+        # Keys starting with the query are sorted before the query followed
+        # by the highest code point.
+        end = bisect_left(self.keys, key + "\U0010ffff", start)
+        page = slice(
+            min(start + offset, end), min(start + offset + limit, end)
+        )
+
+        return list(self.prefixes[page]), end - start
@@ -0,0 +1,113 @@
+"""Provider utilities for the local id registry module"""
+
+from threading import Lock
+
+
+class ResolvedProvider:
+    """Provider resolved from the linked records settings, along with its
+    normalized lookup URLs.
+    """
+
+    __slots__ = ("provider", "lookup_url", "host_url")
+
+    def __init__(self, provider):
+        """Initialize the resolved provider
+
+        Args:
+            provider: AbstractIdProvider - Provider instance.
+        """
+        self.provider = provider
+        self.lookup_url = provider.provider_lookup_url
+
+        # Host URL displayed in the module, without the trailing slash.
+        lookup_url_split = self.lookup_url.rsplit("/", 1)
+        self.host_url = (
+            self.lookup_url
+            if lookup_url_split[-1] != ""
+            else lookup_url_split[0]
+        )
+
+
+class ProviderCache:
+    """Process-wide cache of the provider resolved by `ProviderManager`.
+
+    The cache is keyed on the provider system name and prefixes settings and
+    is rebuilt whenever one of them changes.
+    """
+
+    def __init__(self):
+        """Initialize the cache"""
+        self._lock = Lock()
+        self._entry = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, system_name, prefixes):
+        """Return the resolved provider for the given settings.
+
+        Args:
+            system_name: str - Value of `ID_PROVIDER_SYSTEM_NAME`.
+            prefixes: list - Value of `ID_PROVIDER_PREFIXES`.
+
+        Returns:
+            ResolvedProvider - Cached provider and lookup URLs.
+        """
+        key = (system_name, tuple(prefixes))
+        entry = self._entry
+
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+
+        with self._lock:
+            entry = self._entry
+
+            # Another thread may have resolved the provider while waiting for
+            # the lock.
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+
+            from core_linked_records_app.utils.providers import (
+                ProviderManager,
+            )
+
+            self.misses += 1
+            resolved_provider = ResolvedProvider(
+                ProviderManager().get(system_name)
+            )
+            self._entry = (key, resolved_provider)
+
+        return resolved_provider
+
+    def clear(self):
+        """Empty the cache and reset the counters"""
+        with self._lock:
+            self._entry = None
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Return the cache counters.
+
+        Returns:
+            dict - Number of hits and misses.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+provider_cache = ProviderCache()
+
+
+def get_resolved_provider(system_name, prefixes):
+    """Return the provider resolved for the given settings from the
+    process-wide cache.
+
+    Args:
+        system_name: str - Value of `ID_PROVIDER_SYSTEM_NAME`.
+        prefixes: list - Value of `ID_PROVIDER_PREFIXES`.
+
+    Returns:
+        ResolvedProvider - Cached provider and lookup URLs.
+    """
+    return provider_cache.get(system_name, prefixes)
@@ -0,0 +1,227 @@
+"""Rendering utilities for the local id registry module"""
+
+from threading import Lock
+
+from django.urls import reverse
+from django.utils.html import escape
+
+from core_module_local_id_registry_app import settings
+
+STATUS_BOX_TEMPLATE = "core_module_local_id_registry_app/pid_display_box.html"
+STATUS_BOX_MESSAGE_PLACEHOLDER = "__LOCAL_ID_STATUS_BOX_MESSAGE__"
+
+
+class StatusBoxCache:
+    """Cache of the status boxes displayed by the module.
+
+    Boxes with a static message are rendered once per process. Boxes with a
+    variable message are assembled from a fragment rendered once, in which
+    the escaped message is inserted.
+    """
+
+    def __init__(self):
+        """Initialize the cache"""
+        self._lock = Lock()
+        self._boxes = dict()
+        self._fragments = dict()
+
+    def get_static_box(self, key, render_template, context):
+        """Return the status box rendered for a context that does not vary
+        between requests.
+
+        Args:
+            key: Key identifying the context.
+            render_template: Function rendering a template with a context.
+            context: dict - Context of the status box.
+
+        Returns:
+            str
+        """
+        status_box = self._boxes.get(key)
+
+        if status_box is None:
+            status_box = render_template(STATUS_BOX_TEMPLATE, context)
+
+            with self._lock:
+                self._boxes[key] = status_box
+
+        return status_box
+
+    def get_dynamic_box(self, key, render_template, context, message):
+        """Return the status box for a context whose message varies between
+        requests.
+
+        Args:
+            key: Key identifying the context, without its message.
+            render_template: Function rendering a template with a context.
+            context: dict - Context of the status box, without its message.
+            message: str - Message of the status box.
+
+        Returns:
+            str
+        """
+        fragment = self._fragments.get(key)
+
+        if fragment is None:
+            fragment = render_template(
+                STATUS_BOX_TEMPLATE,
+                dict(context, message=STATUS_BOX_MESSAGE_PLACEHOLDER),
+            ).split(STATUS_BOX_MESSAGE_PLACEHOLDER)
+
+            with self._lock:
+                self._fragments[key] = fragment
+
+        return escape(message).join(fragment)
+
+    def clear(self):
+        """Remove all the rendered boxes"""
+        with self._lock:
+            self._boxes.clear()
+            self._fragments.clear()
+
+
+status_box_cache = StatusBoxCache()
+
+
+PID_EDIT_INPUT_TEMPLATE = (
+    "core_module_local_id_registry_app/pid_edit_input.html"
+)
+PID_EDIT_INPUT_MODULE_PLACEHOLDER = "__LOCAL_ID_INPUT_MODULE__"
+PID_EDIT_INPUT_PREFIX_PLACEHOLDER = "__LOCAL_ID_PREFIX__"
+PID_EDIT_INPUT_OPTION = "<option>"
+PID_EDIT_INPUT_SELECTED_OPTION = "<option selected>"
+
+
+class PidEditInputCache:
+    """Cache of the input wrapping the default input module with the PID host
+    and prefixes.
+
+    The wrapper is rendered once for each combination of host and prefixes,
+    without input module nor selected prefix. Each request then only inserts
+    the input module and selects its prefix.
+
+    Above `PREFIX_SELECT_MAX_OPTIONS` prefixes, the wrapper only contains the
+    selected prefix, and the other prefixes are searched by the client.
+    """
+
+    def __init__(self):
+        """Initialize the cache"""
+        self._lock = Lock()
+        self._entry = None
+
+    def _build_entry(self, render_template, host_url, prefixes):
+        """Render the wrapper and locate the option of each prefix.
+
+        Args:
+            render_template: Function rendering a template with a context.
+            host_url: str - PID host URL.
+            prefixes: tuple - PID prefixes.
+
+        Returns:
+            tuple - Key, head and tail of the wrapper, positions of the
+            option of each prefix in the head, and set of the prefixes if
+            only the selected prefix is rendered.
+        """
+        manifest_url = reverse("core_module_local_id_registry_manifest")
+        check_url = reverse("core_module_local_id_registry_check")
+
+        if len(prefixes) > settings.PREFIX_SELECT_MAX_OPTIONS:
+            head, tail = render_template(
+                PID_EDIT_INPUT_TEMPLATE,
+                context={
+                    "pid_host_url": host_url,
+                    "pid_prefixes": [PID_EDIT_INPUT_PREFIX_PLACEHOLDER],
+                    "default_prefix": None,
+                    "default_input_module": PID_EDIT_INPUT_MODULE_PLACEHOLDER,
+                    "manifest_url": manifest_url,
+                    "check_url": check_url,
+                    "prefix_search_url": reverse(
+                        "core_module_local_id_registry_prefixes"
+                    ),
+                },
+            ).split(PID_EDIT_INPUT_MODULE_PLACEHOLDER)
+
+            return (host_url, prefixes), head, tail, None, frozenset(prefixes)
+
+        head, tail = render_template(
+            PID_EDIT_INPUT_TEMPLATE,
+            context={
+                "pid_host_url": host_url,
+                "pid_prefixes": prefixes,
+                "default_prefix": None,
+                "default_input_module": PID_EDIT_INPUT_MODULE_PLACEHOLDER,
+                "manifest_url": manifest_url,
+                "check_url": check_url,
+            },
+        ).split(PID_EDIT_INPUT_MODULE_PLACEHOLDER)
+
+        option_positions = dict()
+        search_start = 0
+
+        for prefix in prefixes:
+            option = "%s%s</option>" % (PID_EDIT_INPUT_OPTION, escape(prefix))
+            position = head.index(option, search_start)
+            option_positions.setdefault(prefix, list()).append(position)
+            search_start = position + len(option)
+
+        return (host_url, prefixes), head, tail, option_positions, None
+
+    def render(
+        self, render_template, host_url, prefixes, default_prefix, input_module
+    ):
+        """Return the wrapper around the input module.
+
+        Args:
+            render_template: Function rendering a template with a context.
+            host_url: str - PID host URL.
+            prefixes: list - PID prefixes.
+            default_prefix: str - Prefix to select.
+            input_module: str - Rendered default input module.
+
+        Returns:
+            str
+        """
+        prefixes = tuple(prefixes)
+        entry = self._entry
+
+        if entry is None or entry[0] != (host_url, prefixes):
+            entry = self._build_entry(render_template, host_url, prefixes)
+
+            with self._lock:
+                self._entry = entry
+
+        _, head, tail, option_positions, prefix_set = entry
+
+        if prefix_set is not None:
+            # Without a known prefix, the first prefix is selected, as the
+            # browser does with the complete list.
+            if default_prefix not in prefix_set:
+                default_prefix = prefixes[0]
+
+            head = head.replace(
+                "%s%s</option>"
+                % (PID_EDIT_INPUT_OPTION, PID_EDIT_INPUT_PREFIX_PLACEHOLDER),
+                "%s%s</option>"
+                % (PID_EDIT_INPUT_SELECTED_OPTION, escape(default_prefix)),
+            )
+            return "".join([head, input_module, tail])
+
+        for position in reversed(option_positions.get(default_prefix, [])):
+            option_end = position + len(PID_EDIT_INPUT_OPTION)
+            head = "".join(
+                [
+                    head[:position],
+                    PID_EDIT_INPUT_SELECTED_OPTION,
+                    head[option_end:],
+                ]
+            )
+
+        return "".join([head, input_module, tail])
+
+    def clear(self):
+        """Remove the rendered wrapper"""
+        with self._lock:
+            self._entry = None
+
+
+pid_edit_input_cache = PidEditInputCache()
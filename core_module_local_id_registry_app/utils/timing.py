@@ -0,0 +1,224 @@
+"""Timing utilities for the local id registry module"""
+
+import logging
+from bisect import bisect_left
+from contextlib import nullcontext
+from threading import Lock
+from time import perf_counter
+
+from django.utils.module_loading import import_string
+
+from core_module_local_id_registry_app import settings
+
+logger = logging.getLogger(__name__)
+
+_NULL_PHASE = nullcontext()
+
+
+class _TimedPhase:
+    """Context manager adding its duration to a timer"""
+
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, (perf_counter() - self.start) * 1000)
+        return False
+
+
+class PhaseTimer:
+    """Durations of the phases of a request"""
+
+    __slots__ = ("durations",)
+
+    def __init__(self):
+        """Initialize the timer"""
+        self.durations = dict()
+
+    def phase(self, name):
+        """Return a context manager timing a phase.
+
+        Args:
+            name: str
+
+        Returns:
+        """
+        return _TimedPhase(self, name)
+
+    def add(self, name, duration):
+        """Add a duration to a phase. Durations of repeated phases are
+        summed.
+
+        Args:
+            name: str
+            duration: float - Duration, in milliseconds.
+        """
+        self.durations[name] = self.durations.get(name, 0) + duration
+
+    def get_server_timing(self):
+        """Return the value of the `Server-Timing` header.
+
+        Returns:
+            str
+        """
+        return ", ".join(
+            "%s;dur=%.2f" % (name, duration)
+            for name, duration in self.durations.items()
+        )
+
+
+class HistogramSink:
+    """Process-wide histograms of the phase durations"""
+
+    # Upper bounds of the buckets, in milliseconds.
+    BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        """Initialize the sink"""
+        self._lock = Lock()
+        self._histograms = dict()
+
+    def record(self, name, duration):
+        """Record the duration of a phase.
+
+        Args:
+            name: str
+            duration: float - Duration, in milliseconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+
+            if histogram is None:
+                histogram = {
+                    "buckets": [0] * (len(self.BUCKETS) + 1),
+                    "count": 0,
+                    "sum": 0,
+                }
+                self._histograms[name] = histogram
+
+            histogram["buckets"][bisect_left(self.BUCKETS, duration)] += 1
+            histogram["count"] += 1
+            histogram["sum"] += duration
+
+    def get_histograms(self):
+        """Export the histograms.
+
+        Returns:
+            dict - For each phase, the number of durations in each bucket,
+            `inf` for durations above the last bound, their count and sum.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "buckets": dict(
+                        zip(
+                            [str(bound) for bound in self.BUCKETS] + ["inf"],
+                            histogram["buckets"],
+                        )
+                    ),
+                    "count": histogram["count"],
+                    "sum": histogram["sum"],
+                }
+                for name, histogram in self._histograms.items()
+            }
+
+    def clear(self):
+        """Empty the histograms"""
+        with self._lock:
+            self._histograms.clear()
+
+
+_sinks = None
+_sinks_lock = Lock()
+
+
+def get_sinks():
+    """Return the sinks configured in `PHASE_TIMING_SINKS`, instantiated once.
+
+    Returns:
+        list
+    """
+    global _sinks
+
+    if _sinks is None:
+        with _sinks_lock:
+            if _sinks is None:
+                _sinks = [
+                    import_string(sink_path)()
+                    for sink_path in settings.PHASE_TIMING_SINKS
+                ]
+
+    return _sinks
+
+
+def reset_sinks():
+    """Drop the sink instances, to configure them again on next use"""
+    global _sinks
+
+    with _sinks_lock:
+        _sinks = None
+
+
+def create_phase_timer():
+    """Return a timer if phase timing is enabled.
+
+    Returns:
+        PhaseTimer - `None` if phase timing is disabled.
+    """
+    return PhaseTimer() if settings.PHASE_TIMING_ENABLED else None
+
+
+def time_phase(timer, name):
+    """Return a context manager timing a phase with the timer, or doing
+    nothing if there is no timer.
+
+    Args:
+        timer: PhaseTimer
+        name: str
+
+    Returns:
+    """
+    return _NULL_PHASE if timer is None else timer.phase(name)
+
+
+def report_phase_timer(timer, request, response):
+    """Add the phase durations to the response, the logs and the sinks.
+
+    Args:
+        timer: PhaseTimer
+        request:
+        response:
+    """
+    if timer is None or not timer.durations:
+        return
+
+    response["Server-Timing"] = timer.get_server_timing()
+
+    logger.info(
+        "Local id module phases: %s",
+        response["Server-Timing"],
+        extra={
+            "method": request.method,
+            "path": request.path,
+            "phase_timings": dict(timer.durations),
+        },
+    )
+
+    for sink in get_sinks():
+        for name, duration in timer.durations.items():
+            try:
+                sink.record(name, duration)
+            except Exception as exception:
+                logger.warning(
+                    "Phase timing sink %s failed: %s",
+                    type(sink).__name__,
+                    str(exception),
+                )
@@ -0,0 +1,101 @@
+"""Validation utilities for the local id registry module"""
+
+import re
+from functools import lru_cache
+
+
+class PidVerdict:
+    """Possible outcomes of the PID validation"""
+
+    VALID = "valid"
+    INVALID_STRUCTURE = "invalid_structure"
+    INVALID_HOST = "invalid_host"
+    INVALID_PREFIX = "invalid_prefix"
+    INVALID_FORMAT = "invalid_format"
+
+
+class PidValidator:
+    """Validate PID URLs against the PID settings.
+
+    The record name pattern is compiled once and the prefixes are stored as a
+    frozenset so that each validation is done in a single pass.
+    """
+
+    __slots__ = ("host_url", "prefixes", "format_regex")
+
+    def __init__(self, pid_format, prefixes, host_url):
+        """Initialize the validator
+
+        Args:
+            pid_format: str - Value of `PID_FORMAT`.
+            prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+            host_url: str - Lookup URL of the provider.
+        """
+        self.host_url = host_url
+        self.prefixes = frozenset(prefixes)
+        self.format_regex = re.compile(r"^(%s|)$" % pid_format)
+
+    def validate(self, data):
+        """Split and validate a PID URL.
+
+        Args:
+            data: str - PID URL, formatted as host/prefix/record.
+
+        Returns:
+            tuple - Host URL, prefix, record name and verdict. Prefix and
+            record name are set to `None` if the PID cannot be attributed to
+            the provider.
+        """
+        data_split = data.rsplit("/", 2)
+
+        if len(data_split) < 2:
+            return None, None, None, PidVerdict.INVALID_STRUCTURE
+
+        host_url = data_split[0] if len(data_split) == 3 else ""
+        prefix = data_split[-2]
+        value = data_split[-1].strip(" ")
+
+        if host_url != self.host_url:
+            return host_url, None, None, PidVerdict.INVALID_HOST
+
+        if prefix not in self.prefixes:
+            return host_url, prefix, value, PidVerdict.INVALID_PREFIX
+
+        if self.format_regex.match(value) is None:
+            return host_url, prefix, value, PidVerdict.INVALID_FORMAT
+
+        return host_url, prefix, value, PidVerdict.VALID
+
+
+@lru_cache(maxsize=16)
+def _build_pid_validator(pid_format, prefixes, host_url):
+    """Build a validator, cached for each combination of settings.
+
+    Args:
+        pid_format: str
+        prefixes: frozenset
+        host_url: str
+
+    Returns:
+        PidValidator
+    """
+    return PidValidator(pid_format, prefixes, host_url)
+
+
+def get_pid_validator(pid_format, prefixes, host_url):
+    """Return the validator for the given settings from a bounded cache.
+
+    Args:
+        pid_format: str - Value of `PID_FORMAT`.
+        prefixes: iterable - Value of `ID_PROVIDER_PREFIXES`.
+        host_url: str - Lookup URL of the provider.
+
+    Returns:
+        PidValidator
+    """
+    # A frozenset caches its hash: passing the same set on each request
+    # avoids hashing all the prefixes.
+    if not isinstance(prefixes, frozenset):
+        prefixes = frozenset(prefixes)
+
+    return _build_pid_validator(pid_format, prefixes, host_url)
@@ -0,0 +1,69 @@
+"""Request state of the local id registry module"""
+
+from time import monotonic
+
+from core_module_local_id_registry_app.utils.timing import time_phase
+
+
+class RequestState:
+    """Results of the processing of a module request.
+
+    The state is created for each request and passed through the methods of
+    the module, so that a single module instance can serve concurrent
+    requests.
+    """
+
+    __slots__ = (
+        "default_value",
+        "default_prefix",
+        "error_data",
+        "error_code",
+        "has_failed",
+        "verdict_pending",
+        "verdict_stale",
+        "task_id",
+        "module_element",
+        "deadline",
+        "phase_timer",
+    )
+
+    def __init__(self, phase_timer=None, budget=None):
+        """Initialize the state
+
+        Args:
+            phase_timer: PhaseTimer - Timer of the request phases, if phase
+                timing is enabled.
+            budget: float - Time, in seconds, allowed to the validation. The
+                validation is not bounded if not set or lower or equal to 0.
+        """
+        self.default_value = None
+        self.default_prefix = None
+        self.error_data = None
+        self.error_code = None
+        self.has_failed = False
+        self.verdict_pending = False
+        self.verdict_stale = False
+        self.task_id = None
+        # Element of the module, retrieved and access checked once.
+        self.module_element = None
+        self.deadline = monotonic() + budget if budget and budget > 0 else None
+        self.phase_timer = phase_timer
+
+    def get_remaining_time(self):
+        """Return the time left to the validation.
+
+        Returns:
+            float - Time, in seconds, or `None` if the validation is not
+            bounded.
+        """
+        return None if self.deadline is None else self.deadline - monotonic()
+
+    def time_phase(self, name):
+        """Return a context manager timing a phase of the request
+
+        Args:
+            name: str
+
+        Returns:
+        """
+        return time_phase(self.phase_timer, name)
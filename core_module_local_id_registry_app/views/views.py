@@ -1,167 +1,551 @@
 """Local Id Registry Module"""
 
-from re import match
+import asyncio
+import json
 
-from core_curate_app.components.curate_data_structure import (
-    api as curate_data_structure_api,
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from celery.result import AsyncResult
+from django.core.signing import BadSignature, Signer
+from django.db import close_old_connections
+from django.http.response import HttpResponse, HttpResponseBadRequest
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import (
+    condition,
+    require_GET,
+    require_POST,
 )
-from core_main_registry_app.components.data.api import generate_unique_local_id
+
 from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.config import get_config
+from core_module_local_id_registry_app.tasks import check_local_id_task
+from core_module_local_id_registry_app.utils.data import (
+    get_pid_value_for_data_id,
+)
+from core_module_local_id_registry_app.utils.data_structure import (
+    get_curate_data_structure_from_module_id,
+)
+from core_module_local_id_registry_app.utils.local_id import reserve_local_id
+from core_module_local_id_registry_app.utils.manifest import (
+    validation_manifest_cache,
+)
+from core_module_local_id_registry_app.utils.ownership import (
+    pid_ownership_index,
+)
+from core_module_local_id_registry_app.utils.pid import (
+    are_pids_defined,
+    get_pid_verdict,
+)
+from core_module_local_id_registry_app.utils.providers import (
+    get_resolved_provider,
+)
+from core_module_local_id_registry_app.utils.rendering import (
+    STATUS_BOX_MESSAGE_PLACEHOLDER,
+    pid_edit_input_cache,
+    status_box_cache,
+)
+from core_module_local_id_registry_app.utils.timing import (
+    create_phase_timer,
+    report_phase_timer,
+)
+from core_module_local_id_registry_app.utils.validators import (
+    PidVerdict,
+    get_pid_validator,
+)
+from core_module_local_id_registry_app.views.request_state import (
+    RequestState,
+)
 from core_parser_app.components.data_structure_element import (
     api as data_structure_element_api,
 )
+from core_parser_app.tools.modules.exceptions import ModuleError
 from core_parser_app.tools.modules.views.builtin.input_module import (
     AbstractInputModule,
 )
+from core_parser_app.tools.modules.views.module import AbstractModule
+
+# Media type of the verdicts, accepted by clients in place of HTML.
+VERDICT_CONTENT_TYPE = "application/vnd.local-id-verdict+json"
+# Error code of the local ids assigned to other data.
+PID_TAKEN_ERROR_CODE = "pid_taken"
+# States returned by `LocalIdRegistryModule._get_state`.
+MODULE_STATES = (
+    "info",
+    "invalid",
+    "failure",
+    "checking",
+    "pending",
+    "stale",
+    "success",
+)
+# Signer of the ids of the check tasks given to clients, so that only the
+# results of these tasks are returned.
+CHECK_TASK_SIGNER = Signer(salt="core_module_local_id_registry_app.check")
+# Keys of the verdicts returned by `check_local_id_task`.
+CHECK_TASK_VERDICT_KEYS = frozenset(
+    ("state", "prefix", "value", "message_code", "html")
+)
+
+
+def _accepts_verdict(request):
+    """Determine if the client accepts verdicts in place of HTML.
+
+    Args:
+        request:
+
+    Returns:
+        bool
+    """
+    return VERDICT_CONTENT_TYPE in request.headers.get("Accept", "")
 
 
 class LocalIdRegistryModule(AbstractInputModule):
-    """Local Id Registry Module"""
+    """Local Id Registry Module
+
+    The module holds no request data: the results of a request are kept in
+    its `RequestState`. A single instance serves all the requests of the
+    process.
+    """
 
     def __init__(self):
         """Initialize module"""
-        self.error_data = None
-        self.has_failed = False
+        self.config = get_config()
+        self.pid_settings = self.config.pid_settings
 
-        if "core_linked_records_app" in settings.INSTALLED_APPS:
-            from core_linked_records_app import (
-                settings as linked_records_settings,
+        AbstractInputModule.__init__(
+            self,
+            styles=list(self.config.styles),
+            scripts=list(self.config.scripts),
+            disabled=self.config.disabled,
+            placeholder=self.config.placeholder,
+        )
+
+    @classmethod
+    def get_shared_instance(cls):
+        """Return the instance serving the requests of the process, built
+        again when the configuration is reloaded.
+
+        Returns:
+            LocalIdRegistryModule
+        """
+        config = get_config()
+        instance = cls.__dict__.get("_shared_instance")
+
+        # Threads building an instance at the same time build equivalent
+        # instances: the last one is kept.
+        if instance is None or instance.config is not config:
+            instance = cls()
+            cls._shared_instance = instance
+
+        return instance
+
+    @classmethod
+    def _check_initkwargs(cls, initkwargs):
+        """Reject the keyword arguments of `as_view`, which cannot be applied
+        to the shared instance.
+
+        Args:
+            initkwargs: dict
+
+        Raises:
+            TypeError: If keyword arguments are given.
+        """
+        if initkwargs:
+            raise TypeError(
+                "%s() received keyword arguments %s. as_view accepts none, "
+                "as the instance is shared between requests."
+                % (cls.__name__, ", ".join(sorted(initkwargs)))
             )
 
-            placeholder = "A PID will be generated for this resource"
-            styles = [
-                "core_module_local_id_registry_app/css/module_local_id.css"
-            ]
-            scripts = [
-                "core_module_local_id_registry_app/js/module_local_id.js"
-            ]
-            disabled = False
-
-            # Retrieve PID settings
-            self.pid_settings = {
-                "path": linked_records_settings.PID_PATH,
-                "format": linked_records_settings.PID_FORMAT,
-                "system": linked_records_settings.ID_PROVIDER_SYSTEM_NAME,
-                "prefixes": linked_records_settings.ID_PROVIDER_PREFIXES,
-            }
-        else:
-            placeholder = None
-            styles = list()
-            scripts = list()
-            disabled = True
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """Return the view function, dispatching the requests to the shared
+        instance.
 
-            self.pid_settings = None
+        `View.setup` is not called, as it would store the request on the
+        shared instance: handlers get the request as argument.
 
-        AbstractInputModule.__init__(
-            self,
-            styles=styles,
-            scripts=scripts,
-            disabled=disabled,
-            placeholder=placeholder,
-        )
+        Args:
+            **initkwargs:
+
+        Returns:
+        """
+        cls._check_initkwargs(initkwargs)
+
+        def view(request, *args, **kwargs):
+            return cls.get_shared_instance().dispatch(request, *args, **kwargs)
+
+        view.view_class = cls
+        view.view_initkwargs = initkwargs
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        view.__dict__.update(cls.dispatch.__dict__)
+        return view
 
     @staticmethod
-    def _get_curate_datastructure_from_module_id(module_id, request):
-        module_element = data_structure_element_api.get_by_id(
-            module_id, request
+    def _create_request_state():
+        """Create the state of a request, starting its timer and deadline
+
+        Returns:
+            RequestState
+        """
+        return RequestState(create_phase_timer(), settings.PID_CHECK_DEADLINE)
+
+    def _handle(self, handler, request):
+        """Run a request handler with a new request state, timing its phases
+        if enabled
+
+        Args:
+            handler: Method taking the request and its state.
+            request:
+
+        Returns:
+        """
+        request_state = self._create_request_state()
+        response = handler(request, request_state)
+        report_phase_timer(request_state.phase_timer, request, response)
+
+        return response
+
+    def get(self, request, *args, **kwargs):
+        """Manage GET requests, as `AbstractModule.get`
+
+        Args:
+            request:
+            *args:
+            **kwargs:
+
+        Returns:
+        """
+        if "resources" in request.GET or "managing_occurrences" in request.GET:
+            return super().get(request, *args, **kwargs)
+
+        return self._handle(self._get, request)
+
+    def head(self, request, *args, **kwargs):
+        """Manage HEAD requests, as GET requests
+
+        Args:
+            request:
+            *args:
+            **kwargs:
+
+        Returns:
+        """
+        return self.get(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        """Manage POST requests, as `AbstractModule.post`
+
+        Args:
+            request:
+            *args:
+            **kwargs:
+
+        Returns:
+        """
+        return self._handle(self._post, request)
+
+    def _get(self, request, request_state):
+        """Manage GET requests, as `AbstractModule._get`
+
+        Args:
+            request:
+            request_state: RequestState
+
+        Returns:
+        """
+        module_id = request.GET["module_id"]
+        url = (
+            request.GET["url"]
+            if "url" in request.GET
+            else self._get_module_element(
+                module_id, request, request_state
+            ).options["url"]
         )
-        data_structure_element = data_structure_element_api.get_root_element(
-            module_element, request
+        template_data = {
+            "module_id": module_id,
+            "module": "",
+            "display": "",
+            "url": url,
+        }
+
+        try:
+            data = self._retrieve_data(request, request_state)
+            template_data["module"] = self._render_module(
+                request, request_state
+            )
+            template_data["display"] = self._render_data(
+                request, request_state
+            )
+
+            module_element = self._get_module_element(
+                module_id, request, request_state
+            )
+            options = module_element.options
+            options["data"] = data
+            module_element.options = options
+            data_structure_element_api.upsert(module_element, request)
+        except Exception as e:
+            raise ModuleError(
+                "Something went wrong during module initialization: " + str(e)
+            )
+
+        for key, val in list(template_data.items()):
+            if val is None:
+                raise ModuleError(
+                    "Variable "
+                    + key
+                    + " cannot be None. Module initialization cannot be completed."
+                )
+
+        html_string = AbstractModule.render_template(
+            self.template_name, template_data
         )
-        return curate_data_structure_api.get_by_data_structure_element_root_id(
-            data_structure_element, request.user
+        return HttpResponse(html_string)
+
+    def _post(self, request, request_state):
+        """Manage POST requests, as `AbstractModule.post`
+
+        Args:
+            request:
+            request_state: RequestState
+
+        Returns:
+        """
+        if "module_id" not in request.POST:
+            return HttpResponseBadRequest(
+                {"error": 'No "module_id" parameter provided'}
+            )
+
+        try:
+            module_element = self._get_module_element(
+                request.POST["module_id"], request, request_state
+            )
+            data = self._retrieve_data(request, request_state)
+            options = module_element.options
+            options["data"] = data
+            module_element.options = options
+            data_structure_element_api.upsert(module_element, request)
+        except Exception as e:
+            raise ModuleError(
+                "Something went wrong during module update: " + str(e)
+            )
+
+        return self._build_post_response(request, request_state)
+
+    def _build_post_response(self, request, request_state):
+        """Return the outcome of a POST request, as a verdict if the client
+        accepts it, or as the HTML of the module display otherwise.
+
+        Args:
+            request:
+            request_state: RequestState
+
+        Returns:
+            HttpResponse
+        """
+        if _accepts_verdict(request):
+            response = HttpResponse(
+                json.dumps(self._get_verdict(request_state)),
+                content_type=VERDICT_CONTENT_TYPE,
+            )
+        else:
+            html_code = AbstractModule.render_template(
+                self.template_name,
+                {
+                    "display": self._render_data(request, request_state),
+                    "url": "",
+                },
+            )
+            content = {"html": html_code}
+
+            if request_state.task_id is not None:
+                content["task_id"] = request_state.task_id
+
+            response = HttpResponse(json.dumps(content))
+
+        patch_vary_headers(response, ["Accept"])
+
+        return response
+
+    @staticmethod
+    def _get_module_element(module_id, request, request_state):
+        """Return the element of the module, retrieved and access checked once
+        per request.
+
+        Args:
+            module_id:
+            request:
+            request_state: RequestState
+
+        Returns:
+            DataStructureElement
+        """
+        if request_state.module_element is None:
+            request_state.module_element = (
+                data_structure_element_api.get_by_id(module_id, request)
+            )
+
+        return request_state.module_element
+
+    @staticmethod
+    def _get_curate_datastructure_from_module_id(
+        module_id, request, module_element=None
+    ):
+        return get_curate_data_structure_from_module_id(
+            module_id, request, module_element=module_element
         )
 
-    def _init_prefix_and_record(self, data, curate_data_structure_id, user):
+    def _init_prefix_and_record(
+        self, data, curate_data_structure, request_state, pid_defined=None
+    ):
         """Helper function to determine prefix and record from a module.
 
+        With `PID_CHECK_ASYNC_TASKS`, the checks of the record existence and
+        ownership are left to a task.
+
         Args:
             data:
-            curate_data_structure_id:
-            user:
+            curate_data_structure: CurateDataStructure - Curate data structure
+                of the form, already retrieved and access checked.
+            request_state: RequestState
+            pid_defined: Result of `is_pid_defined` for `data`, if already
+                known.
 
         Returns:
         """
-        from core_linked_records_app.utils.dict import (
-            get_value_from_dot_notation,
+        return self._check_local_id(
+            data,
+            curate_data_structure.data_id,
+            request_state,
+            pid_defined=pid_defined,
+            defer=settings.PID_CHECK_ASYNC_TASKS,
         )
-        from core_linked_records_app.system.data.api import is_pid_defined
-        from core_linked_records_app.utils.providers import ProviderManager
 
+    def _check_local_id(
+        self, data, data_id, request_state, pid_defined=None, defer=False
+    ):
+        """Validate a local id and check that its record is available.
+
+        Args:
+            data:
+            data_id: Primary key of the data being edited, if saved.
+            request_state: RequestState
+            pid_defined: Result of `is_pid_defined` for `data`, if already
+                known.
+            defer: bool - Enqueue the existence and ownership checks in a
+                task, if the existence is not known.
+
+        Returns:
+        """
         # If data is not empty and linked records installed, get record name and
         # prefix.
-        record_host_pid_url = None
-        settings_host_pid_url = (
-            ProviderManager()
-            .get(self.pid_settings["system"])
-            .provider_lookup_url
-        )
+        with request_state.time_phase("provider"):
+            pid_validator = get_pid_validator(
+                self.pid_settings.format,
+                self.pid_settings.prefix_set,
+                get_resolved_provider(
+                    self.pid_settings.system, self.pid_settings.prefixes
+                ).lookup_url,
+            )
 
         try:
-            data_split = data.split("/")
+            (
+                _,
+                request_state.default_prefix,
+                request_state.default_value,
+                verdict,
+            ) = pid_validator.validate(data)
 
-            record_host_pid_url = "/".join(data_split[:-2])
-            self.default_value = data_split[-1].strip(" ")
-            self.default_prefix = data_split[-2]
+            if verdict != PidVerdict.VALID:
+                request_state.error_data = data
+                request_state.error_code = verdict
+                return data if request_state.default_value else ""
 
-            assert record_host_pid_url == settings_host_pid_url
-            assert self.default_prefix in self.pid_settings["prefixes"]
+            if pid_defined is None and defer:
+                with request_state.time_phase("enqueue"):
+                    request_state.task_id = CHECK_TASK_SIGNER.sign(
+                        check_local_id_task.delay(data, data_id).id
+                    )
 
-            # Check the record name match the expected format.
-            record_format_match = match(
-                r"^(%s|)$" % self.pid_settings["format"], self.default_value
-            )
+                return data
+
+            if pid_defined is None:
+                with request_state.time_phase("pid_defined"):
+                    (
+                        pid_defined,
+                        request_state.verdict_stale,
+                    ) = get_pid_verdict(
+                        data, request_state.get_remaining_time()
+                    )
 
-            assert record_format_match is not None
+                # The budget is exceeded and no verdict is known: the check
+                # goes on in the background.
+                if pid_defined is None:
+                    request_state.verdict_pending = True
+                    return data
 
-            # Retrieve curate data structure associated with the current form. Used
-            # to check if the data being edited is the same as the one with the
+            # Check if the data being edited is the same as the one with the
             # assigned PID.
-            curate_data_structure_object = curate_data_structure_api.get_by_id(
-                curate_data_structure_id, user
-            )
+            if pid_defined and (
+                data_id is None
+                or not self._is_pid_owner(data, data_id, request_state)
+            ):
+                request_state.error_data = data
+                request_state.error_code = PID_TAKEN_ERROR_CODE
+        except Exception:
+            request_state.default_prefix = None
+            request_state.default_value = None
 
-            assert not is_pid_defined(data) or (
-                curate_data_structure_object.data is not None
-                and get_value_from_dot_notation(
-                    curate_data_structure_object.data.get_dict_content(),
-                    self.pid_settings["path"],
-                )
-                == data
+            # If `data` is None, a new local id needs to be generated.
+            if data is not None:  # Otherwise, there is an error.
+                request_state.has_failed = True
+
+        return data if request_state.default_value else ""
+
+    def _is_pid_owner(self, data, data_id, request_state):
+        """Determine if a data holds a PID at `PID_PATH`.
+
+        With `PID_OWNERSHIP_INDEX`, the answer of the index is confirmed by
+        the PID read from the data, and its entry is corrected if the data
+        was modified elsewhere since it was indexed.
+
+        Args:
+            data: str - PID.
+            data_id: Primary key of the data.
+            request_state: RequestState
+
+        Returns:
+            bool
+        """
+        with request_state.time_phase("pid_value"):
+            pid_value = get_pid_value_for_data_id(
+                data_id, self.pid_settings.path
             )
-        except IndexError:
-            self.default_prefix = None
-            self.default_value = None
 
-            self.error_data = data
-        except AssertionError:
-            if record_host_pid_url != settings_host_pid_url:
-                self.default_prefix = None
-                self.default_value = None
+        is_pid_owner = pid_value == data
 
-            self.error_data = data
-        except Exception:
-            self.default_prefix = None
-            self.default_value = None
+        if settings.PID_OWNERSHIP_INDEX:
+            with request_state.time_phase("pid_owner"):
+                owner_id = pid_ownership_index.get_owner(
+                    data, self.pid_settings.path
+                )
 
-            # If `data` is None, a new local id needs to be generated.
-            if data is not None:  # Otherwise, there is an error.
-                self.has_failed = True
-        finally:
-            return data if self.default_value else ""
+                if (owner_id == data_id) != is_pid_owner:
+                    pid_ownership_index.update(data_id, pid_value)
 
-    def _retrieve_data(self, request):
+        return is_pid_owner
+
+    def _retrieve_data(self, request, request_state):
         """Retrieve module's data
 
         Args:
             request:
+            request_state: RequestState
 
         Returns:
 
         """
-        self.has_errors = None
-        self.default_value = None
-        self.default_prefix = None
         data = None
         module_id = None
 
@@ -171,68 +555,133 @@ class LocalIdRegistryModule(AbstractInputModule):
 
             # No data available and linked records not installed, a local ID needs to be
             # generated automatically.
-            if (
-                not data
-                and "core_linked_records_app" not in settings.INSTALLED_APPS
-            ):
-                data = generate_unique_local_id(settings.LOCAL_ID_LENGTH)
+            if not data and not self.config.linked_records_installed:
+                with request_state.time_phase("local_id"):
+                    data = reserve_local_id(settings.LOCAL_ID_LENGTH)
 
-            self.default_value = data
+            request_state.default_value = data
         elif request.method == "POST":  # Update the existing `data` field.
             data = request.POST.get("data", None)
             module_id = request.POST.get("module_id")
 
         # Additional checks if linked_records is installed.
-        if "core_linked_records_app" in settings.INSTALLED_APPS:
-            curate_data_structure = (
-                self._get_curate_datastructure_from_module_id(
-                    str(module_id), request
+        if self.config.linked_records_installed:
+            with request_state.time_phase("data_structure"):
+                curate_data_structure = (
+                    self._get_curate_datastructure_from_module_id(
+                        str(module_id),
+                        request,
+                        module_element=request_state.module_element,
+                    )
                 )
-            )
+
             data = self._init_prefix_and_record(
-                data, curate_data_structure.pk, request.user
+                data, curate_data_structure, request_state
             )
 
         return data
 
-    def _render_data(self, request):
+    @staticmethod
+    def _get_state(request_state):
+        """Return the state of the module after data retrieval
+
+        Args:
+            request_state: RequestState
+
+        Returns:
+            str - One of "info", "invalid", "failure", "checking", "pending",
+            "stale" or "success".
+        """
+        if (
+            not request_state.default_value
+            and not request_state.error_data
+            and not request_state.has_failed
+        ):
+            return "info"
+        if request_state.error_data:
+            return "invalid"
+        if request_state.has_failed:
+            return "failure"
+        if request_state.task_id is not None:
+            return "checking"
+        if request_state.verdict_pending:
+            return "pending"
+        if request_state.verdict_stale:
+            return "stale"
+        return "success"
+
+    def _render_data(self, request, request_state):
         """Return module's data rendering
 
         Args:
             request:
+            request_state: RequestState
 
         Returns:
 
         """
-        if "core_linked_records_app" not in settings.INSTALLED_APPS:
+        if not self.config.linked_records_installed:
             return ""
 
-        if (
-            not self.default_value
-            and not self.error_data
-            and not self.has_failed
-        ):
+        with request_state.time_phase("render_data"):
+            return self._render_status_box(
+                self._get_state(request_state), request_state.error_data
+            )
+
+    def _render_status_box(self, state, error_data=None):
+        """Return the status box of a module state
+
+        Args:
+            state: str - State returned by `_get_state`.
+            error_data: str - Invalid local id, for the "invalid" state.
+
+        Returns:
+            str
+        """
+        if state == "invalid":
+            return status_box_cache.get_dynamic_box(
+                state,
+                self.render_template,
+                {"icon": "fa-times-circle", "type": "danger"},
+                "Invalid local ID provided (%s). Select a valid prefix and "
+                "record name." % error_data,
+            )
+
+        if state == "info":
             context = {
                 "icon": "fa-info-circle",
                 "type": "info",
                 "message": "Enter the permanent link to this data. Record "
                 "name should match %s. Leave blank to generate the PID "
-                "automatically." % self.pid_settings["format"],
-            }
-        elif self.error_data:
-            context = {
-                "icon": "fa-times-circle",
-                "type": "danger",
-                "message": "Invalid local ID provided (%s). Select a valid "
-                "prefix and record name." % self.error_data,
+                "automatically." % self.pid_settings.format,
             }
-        elif self.has_failed:
+        elif state == "failure":
             context = {
                 "icon": "fa-times-circle",
                 "type": "danger",
                 "message": "An unexpected error occurred while checking record "
                 "existence. Please contact your administrator.",
             }
+        elif state == "checking":
+            context = {
+                "icon": "fa-spinner fa-pulse",
+                "type": "info",
+                "message": "Checking that the record is available...",
+            }
+        elif state == "pending":
+            context = {
+                "icon": "fa-hourglass-half",
+                "type": "warning",
+                "message": "Record existence is still being checked. Save the "
+                "local ID again in a few moments to confirm it is available.",
+            }
+        elif state == "stale":
+            context = {
+                "icon": "fa-history",
+                "type": "warning",
+                "message": "Record was available when last checked. Its "
+                "availability is being checked again.",
+            }
         else:
             context = {
                 "icon": "fa-check-circle",
@@ -240,45 +689,638 @@ class LocalIdRegistryModule(AbstractInputModule):
                 "message": "Record valid and available for registration!",
             }
 
-        return self.render_template(
-            "core_module_local_id_registry_app/pid_display_box.html", context
+        return status_box_cache.get_static_box(
+            (state, context["message"]), self.render_template, context
         )
 
-    def _render_module(self, request):
+    def _get_verdict(self, request_state):
+        """Return the outcome of the validation, applied by the client in
+        place of the rendered status box.
+
+        Args:
+            request_state: RequestState
+
+        Returns:
+            dict - State of the module, prefix and record name of the local
+            id, and code of the message to display. The `task_id` of the
+            checks left to a task is added if any.
+        """
+        state = self._get_state(request_state)
+        verdict = {
+            "state": state,
+            "prefix": request_state.default_prefix,
+            "value": request_state.default_value,
+            "message_code": (
+                request_state.error_code if state == "invalid" else state
+            ),
+        }
+
+        if request_state.task_id is not None:
+            verdict["task_id"] = request_state.task_id
+
+        return verdict
+
+    def _render_input(self, default_value):
+        """Render the default input, as `AbstractInputModule._render_module`
+
+        Args:
+            default_value: str - Value of the input.
+
+        Returns:
+            str
+        """
+        params = {}
+
+        if self.label is not None:
+            params.update({"label": self.label})
+
+        if default_value is not None:
+            params.update({"default_value": default_value})
+
+        if self.disabled is not None:
+            params.update({"disabled": self.disabled})
+
+        if self.placeholder is not None:
+            params.update({"placeholder": self.placeholder})
+
+        return AbstractModule.render_template(
+            "core_parser_app/builtin/input.html", params
+        )
+
+    def _render_module(self, request, request_state):
         """Create HTML representation of the module
 
         Args:
             request:
+            request_state: RequestState
 
         Returns:
 
         """
-        # Create the default input module
-        module_template = super()._render_module(request)
+        with request_state.time_phase("render_module"):
+            # Create the default input module
+            module_template = self._render_input(request_state.default_value)
 
-        if "core_linked_records_app" in settings.INSTALLED_APPS:
-            from core_linked_records_app.utils.providers import ProviderManager
+            if self.config.linked_records_installed:
+                resolved_provider = get_resolved_provider(
+                    self.pid_settings.system, self.pid_settings.prefixes
+                )
 
-            pid_default_url = (
-                ProviderManager()
-                .get(self.pid_settings["system"])
-                .provider_lookup_url
+                module_template = pid_edit_input_cache.render(
+                    AbstractInputModule.render_template,
+                    resolved_provider.host_url,
+                    self.pid_settings.prefixes,
+                    request_state.default_prefix,
+                    module_template,
+                )
+
+        return module_template
+
+
+def _get_pid_verdict_in_thread(pid, timeout):
+    """Call `get_pid_verdict` from a thread not managed by Django.
+
+    Args:
+        pid: str
+        timeout: float - Time, in seconds, to wait for the provider.
+
+    Returns:
+        tuple - Verdict and whether it is stale.
+    """
+    try:
+        return get_pid_verdict(pid, timeout)
+    finally:
+        # Checks without deadline query the data in this thread: release
+        # its connection.
+        close_old_connections()
+
+
+class AsyncLocalIdRegistryModule(LocalIdRegistryModule):
+    """Local Id Registry Module serving requests asynchronously.
+
+    Blocking calls run in threads so that a worker can serve many
+    validations concurrently. The ORM calls of a request run one after the
+    other in its thread, while the PID existence check runs in a separate
+    thread. Module discovery and the parser call the module synchronously:
+    the view is registered as `LocalIdRegistryModule`.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """Return the asynchronous view function
+
+        Args:
+            **initkwargs:
+
+        Returns:
+        """
+        cls._check_initkwargs(initkwargs)
+
+        async def view(request, *args, **kwargs):
+            return await cls.get_shared_instance().async_dispatch(
+                request, *args, **kwargs
             )
 
-            context = {
-                "pid_host_url": (
-                    pid_default_url
-                    if pid_default_url.rsplit("/", 1)[-1] != ""
-                    else pid_default_url.rsplit("/", 1)[0]
-                ),
-                "pid_prefixes": self.pid_settings["prefixes"],
-                "default_prefix": self.default_prefix,
-                "default_input_module": module_template,
+        view.view_class = LocalIdRegistryModule
+        view.view_initkwargs = initkwargs
+        return markcoroutinefunction(view)
+
+    async def async_dispatch(self, request, *args, **kwargs):
+        """Dispatch the request to the matching handler
+
+        Args:
+            request:
+            *args:
+            **kwargs:
+
+        Returns:
+        """
+        if request.method == "POST":
+            request_state = self._create_request_state()
+            response = await self._async_post(request, request_state)
+            report_phase_timer(request_state.phase_timer, request, response)
+
+            return response
+
+        # The module is loaded once per form: it is processed as by the
+        # synchronous view.
+        return await sync_to_async(self.dispatch)(request, *args, **kwargs)
+
+    async def _async_post(self, request, request_state):
+        """Manage POST requests, as `AbstractModule.post`
+
+        Args:
+            request:
+            request_state: RequestState
+
+        Returns:
+        """
+        if "module_id" not in request.POST:
+            return HttpResponseBadRequest(
+                {"error": 'No "module_id" parameter provided'}
+            )
+
+        try:
+            # The element is retrieved with the curate data structure, when
+            # linked records are installed.
+            data = await self._async_retrieve_data(request, request_state)
+            module_element = await sync_to_async(self._get_module_element)(
+                request.POST["module_id"], request, request_state
+            )
+            options = module_element.options
+            options["data"] = data
+            module_element.options = options
+            await sync_to_async(data_structure_element_api.upsert)(
+                module_element, request
+            )
+        except Exception as e:
+            raise ModuleError(
+                "Something went wrong during module update: " + str(e)
+            )
+
+        return self._build_post_response(request, request_state)
+
+    async def _async_retrieve_data(self, request, request_state):
+        """Retrieve module's data, as `_retrieve_data`
+
+        Args:
+            request:
+            request_state: RequestState
+
+        Returns:
+        """
+        data = request.POST.get("data", None)
+        module_id = request.POST.get("module_id")
+
+        if not self.config.linked_records_installed:
+            return data
+
+        # The provider of the PID check is resolved in the thread of the
+        # request: the check is started first, so that the resolution is not
+        # queued behind the curate data structure lookup.
+        pid_defined, curate_data_structure = await asyncio.gather(
+            self._async_is_pid_defined(data, request_state),
+            self._async_get_curate_data_structure(
+                str(module_id), request, request_state
+            ),
+        )
+
+        return await sync_to_async(self._init_prefix_and_record)(
+            data, curate_data_structure, request_state, pid_defined=pid_defined
+        )
+
+    async def _async_get_curate_data_structure(
+        self, module_id, request, request_state
+    ):
+        """Retrieve the curate data structure containing the module.
+
+        Args:
+            module_id:
+            request:
+            request_state: RequestState
+
+        Returns:
+            CurateDataStructure
+        """
+        with request_state.time_phase("data_structure"):
+            return await sync_to_async(self._get_module_curate_data_structure)(
+                module_id, request, request_state
+            )
+
+    def _get_module_curate_data_structure(
+        self, module_id, request, request_state
+    ):
+        """Retrieve the element of the module, then the curate data structure
+        containing it, in the thread of the request.
+
+        Args:
+            module_id:
+            request:
+            request_state: RequestState
+
+        Returns:
+            CurateDataStructure
+        """
+        return self._get_curate_datastructure_from_module_id(
+            module_id,
+            request,
+            module_element=self._get_module_element(
+                module_id, request, request_state
+            ),
+        )
+
+    async def _async_is_pid_defined(self, data, request_state):
+        """Check if a PID is defined, if it is valid.
+
+        Args:
+            data:
+            request_state: RequestState
+
+        Returns:
+            bool - `is_pid_defined` result, or None if it is not known.
+        """
+        # Checks left to a task are not done by the request.
+        if data is None or settings.PID_CHECK_ASYNC_TASKS:
+            return None
+
+        try:
+            resolved_provider = await sync_to_async(get_resolved_provider)(
+                self.pid_settings.system, self.pid_settings.prefixes
+            )
+            pid_validator = get_pid_validator(
+                self.pid_settings.format,
+                self.pid_settings.prefix_set,
+                resolved_provider.lookup_url,
+            )
+
+            if pid_validator.validate(data)[3] != PidVerdict.VALID:
+                return None
+
+            # The check may wait on the provider: it runs outside of the
+            # thread shared by the ORM calls of the request.
+            with request_state.time_phase("pid_defined"):
+                (
+                    pid_defined,
+                    request_state.verdict_stale,
+                ) = await sync_to_async(
+                    _get_pid_verdict_in_thread, thread_sensitive=False
+                )(
+                    data, request_state.get_remaining_time()
+                )
+
+            return pid_defined
+        except Exception:  # Check done again, and reported, with the record.
+            return None
+
+
+def _load_batch_items(body):
+    """Load the list of items to validate from a request body.
+
+    Args:
+        body:
+
+    Returns:
+        list - Items, as dictionaries with `module_id` and `data` keys.
+    """
+    try:
+        items = json.loads(body)
+    except ValueError:
+        raise ValueError("Request body is not valid JSON.")
+
+    if not isinstance(items, list) or not all(
+        isinstance(item, dict)
+        and "module_id" in item
+        and (item.get("data") is None or isinstance(item["data"], str))
+        for item in items
+    ):
+        raise ValueError(
+            "Request body should be a list of {module_id, data} objects."
+        )
+
+    if len(items) > settings.BATCH_VALIDATION_MAX_ITEMS:
+        raise ValueError(
+            "Request body should contain at most %d items."
+            % settings.BATCH_VALIDATION_MAX_ITEMS
+        )
+
+    return items
+
+
+def _get_pids_defined(pid_settings, data_list):
+    """Check once each distinct PID that can be checked for existence.
+
+    Args:
+        pid_settings:
+        data_list:
+
+    Returns:
+        dict - `is_pid_defined` result for each valid PID.
+    """
+    pid_validator = get_pid_validator(
+        pid_settings.format,
+        pid_settings.prefix_set,
+        get_resolved_provider(
+            pid_settings.system, pid_settings.prefixes
+        ).lookup_url,
+    )
+
+    # Failed checks are done again, and reported, for each item.
+    return are_pids_defined(
+        data
+        for data in set(data_list)
+        if data is not None
+        and pid_validator.validate(data)[3] == PidVerdict.VALID
+    )
+
+
+@require_POST
+def validate_local_ids(request):
+    """Validate a list of local ids in a single request.
+
+    The request body is a JSON list of at most `BATCH_VALIDATION_MAX_ITEMS`
+    `{"module_id": ..., "data": ...}` objects. Items share the provider
+    resolution and the validator, and the existence of each distinct PID is
+    checked once.
+
+    Args:
+        request:
+
+    Returns:
+        HttpResponse - JSON object whose `results` contains, for each item,
+        the retained data, the state of the module and its status box.
+    """
+    config = get_config()
+
+    if not config.linked_records_installed:
+        return HttpResponseBadRequest(
+            "Local IDs can only be validated with PIDs."
+        )
+
+    try:
+        items = _load_batch_items(request.body)
+    except ValueError as exception:
+        return HttpResponseBadRequest(str(exception))
+
+    pids_defined = _get_pids_defined(
+        config.pid_settings,
+        [item.get("data") for item in items],
+    )
+    results = list()
+
+    module = LocalIdRegistryModule.get_shared_instance()
+
+    for item in items:
+        request_state = RequestState()
+        data = item.get("data")
+
+        try:
+            curate_data_structure = (
+                module._get_curate_datastructure_from_module_id(
+                    str(item["module_id"]), request
+                )
+            )
+            data = module._check_local_id(
+                data,
+                curate_data_structure.data_id,
+                request_state,
+                pid_defined=pids_defined.get(data),
+            )
+        except Exception:
+            request_state.has_failed = True
+            data = ""
+
+        results.append(
+            {
+                "module_id": item["module_id"],
+                "data": data,
+                "state": module._get_state(request_state),
+                "html": module._render_data(request, request_state),
             }
+        )
+
+    return HttpResponse(
+        json.dumps({"results": results}), content_type="application/json"
+    )
+
+
+def _get_page_parameter(request, name, default, maximum=None):
+    """Read a positive integer from the query string.
+
+    Args:
+        request:
+        name: str - Name of the parameter.
+        default: int - Value if the parameter is not set.
+        maximum: int - Maximum value, if bounded.
 
-            module_template = AbstractInputModule.render_template(
-                "core_module_local_id_registry_app/pid_edit_input.html",
-                context=context,
+    Returns:
+        int
+
+    Raises:
+        ValueError: If the parameter is not a positive integer.
+    """
+    value = int(request.GET.get(name, default))
+
+    if value < 0:
+        raise ValueError("%s must be positive." % name)
+
+    return value if maximum is None else min(value, maximum)
+
+
+@require_GET
+def search_prefixes(request):
+    """Search the PID prefixes starting with a query, one page at a time.
+
+    The query string contains the start of the prefixes `q`, the number of
+    matches to skip `offset` and the size of the page `limit`.
+
+    Args:
+        request:
+
+    Returns:
+        HttpResponse - JSON object whose `results` contains the prefixes of
+        the page, `total` the number of matches and `has_more` whether
+        further pages exist.
+    """
+    config = get_config()
+
+    if not config.linked_records_installed:
+        return HttpResponseBadRequest("Prefixes are only available with PIDs.")
+
+    try:
+        offset = _get_page_parameter(request, "offset", 0)
+        limit = _get_page_parameter(
+            request,
+            "limit",
+            settings.PREFIX_SEARCH_PAGE_SIZE,
+            settings.PREFIX_SEARCH_MAX_PAGE_SIZE,
+        )
+    except ValueError as exception:
+        return HttpResponseBadRequest(str(exception))
+
+    results, total = config.pid_settings.prefix_index.search(
+        request.GET.get("q", ""), offset, limit
+    )
+
+    return HttpResponse(
+        json.dumps(
+            {
+                "results": results,
+                "total": total,
+                "has_more": offset + len(results) < total,
+            }
+        ),
+        content_type="application/json",
+    )
+
+
+def _get_validation_manifest():
+    """Return the manifest of the local id checks, if PIDs are available.
+
+    Returns:
+        tuple - Version and JSON content of the manifest, or None.
+    """
+    if not get_config().linked_records_installed:
+        return None
+
+    module = LocalIdRegistryModule.get_shared_instance()
+
+    return validation_manifest_cache.get(
+        module.pid_settings.format,
+        module.pid_settings.prefix_set,
+        get_resolved_provider(
+            module.pid_settings.system, module.pid_settings.prefixes
+        ).lookup_url,
+        {
+            state: module._render_status_box(
+                state, STATUS_BOX_MESSAGE_PLACEHOLDER
             )
+            for state in MODULE_STATES
+        },
+    )
 
-        return module_template
+
+def _get_validation_manifest_etag(request):
+    """Return the entity tag of the validation manifest.
+
+    Args:
+        request:
+
+    Returns:
+        str
+    """
+    manifest = _get_validation_manifest()
+
+    return manifest[0] if manifest is not None else None
+
+
+@require_GET
+@condition(etag_func=_get_validation_manifest_etag)
+def get_validation_manifest(request):
+    """Return the checks of the local ids which the client can do itself.
+
+    The manifest contains the provider `host_url`, the `prefixes` and the
+    record name `format`, as a JavaScript regular expression, and the
+    `status_boxes` displayed for each state of the module. Prefixes or format
+    are null if they cannot be checked by the client. The manifest is
+    versioned by its `version`, also sent as entity tag.
+
+    Args:
+        request:
+
+    Returns:
+        HttpResponse
+    """
+    manifest = _get_validation_manifest()
+
+    if manifest is None:
+        return HttpResponseBadRequest(
+            "Local IDs can only be validated with PIDs."
+        )
+
+    response = HttpResponse(manifest[1], content_type="application/json")
+    patch_cache_control(response, max_age=settings.VALIDATION_MANIFEST_MAX_AGE)
+
+    return response
+
+
+def _is_check_task_verdict(verdict):
+    """Determine if a task result is a verdict of `check_local_id_task`.
+
+    Args:
+        verdict: Result of the task.
+
+    Returns:
+        bool
+    """
+    return (
+        isinstance(verdict, dict)
+        and verdict.keys() == CHECK_TASK_VERDICT_KEYS
+        and verdict["state"] in MODULE_STATES
+        and isinstance(verdict["html"], str)
+    )
+
+
+@require_GET
+def get_local_id_check(request):
+    """Return the outcome of the checks left to a task by a module save.
+
+    The query string contains the signed `task_id` returned by the save.
+    Results which are not verdicts of `check_local_id_task` are reported as
+    failures.
+
+    Args:
+        request:
+
+    Returns:
+        HttpResponse - Verdict of the local id, as returned to the module
+        saves, with its status box `html`. The state is "checking" until the
+        task is done.
+    """
+    if not get_config().linked_records_installed:
+        return HttpResponseBadRequest(
+            "Local IDs can only be validated with PIDs."
+        )
+
+    if "task_id" not in request.GET:
+        return HttpResponseBadRequest('No "task_id" parameter provided')
+
+    try:
+        task_id = CHECK_TASK_SIGNER.unsign(request.GET["task_id"])
+    except BadSignature:
+        return HttpResponseBadRequest("Invalid task id.")
+
+    module = LocalIdRegistryModule.get_shared_instance()
+    result = AsyncResult(task_id)
+    verdict = result.result if result.successful() else None
+
+    if not _is_check_task_verdict(verdict):
+        state = "checking" if not result.ready() else "failure"
+        verdict = {
+            "state": state,
+            "prefix": None,
+            "value": None,
+            "message_code": state,
+            "html": module._render_status_box(state),
+        }
+
+    return HttpResponse(json.dumps(verdict), content_type="application/json")
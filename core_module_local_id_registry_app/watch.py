@@ -0,0 +1,103 @@
+"""Signals to keep the local id registry module caches up to date"""
+
+from django.conf import settings as conf_settings
+from django.db.models.signals import post_save, post_delete
+
+from core_main_app.components.data.models import Data
+from core_module_local_id_registry_app import settings
+from core_module_local_id_registry_app.config import get_config
+from core_module_local_id_registry_app.utils.data import (
+    clear_pid_value_for_data_id,
+    get_cached_pid_value_for_data_id,
+    get_pid_value_for_data_id,
+)
+from core_module_local_id_registry_app.utils.ownership import (
+    pid_ownership_index,
+)
+from core_module_local_id_registry_app.utils.pid import clear_pid_verdict
+
+
+def init():
+    """Connect to Data object events."""
+    post_save.connect(clear_data_caches, sender=Data)
+    post_delete.connect(clear_data_caches, sender=Data)
+    post_save.connect(index_data_pid, sender=Data)
+    post_delete.connect(unindex_data_pid, sender=Data)
+
+
+def _get_saved_pid(instance, config):
+    """Return the PID of a saved Data. With MONGODB_INDEXING, the content of
+    the Data is only stored in MongoDB, from which the PID is read.
+
+    Args:
+        instance:
+        config: LocalIdRegistryConfig
+
+    Returns:
+        Value at `PID_PATH`, `None` if the Data has no PID.
+    """
+    if conf_settings.MONGODB_INDEXING:
+        return get_pid_value_for_data_id(
+            instance.pk, config.pid_settings.path, use_cache=False
+        )
+
+    return config.get_value_from_dot_notation(
+        instance.dict_content or {}, config.pid_settings.path
+    )
+
+
+def clear_data_caches(
+    sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Remove cached values computed from a Data that has been modified.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    config = get_config()
+
+    if config.linked_records_installed:
+        # Previous PID of the data, released if the PID has changed, if it
+        # is cached.
+        clear_pid_verdict(
+            get_cached_pid_value_for_data_id(
+                instance.pk, config.pid_settings.path
+            )
+        )
+        # Current PID of the data, assigned during the save.
+        clear_pid_verdict(_get_saved_pid(instance, config))
+
+    clear_pid_value_for_data_id(instance.pk)
+
+
+def index_data_pid(
+    sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Update the PID ownership index with the PID of a saved Data.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    config = get_config()
+
+    if config.linked_records_installed and settings.PID_OWNERSHIP_INDEX:
+        pid_ownership_index.update(
+            instance.pk, _get_saved_pid(instance, config)
+        )
+
+
+def unindex_data_pid(
+    sender, instance: Data, **kwargs  # noqa, pylint: disable=unused-argument
+):
+    """Remove the PID of a deleted Data from the PID ownership index.
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    pid_ownership_index.remove(instance.pk)
@@ -0,0 +1,293 @@
+"""Benchmark runner for the local id registry module"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from os.path import dirname, join
+from statistics import median
+from time import perf_counter_ns
+
+from core_module_local_id_registry_app.views.request_state import (
+    RequestState,
+)
+from tests.benchmarks.scenarios import SCENARIOS
+
+BASELINES_PATH = join(dirname(__file__), "baselines.json")
+
+PHASES = (
+    "retrieve_data",
+    "init_prefix_and_record",
+    "render_data",
+    "render_module",
+)
+
+# Differences below these values are considered as noise.
+MIN_TIME_DELTA_US = 5.0
+MIN_MEMORY_DELTA_KIB = 1.0
+
+
+def _run_phases(scenario):
+    """Process the request of the scenario with a new request state.
+
+    Args:
+        scenario: Scenario
+
+    Yields:
+        tuple - Phase name and function running the phase.
+    """
+    for cache in scenario.cold_caches:
+        cache.clear()
+
+    module = scenario.build_module()
+    request = scenario.build_request()
+    request_state = RequestState()
+
+    yield "retrieve_data", lambda: module._retrieve_data(
+        request, request_state
+    )
+
+    if module.pid_settings is not None:
+        curate_data_structure = (
+            module._get_curate_datastructure_from_module_id("1", request)
+        )
+        yield "init_prefix_and_record", lambda: (
+            module._init_prefix_and_record(
+                scenario.data, curate_data_structure, request_state
+            )
+        )
+
+    yield "render_data", lambda: module._render_data(request, request_state)
+    yield "render_module", lambda: module._render_module(
+        request, request_state
+    )
+
+
+def _measure_time(scenario, iterations):
+    """Measure the duration of each phase.
+
+    Args:
+        scenario: Scenario
+        iterations: int
+
+    Returns:
+        dict - Median and 95th percentile duration of each phase, in
+        microseconds.
+    """
+    durations = dict()
+
+    # Warm up the caches, as in a running server.
+    for _, run_phase in _run_phases(scenario):
+        run_phase()
+
+    for _ in range(iterations):
+        for phase, run_phase in _run_phases(scenario):
+            start = perf_counter_ns()
+            run_phase()
+            durations.setdefault(phase, list()).append(
+                (perf_counter_ns() - start) / 1000
+            )
+
+    return {
+        phase: {
+            "median_us": round(median(values), 2),
+            "p95_us": round(sorted(values)[int(0.95 * (len(values) - 1))], 2),
+        }
+        for phase, values in durations.items()
+    }
+
+
+def _measure_memory(scenario):
+    """Measure the memory allocated by each phase.
+
+    Args:
+        scenario: Scenario
+
+    Returns:
+        dict - Peak of memory allocated, in KiB, and number of memory blocks
+        still allocated at the end of each phase.
+    """
+    allocations = dict()
+    tracemalloc.start()
+
+    try:
+        for phase, run_phase in _run_phases(scenario):
+            tracemalloc.reset_peak()
+            start_size = tracemalloc.get_traced_memory()[0]
+            start_blocks = sys.getallocatedblocks()
+            run_phase()
+            allocations[phase] = {
+                "peak_kib": round(
+                    (tracemalloc.get_traced_memory()[1] - start_size) / 1024,
+                    2,
+                ),
+                "blocks": sys.getallocatedblocks() - start_blocks,
+            }
+    finally:
+        tracemalloc.stop()
+
+    return allocations
+
+
+def run_benchmarks(iterations, scenario_names=None):
+    """Run the benchmark scenarios.
+
+    Args:
+        iterations: int - Number of measures for each phase.
+        scenario_names: list - Names of the scenarios to run. All scenarios
+            are run if not set.
+
+    Returns:
+        dict - Measures of each phase, for each scenario.
+    """
+    results = dict()
+
+    for scenario in SCENARIOS:
+        if scenario_names and scenario.name not in scenario_names:
+            continue
+
+        with scenario.setup():
+            timings = _measure_time(scenario, iterations)
+            allocations = _measure_memory(scenario)
+
+        results[scenario.name] = {
+            phase: {**timings[phase], **allocations[phase]}
+            for phase in PHASES
+            if phase in timings
+        }
+
+    return results
+
+
+def compare_results(baselines, results, tolerance):
+    """List the measures exceeding their baseline.
+
+    Args:
+        baselines: dict - Stored results.
+        results: dict - Current results.
+        tolerance: float - Accepted increase, as a ratio of the baseline.
+
+    Returns:
+        list - Scenario, phase, measure, baseline and current value of each
+        regression.
+    """
+    regressions = list()
+
+    for scenario_name, phases in results.items():
+        for phase, measures in phases.items():
+            baseline = baselines.get(scenario_name, dict()).get(phase)
+
+            if baseline is None:
+                continue
+
+            for measure, min_delta in (
+                ("median_us", MIN_TIME_DELTA_US),
+                ("peak_kib", MIN_MEMORY_DELTA_KIB),
+            ):
+                if (
+                    measures[measure] > baseline[measure] * (1 + tolerance)
+                    and measures[measure] - baseline[measure] > min_delta
+                ):
+                    regressions.append(
+                        (
+                            scenario_name,
+                            phase,
+                            measure,
+                            baseline[measure],
+                            measures[measure],
+                        )
+                    )
+
+    return regressions
+
+
+def _print_results(results):
+    """Print the results as a table.
+
+    Args:
+        results: dict
+    """
+    print(
+        "%-24s %-24s %12s %12s %10s %8s"
+        % ("scenario", "phase", "median_us", "p95_us", "peak_kib", "blocks")
+    )
+
+    for scenario_name, phases in results.items():
+        for phase, measures in phases.items():
+            print(
+                "%-24s %-24s %12.2f %12.2f %10.2f %8d"
+                % (
+                    scenario_name,
+                    phase,
+                    measures["median_us"],
+                    measures["p95_us"],
+                    measures["peak_kib"],
+                    measures["blocks"],
+                )
+            )
+
+
+def main(argv):
+    """Run the benchmarks from the command line.
+
+    Args:
+        argv: list - Command line arguments.
+
+    Returns:
+        int - Exit status, 1 if a regression is detected.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the local id registry module."
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=200,
+        help="number of measures for each phase",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="scenario to run, can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--baselines", default=BASELINES_PATH, help="path to the baselines"
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the results as the new baselines",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="compare the results to the baselines",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="accepted increase over the baselines, as a ratio",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.iterations, args.scenario)
+    _print_results(results)
+
+    if args.save:
+        with open(args.baselines, "w") as baselines_file:
+            json.dump(results, baselines_file, indent=2, sort_keys=True)
+            baselines_file.write("\n")
+
+    if not args.compare:
+        return 0
+
+    with open(args.baselines) as baselines_file:
+        baselines = json.load(baselines_file)
+
+    regressions = compare_results(baselines, results, args.tolerance)
+
+    for regression in regressions:
+        print("REGRESSION %s %s %s: %s -> %s" % regression)
+
+    return 1 if regressions else 0
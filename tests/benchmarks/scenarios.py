@@ -0,0 +1,244 @@
+"""Benchmark scenarios for the local id registry module"""
+
+from contextlib import ExitStack
+from unittest.mock import patch, Mock
+
+from core_curate_app.components.curate_data_structure.models import (
+    CurateDataStructure,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.data import pid_value_cache
+from core_module_local_id_registry_app.utils.data_structure import (
+    curate_data_structure_id_cache,
+)
+from core_module_local_id_registry_app.utils.pid import (
+    pid_verdict_cache,
+    provider_breaker,
+    stale_pid_verdict_cache,
+)
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from core_module_local_id_registry_app.utils.rendering import (
+    pid_edit_input_cache,
+    status_box_cache,
+)
+from core_module_local_id_registry_app.views.views import LocalIdRegistryModule
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import (
+    MockData,
+    MockPID,
+    MockProvider,
+)
+
+
+def _build_document(pid, size):
+    """Build the dict content of a data holding the PID.
+
+    Args:
+        pid: str
+        size: int - Number of records in the document.
+
+    Returns:
+        dict
+    """
+    path_keys = test_settings.PID_PATH.split(".")
+    document = {
+        "records": [
+            {"name": "record_%d" % index, "value": index}
+            for index in range(size)
+        ]
+    }
+    node = document
+
+    for key in path_keys[:-1]:
+        node = node.setdefault(key, dict())
+
+    node[path_keys[-1]] = pid
+    return document
+
+
+class Scenario:
+    """Request processed by the module, along with its mocked environment"""
+
+    def __init__(
+        self,
+        name,
+        method,
+        data,
+        linked_records=True,
+        pid_defined=False,
+        prefix_count=1,
+        document_size=0,
+        cold_caches=(),
+    ):
+        """Initialize the scenario
+
+        Args:
+            name: str
+            method: str - "GET" or "POST".
+            data: str - Local id sent by the client.
+            linked_records: bool - Whether linked records is installed.
+            pid_defined: bool - Whether the PID is already assigned.
+            prefix_count: int - Number of prefixes available.
+            document_size: int - Number of records in the data owning the
+                PID.
+            cold_caches: tuple - Caches emptied before each run.
+        """
+        self.name = name
+        self.method = method
+        self.data = data
+        self.linked_records = linked_records
+        self.pid_defined = pid_defined
+        self.prefixes = ["mock_prefix"] + [
+            "mock_prefix_%d" % index for index in range(1, prefix_count)
+        ]
+        self.mock_data = MockData(
+            dict_content=_build_document(data, document_size)
+        )
+        self.cold_caches = cold_caches
+
+    def _query_pid_value(self, data_id, pid_path):
+        """Read the PID from the document of the mock data"""
+        from core_linked_records_app.utils.dict import (
+            get_value_from_dot_notation,
+        )
+
+        return get_value_from_dot_notation(
+            self.mock_data.get_dict_content(), pid_path
+        )
+
+    def setup(self):
+        """Patch the environment of the module and empty the caches.
+
+        Returns:
+            ExitStack - Closed to restore the environment.
+        """
+        exit_stack = ExitStack()
+        # Run last, once the settings are restored.
+        exit_stack.callback(reload_config)
+
+        if self.linked_records:
+            if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+                test_settings.INSTALLED_APPS.append("core_linked_records_app")
+                exit_stack.callback(
+                    test_settings.INSTALLED_APPS.remove,
+                    "core_linked_records_app",
+                )
+        elif "core_linked_records_app" in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+            exit_stack.callback(
+                test_settings.INSTALLED_APPS.append, "core_linked_records_app"
+            )
+
+        for target, kwargs in (
+            (
+                "core_linked_records_app.utils.providers.ProviderManager.get",
+                {"return_value": MockProvider()},
+            ),
+            (
+                "core_linked_records_app.system.data.api.is_pid_defined",
+                {"return_value": self.pid_defined},
+            ),
+            (
+                "core_module_local_id_registry_app.utils.data."
+                "_query_pid_value",
+                {"side_effect": self._query_pid_value},
+            ),
+            (
+                "core_module_local_id_registry_app.views.views."
+                "LocalIdRegistryModule._get_curate_datastructure_from_module_id",
+                {
+                    "return_value": Mock(
+                        spec=CurateDataStructure,
+                        pk=1,
+                        data_id=self.mock_data.pk,
+                    )
+                },
+            ),
+            # The default input is rendered by the parser.
+            (
+                "core_module_local_id_registry_app.views.views."
+                "LocalIdRegistryModule._render_input",
+                {"return_value": '<input type="text" class="form-control">'},
+            ),
+            (
+                "core_module_local_id_registry_app.views.views."
+                "reserve_local_id",
+                {"return_value": "mock_local_id"},
+            ),
+        ):
+            exit_stack.enter_context(patch(target, **kwargs))
+
+        exit_stack.enter_context(
+            patch(
+                "core_linked_records_app.settings.ID_PROVIDER_PREFIXES",
+                self.prefixes,
+            )
+        )
+        reload_config()
+
+        for cache in (
+            provider_cache,
+            pid_verdict_cache,
+            stale_pid_verdict_cache,
+            provider_breaker,
+            pid_value_cache,
+            curate_data_structure_id_cache,
+            status_box_cache,
+            pid_edit_input_cache,
+        ):
+            cache.clear()
+
+        return exit_stack
+
+    def build_request(self):
+        """Build the request sent by the client.
+
+        Returns:
+            Mock
+        """
+        request = Mock()
+        request.method = self.method
+        request.user = create_mock_user("1")
+        request.build_absolute_uri = lambda char: ""
+        params = {"module_id": 1}
+
+        if self.data is not None:
+            params["data"] = self.data
+
+        setattr(request, self.method, params)
+        return request
+
+    @staticmethod
+    def build_module():
+        """Return the module processing the requests, as served by the view.
+
+        Returns:
+            LocalIdRegistryModule
+        """
+        return LocalIdRegistryModule.get_shared_instance()
+
+
+SCENARIOS = [
+    Scenario("get_valid", "GET", str(MockPID())),
+    Scenario("get_empty", "GET", None),
+    Scenario("get_without_pid", "GET", None, linked_records=False),
+    Scenario("post_valid", "POST", str(MockPID())),
+    Scenario("post_invalid_host", "POST", "mock_incorrect_url"),
+    Scenario("post_invalid_format", "POST", str(MockPID(value="mock record"))),
+    Scenario("post_owned_pid", "POST", str(MockPID()), pid_defined=True),
+    Scenario(
+        "post_large_document",
+        "POST",
+        str(MockPID()),
+        pid_defined=True,
+        document_size=10000,
+        cold_caches=(pid_value_cache,),
+    ),
+    Scenario(
+        "post_large_prefix_list",
+        "POST",
+        str(MockPID(prefix="mock_prefix_999")),
+        prefix_count=1000,
+    ),
+]
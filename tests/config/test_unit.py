@@ -0,0 +1,128 @@
+"""Test units"""
+
+from unittest.case import TestCase
+
+from core_module_local_id_registry_app.config import (
+    PidSettings,
+    build_config,
+    get_config,
+    reload_config,
+)
+from tests import test_settings
+
+
+class TestBuildConfigWithPID(TestCase):
+    """Test Build Config With PID"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+
+        self.addCleanup(reload_config)
+        self.config = build_config()
+
+    def test_linked_records_installed(self):
+        """test_linked_records_installed"""
+
+        self.assertTrue(self.config.linked_records_installed)
+
+    def test_prefixes_are_tuple(self):
+        """test_prefixes_are_tuple"""
+
+        self.assertEqual(
+            self.config.pid_settings.prefixes,
+            tuple(test_settings.ID_PROVIDER_PREFIXES),
+        )
+
+    def test_prefix_set_contains_prefixes(self):
+        """test_prefix_set_contains_prefixes"""
+
+        self.assertEqual(
+            self.config.pid_settings.prefix_set,
+            frozenset(test_settings.ID_PROVIDER_PREFIXES),
+        )
+
+    def test_prefix_index_shares_prefix_set(self):
+        """test_prefix_index_shares_prefix_set"""
+
+        self.assertIs(
+            self.config.pid_settings.prefix_index.prefix_set,
+            self.config.pid_settings.prefix_set,
+        )
+
+    def test_scripts_are_tuple(self):
+        """test_scripts_are_tuple"""
+
+        self.assertEqual(len(self.config.scripts), 1)
+
+    def test_module_is_enabled(self):
+        """test_module_is_enabled"""
+
+        self.assertFalse(self.config.disabled)
+
+
+class TestBuildConfigWithoutPID(TestCase):
+    """Test Build Config Without PID"""
+
+    def setUp(self) -> None:
+        while "core_linked_records_app" in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+
+        self.addCleanup(reload_config)
+        self.config = build_config()
+
+    def test_linked_records_not_installed(self):
+        """test_linked_records_not_installed"""
+
+        self.assertFalse(self.config.linked_records_installed)
+
+    def test_pid_settings_is_none(self):
+        """test_pid_settings_is_none"""
+
+        self.assertIsNone(self.config.pid_settings)
+
+    def test_module_is_disabled(self):
+        """test_module_is_disabled"""
+
+        self.assertTrue(self.config.disabled)
+
+
+class TestConfigIsFrozen(TestCase):
+    """Test Config Is Frozen"""
+
+    def test_config_attribute_cannot_be_set(self):
+        """test_config_attribute_cannot_be_set"""
+
+        with self.assertRaises(AttributeError):
+            get_config().disabled = True
+
+    def test_config_attribute_cannot_be_deleted(self):
+        """test_config_attribute_cannot_be_deleted"""
+
+        with self.assertRaises(AttributeError):
+            del get_config().disabled
+
+    def test_pid_settings_attribute_cannot_be_set(self):
+        """test_pid_settings_attribute_cannot_be_set"""
+
+        pid_settings = PidSettings("path", "format", "system", ["prefix"])
+
+        with self.assertRaises(AttributeError):
+            pid_settings.prefixes = ()
+
+
+class TestGetConfig(TestCase):
+    """Test Get Config"""
+
+    def test_returns_same_config(self):
+        """test_returns_same_config"""
+
+        self.assertIs(get_config(), get_config())
+
+    def test_reload_replaces_config(self):
+        """test_reload_replaces_config"""
+
+        config = get_config()
+
+        self.assertIsNot(reload_config(), config)
+        self.assertIsNot(get_config(), config)
@@ -0,0 +1,172 @@
+"""Test units"""
+
+import json
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.core.management import call_command, CommandError
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import MockPID, MockProvider
+
+
+class TestAuditLocalIds(TestCase):
+    """Test Audit Local Ids"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+
+        self.records = [
+            (1, str(MockPID())),
+            (2, str(MockPID(prefix="other_prefix"))),
+            (3, None),
+            (4, str(MockPID(value="mock record"))),
+        ]
+        patch_iter_pid_values = patch(
+            "core_module_local_id_registry_app.management.commands."
+            "auditlocalids.iter_pid_values",
+            side_effect=lambda pid_path, start_after, chunk_size: iter(
+                [
+                    record
+                    for record in self.records
+                    if start_after is None or record[0] > start_after
+                ]
+            ),
+        )
+        self.mock_iter_pid_values = patch_iter_pid_values.start()
+        self.addCleanup(patch_iter_pid_values.stop)
+
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.report_path = os.path.join(
+            temporary_directory.name, "audit.jsonl"
+        )
+        self.checkpoint_path = os.path.join(
+            temporary_directory.name, "audit.json"
+        )
+
+    def _audit(self, **options):
+        stdout = StringIO()
+        call_command(
+            "auditlocalids",
+            report=self.report_path,
+            checkpoint=self.checkpoint_path,
+            workers=1,
+            chunk_size=2,
+            stdout=stdout,
+            **options,
+        )
+        return stdout.getvalue()
+
+    def _read_report(self):
+        with open(self.report_path) as report_file:
+            return [json.loads(line) for line in report_file]
+
+    def _read_checkpoint(self):
+        with open(self.checkpoint_path) as checkpoint_file:
+            return json.load(checkpoint_file)
+
+    def test_without_linked_records_raises_error(self):
+        """test_without_linked_records_raises_error"""
+
+        test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
+
+        try:
+            with self.assertRaises(CommandError):
+                self._audit()
+        finally:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+            reload_config()
+
+    def test_resume_without_checkpoint_raises_error(self):
+        """test_resume_without_checkpoint_raises_error"""
+
+        with self.assertRaises(CommandError):
+            call_command("auditlocalids", report=self.report_path, resume=True)
+
+    def test_report_contains_violations(self):
+        """test_report_contains_violations"""
+
+        self._audit()
+
+        self.assertEqual(
+            [
+                (violation["data_id"], violation["verdict"])
+                for violation in self._read_report()
+            ],
+            [(2, "invalid_prefix"), (4, "invalid_format")],
+        )
+
+    def test_output_contains_stats(self):
+        """test_output_contains_stats"""
+
+        output = self._audit()
+
+        self.assertIn("Audited 4 data (2 violations, 1 without PID)", output)
+
+    def test_checkpoint_contains_progress(self):
+        """test_checkpoint_contains_progress"""
+
+        self._audit()
+        checkpoint = self._read_checkpoint()
+
+        self.assertEqual(
+            (
+                checkpoint["last_data_id"],
+                checkpoint["records"],
+                checkpoint["violations"],
+                checkpoint["missing"],
+            ),
+            (4, 4, 2, 1),
+        )
+
+    def test_resume_starts_after_checkpoint(self):
+        """test_resume_starts_after_checkpoint"""
+
+        records = self.records
+        self.records = records[:2]
+        self._audit()
+        self.records = records
+
+        output = self._audit(resume=True)
+
+        self.mock_iter_pid_values.assert_called_with(
+            test_settings.PID_PATH, start_after=2, chunk_size=2
+        )
+        self.assertEqual(
+            [violation["data_id"] for violation in self._read_report()],
+            [2, 4],
+        )
+        self.assertIn("Audited 4 data (2 violations, 1 without PID)", output)
+
+    def test_resume_drops_violations_after_checkpoint(self):
+        """test_resume_drops_violations_after_checkpoint"""
+
+        self.records = self.records[:2]
+        self._audit()
+
+        with open(self.report_path, "a") as report_file:
+            report_file.write('{"data_id": 3}\n')
+
+        self.records = []
+        self._audit(resume=True)
+
+        self.assertEqual(
+            [violation["data_id"] for violation in self._read_report()], [2]
+        )
@@ -0,0 +1,117 @@
+"""Test units"""
+
+import json
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.core.management import call_command, CommandError
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.ownership import (
+    pid_ownership_index,
+)
+from tests import test_settings
+
+
+class TestCheckPidOwnership(TestCase):
+    """Test Check Pid Ownership"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        self.records = [(1, "mock_pid_1"), (2, "mock_pid_2"), (3, None)]
+        patch_iter_pid_values = patch(
+            "core_module_local_id_registry_app.management.commands."
+            "checkpidownership.iter_pid_values",
+            side_effect=lambda pid_path, chunk_size: iter(self.records),
+        )
+        self.mock_iter_pid_values = patch_iter_pid_values.start()
+        self.addCleanup(patch_iter_pid_values.stop)
+
+        temporary_directory = TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.report_path = os.path.join(
+            temporary_directory.name, "ownership.jsonl"
+        )
+
+    def _call_command(self, *args):
+        stdout = StringIO()
+        call_command("checkpidownership", *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    def test_without_linked_records_raises_command_error(self):
+        """test_without_linked_records_raises_command_error"""
+
+        test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        self.addCleanup(
+            test_settings.INSTALLED_APPS.append, "core_linked_records_app"
+        )
+        reload_config()
+        self.addCleanup(reload_config)
+
+        with self.assertRaises(CommandError):
+            self._call_command()
+
+    def test_consistent_pids_succeed(self):
+        """test_consistent_pids_succeed"""
+
+        output = self._call_command("--report", self.report_path)
+
+        self.assertIn("Checked 2 stored PIDs.", output)
+
+        with open(self.report_path) as report_file:
+            self.assertEqual(report_file.read(), "")
+
+    def test_inconsistencies_are_reported(self):
+        """test_inconsistencies_are_reported"""
+
+        self.records = [(1, "mock_pid_1"), (2, "mock_pid_1")]
+
+        with self.assertRaises(CommandError) as context:
+            self._call_command("--report", self.report_path)
+
+        self.assertIn("1 duplicate", str(context.exception))
+
+        with open(self.report_path) as report_file:
+            issues = [json.loads(line) for line in report_file]
+
+        self.assertEqual(
+            issues,
+            [
+                {
+                    "pid": "mock_pid_1",
+                    "data_id": 2,
+                    "indexed_data_id": 1,
+                    "issue": "duplicate",
+                }
+            ],
+        )
+
+    def test_live_index_is_left_untouched(self):
+        """test_live_index_is_left_untouched"""
+
+        pid_ownership_index.build(
+            iter([(1, "mock_pid_3")]), test_settings.PID_PATH
+        )
+        self.addCleanup(pid_ownership_index.clear)
+
+        self._call_command()
+
+        self.assertEqual(
+            pid_ownership_index.get_owner(
+                "mock_pid_3", test_settings.PID_PATH
+            ),
+            1,
+        )
+
+    def test_invalid_chunk_size_raises_command_error(self):
+        """test_invalid_chunk_size_raises_command_error"""
+
+        with self.assertRaises(CommandError):
+            self._call_command("--chunk-size", "0")
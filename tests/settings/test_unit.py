@@ -0,0 +1,50 @@
+"""Test units"""
+
+from importlib import reload
+from unittest.case import TestCase
+
+from django.conf import settings as conf_settings
+from django.test import override_settings
+
+from core_module_local_id_registry_app import settings
+
+
+class TestCacheSettings(TestCase):
+    """Test Cache Settings"""
+
+    def setUp(self) -> None:
+        self.addCleanup(reload, settings)
+
+    def _reload_without_ttls(self):
+        for setting_name in (
+            "DATA_STRUCTURE_CACHE_TTL",
+            "PID_VALUE_CACHE_TTL",
+            "PID_VERDICT_CACHE_TTL",
+        ):
+            delattr(conf_settings, setting_name)
+
+        reload(settings)
+
+    @override_settings()
+    def test_caches_without_alias_are_disabled(self):
+        """test_caches_without_alias_are_disabled"""
+
+        self._reload_without_ttls()
+
+        self.assertEqual(settings.DATA_STRUCTURE_CACHE_TTL, 0)
+        self.assertEqual(settings.PID_VALUE_CACHE_TTL, 0)
+        self.assertEqual(settings.PID_VERDICT_CACHE_TTL, 0)
+
+    @override_settings(
+        DATA_STRUCTURE_CACHE_ALIAS="default",
+        PID_VALUE_CACHE_ALIAS="default",
+        PID_VERDICT_CACHE_ALIAS="default",
+    )
+    def test_caches_with_alias_are_enabled(self):
+        """test_caches_with_alias_are_enabled"""
+
+        self._reload_without_ttls()
+
+        self.assertEqual(settings.DATA_STRUCTURE_CACHE_TTL, 60)
+        self.assertEqual(settings.PID_VALUE_CACHE_TTL, 60)
+        self.assertEqual(settings.PID_VERDICT_CACHE_TTL, 30)
@@ -0,0 +1,68 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.tasks import check_local_id_task
+from core_module_local_id_registry_app.utils.rendering import status_box_cache
+from core_module_local_id_registry_app.views.views import (
+    CHECK_TASK_VERDICT_KEYS,
+    LocalIdRegistryModule,
+)
+from tests import test_settings
+
+
+class TestCheckLocalIdTask(TestCase):
+    """Test Check Local Id Task"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+        status_box_cache.clear()
+
+    @patch.object(LocalIdRegistryModule, "_check_local_id", autospec=True)
+    def test_checks_are_not_deferred(self, mock_check_local_id):
+        """test_checks_are_not_deferred"""
+
+        check_local_id_task("mock_data", 1)
+
+        module, data, data_id, request_state = mock_check_local_id.call_args[0]
+        self.assertEqual((data, data_id), ("mock_data", 1))
+        self.assertIsNone(request_state.task_id)
+        self.assertEqual(mock_check_local_id.call_args[1], {})
+
+    @patch.object(LocalIdRegistryModule, "_check_local_id", autospec=True)
+    def test_returns_verdict_with_status_box(self, mock_check_local_id):
+        """test_returns_verdict_with_status_box"""
+
+        def check_local_id(module, data, data_id, request_state):
+            request_state.default_prefix = "mock_prefix"
+            request_state.default_value = "mock_record"
+
+        mock_check_local_id.side_effect = check_local_id
+
+        verdict = check_local_id_task("mock_data", 1)
+
+        self.assertEqual(verdict["state"], "success")
+        self.assertEqual(verdict["prefix"], "mock_prefix")
+        self.assertEqual(verdict["value"], "mock_record")
+        self.assertIn("text-success", verdict["html"])
+        self.assertEqual(verdict.keys(), CHECK_TASK_VERDICT_KEYS)
+
+    @patch.object(LocalIdRegistryModule, "_check_local_id", autospec=True)
+    def test_taken_pid_returns_invalid_box(self, mock_check_local_id):
+        """test_taken_pid_returns_invalid_box"""
+
+        def check_local_id(module, data, data_id, request_state):
+            request_state.error_data = data
+            request_state.error_code = "pid_taken"
+
+        mock_check_local_id.side_effect = check_local_id
+
+        verdict = check_local_id_task("mock_data", 1)
+
+        self.assertEqual(verdict["state"], "invalid")
+        self.assertEqual(verdict["message_code"], "pid_taken")
+        self.assertIn("mock_data", verdict["html"])
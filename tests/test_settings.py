@@ -14,6 +14,7 @@ INSTALLED_APPS = [
     "core_linked_records_app",
     "core_parser_app",
     "core_curate_app",
+    "core_module_local_id_registry_app",
     "tests",
 ]
 
@@ -29,6 +30,15 @@ DATABASES = {
     },
 }
 
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "APP_DIRS": True,
+    },
+]
+
+BOOTSTRAP_VERSION = "5.1.3"
+
 SERVER_URI = "http://hostname.com"
 
 PID_PATH = "mock.path"
@@ -39,7 +49,13 @@ ID_PROVIDER_SYSTEM_NAME = "mock_provider"
 
 ID_PROVIDER_PREFIXES = ["mock_prefix"]
 
+# Tests run in a single process, whose caches need no shared alias.
+DATA_STRUCTURE_CACHE_TTL = 60
+PID_VALUE_CACHE_TTL = 60
+PID_VERDICT_CACHE_TTL = 30
+
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 CELERYBEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 MONGODB_INDEXING = False
 MONGODB_ASYNC_SAVE = False
+ROOT_URLCONF = "core_module_local_id_registry_app.urls"
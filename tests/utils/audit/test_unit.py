@@ -0,0 +1,126 @@
+"""Test units"""
+
+from unittest.case import TestCase
+
+from core_module_local_id_registry_app.utils.audit import (
+    audit_pids,
+    audit_stored_pids,
+)
+from core_module_local_id_registry_app.utils.validators import (
+    PidValidator,
+    PidVerdict,
+)
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import MockPID, MockProvider
+
+HOST_URL = MockProvider().provider_lookup_url
+
+
+class TestAuditPids(TestCase):
+    """Test Audit Pids"""
+
+    def setUp(self) -> None:
+        self.validator = PidValidator(
+            test_settings.PID_FORMAT,
+            test_settings.ID_PROVIDER_PREFIXES,
+            HOST_URL,
+        )
+
+    def test_valid_pid_is_not_reported(self):
+        """test_valid_pid_is_not_reported"""
+
+        self.assertEqual(
+            audit_pids(self.validator, [(1, str(MockPID()))]), ([], 0)
+        )
+
+    def test_missing_pid_is_counted(self):
+        """test_missing_pid_is_counted"""
+
+        self.assertEqual(audit_pids(self.validator, [(1, None)]), ([], 1))
+
+    def test_invalid_pids_are_reported_with_verdict(self):
+        """test_invalid_pids_are_reported_with_verdict"""
+
+        records = [
+            (1, str(MockPID(host_url="http://other.com"))),
+            (2, str(MockPID(prefix="other_prefix"))),
+            (3, str(MockPID(value="mock record"))),
+            (4, "mock_pid"),
+        ]
+
+        self.assertEqual(
+            [
+                violation["verdict"]
+                for violation in audit_pids(self.validator, records)[0]
+            ],
+            [
+                PidVerdict.INVALID_HOST,
+                PidVerdict.INVALID_PREFIX,
+                PidVerdict.INVALID_FORMAT,
+                PidVerdict.INVALID_STRUCTURE,
+            ],
+        )
+
+    def test_non_string_pid_is_invalid_structure(self):
+        """test_non_string_pid_is_invalid_structure"""
+
+        self.assertEqual(
+            audit_pids(self.validator, [(1, {"mock": "pid"})]),
+            (
+                [
+                    {
+                        "data_id": 1,
+                        "pid": {"mock": "pid"},
+                        "verdict": PidVerdict.INVALID_STRUCTURE,
+                    }
+                ],
+                0,
+            ),
+        )
+
+
+class TestAuditStoredPids(TestCase):
+    """Test Audit Stored Pids"""
+
+    def setUp(self) -> None:
+        self.records = [
+            (index, str(MockPID(value="mock record" if index % 3 else None)))
+            for index in range(1, 11)
+        ]
+
+    def _audit(self, workers):
+        return list(
+            audit_stored_pids(
+                iter(self.records),
+                test_settings.PID_FORMAT,
+                test_settings.ID_PROVIDER_PREFIXES,
+                HOST_URL,
+                chunk_size=4,
+                workers=workers,
+            )
+        )
+
+    def test_chunks_are_yielded_in_order(self):
+        """test_chunks_are_yielded_in_order"""
+
+        self.assertEqual(
+            [(chunk[0], chunk[1]) for chunk in self._audit(1)],
+            [(4, 4), (8, 4), (10, 2)],
+        )
+
+    def test_violations_are_reported(self):
+        """test_violations_are_reported"""
+
+        self.assertEqual(
+            [
+                violation["data_id"]
+                for chunk in self._audit(1)
+                for violation in chunk[2]
+            ],
+            [1, 2, 4, 5, 7, 8, 10],
+        )
+
+    def test_process_pool_returns_same_results(self):
+        """test_process_pool_returns_same_results"""
+
+        self.assertEqual(self._audit(2), self._audit(1))
@@ -0,0 +1,89 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.utils.breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(TestCase):
+    """Test Circuit Breaker"""
+
+    def setUp(self) -> None:
+        self.breaker = CircuitBreaker(2, 30)
+
+        patch_monotonic = patch(
+            "core_module_local_id_registry_app.utils.breaker.monotonic",
+            return_value=100,
+        )
+        self.mock_monotonic = patch_monotonic.start()
+        self.addCleanup(patch_monotonic.stop)
+
+    def test_closed_circuit_allows_calls(self):
+        """test_closed_circuit_allows_calls"""
+
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.allow())
+
+    def test_failures_up_to_threshold_open_circuit(self):
+        """test_failures_up_to_threshold_open_circuit"""
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+
+    def test_success_resets_failures(self):
+        """test_success_resets_failures"""
+
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.allow())
+
+    def test_single_probe_allowed_after_recovery_timeout(self):
+        """test_single_probe_allowed_after_recovery_timeout"""
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.mock_monotonic.return_value = 130
+
+        self.assertEqual(
+            [self.breaker.allow(), self.breaker.allow()], [True, False]
+        )
+
+    def test_successful_probe_closes_circuit(self):
+        """test_successful_probe_closes_circuit"""
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.mock_monotonic.return_value = 130
+        self.breaker.allow()
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_opens_circuit(self):
+        """test_failed_probe_opens_circuit"""
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.mock_monotonic.return_value = 130
+        self.breaker.allow()
+        self.breaker.record_failure()
+
+        self.assertFalse(self.breaker.allow())
+
+    def test_zero_threshold_never_opens_circuit(self):
+        """test_zero_threshold_never_opens_circuit"""
+
+        breaker = CircuitBreaker(0, 30)
+
+        for _ in range(10):
+            breaker.record_failure()
+
+        self.assertTrue(breaker.allow())
@@ -0,0 +1,93 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from core_module_local_id_registry_app.utils.cache import (
+    TTLCache,
+    get_request_cache,
+)
+
+
+class TestTTLCache(TestCase):
+    """Test TTL Cache"""
+
+    def test_get_returns_stored_value(self):
+        """test_get_returns_stored_value"""
+
+        cache = TTLCache(60)
+        cache.set("mock_key", "mock_value")
+
+        self.assertEqual(cache.get("mock_key"), "mock_value")
+
+    def test_get_missing_key_returns_default(self):
+        """test_get_missing_key_returns_default"""
+
+        cache = TTLCache(60)
+
+        self.assertEqual(cache.get("mock_key", "mock_default"), "mock_default")
+
+    @patch("core_module_local_id_registry_app.utils.cache.monotonic")
+    def test_get_expired_key_returns_default(self, mock_monotonic):
+        """test_get_expired_key_returns_default"""
+
+        cache = TTLCache(60)
+        mock_monotonic.return_value = 0
+        cache.set("mock_key", "mock_value")
+        mock_monotonic.return_value = 61
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    def test_zero_ttl_disables_cache(self):
+        """test_zero_ttl_disables_cache"""
+
+        cache = TTLCache(0)
+        cache.set("mock_key", "mock_value")
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    def test_least_recently_used_key_is_evicted(self):
+        """test_least_recently_used_key_is_evicted"""
+
+        cache = TTLCache(60, max_size=2)
+        cache.set("mock_key_1", "mock_value_1")
+        cache.set("mock_key_2", "mock_value_2")
+        cache.get("mock_key_1")
+        cache.set("mock_key_3", "mock_value_3")
+
+        self.assertIsNone(cache.get("mock_key_2"))
+        self.assertEqual(cache.get("mock_key_1"), "mock_value_1")
+
+    def test_delete_removes_key(self):
+        """test_delete_removes_key"""
+
+        cache = TTLCache(60)
+        cache.set("mock_key", "mock_value")
+        cache.delete("mock_key")
+
+        self.assertIsNone(cache.get("mock_key"))
+
+    def test_clear_removes_all_keys(self):
+        """test_clear_removes_all_keys"""
+
+        cache = TTLCache(60)
+        cache.set("mock_key", "mock_value")
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestGetRequestCache(TestCase):
+    """Test Get Request Cache"""
+
+    def test_same_request_returns_same_cache(self):
+        """test_same_request_returns_same_cache"""
+
+        request = Mock()
+
+        self.assertIs(get_request_cache(request), get_request_cache(request))
+
+    def test_different_requests_return_different_caches(self):
+        """test_different_requests_return_different_caches"""
+
+        self.assertIsNot(get_request_cache(Mock()), get_request_cache(Mock()))
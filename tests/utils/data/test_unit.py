@@ -0,0 +1,200 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from django.core.cache import caches
+from django.test import override_settings
+
+from core_module_local_id_registry_app import watch
+from core_module_local_id_registry_app.utils.data import (
+    PidValueCache,
+    _query_pid_value,
+    get_pid_value_for_data_id,
+    iter_pid_values,
+    pid_value_cache,
+)
+from tests.views.LocalIdRegistryModule.fixtures import MockData
+
+
+class TestQueryPidValue(TestCase):
+    """Test Query Pid Value"""
+
+    @patch("core_module_local_id_registry_app.utils.data.Data")
+    def test_sql_query_projects_pid_path(self, mock_data):
+        """test_sql_query_projects_pid_path"""
+
+        _query_pid_value(1, "mock.path")
+
+        mock_data.objects.filter.assert_called_with(pk=1)
+        mock_data.objects.filter.return_value.values_list.assert_called_with(
+            "dict_content__mock__path", flat=True
+        )
+
+    @override_settings(MONGODB_INDEXING=True)
+    @patch("core_main_app.components.mongo.models.MongoData", create=True)
+    def test_mongo_query_projects_pid_path(self, mock_mongo_data):
+        """test_mongo_query_projects_pid_path"""
+
+        mock_find_one = mock_mongo_data._get_collection.return_value.find_one
+        mock_find_one.return_value = {
+            "_id": 1,
+            "dict_content": {"mock": {"path": "mock_pid"}},
+        }
+
+        result = _query_pid_value(1, "mock.path")
+
+        mock_find_one.assert_called_with(
+            {"_id": 1}, {"dict_content.mock.path": 1}
+        )
+        self.assertEqual(result, "mock_pid")
+
+    @override_settings(MONGODB_INDEXING=True)
+    @patch("core_main_app.components.mongo.models.MongoData", create=True)
+    def test_mongo_query_missing_path_returns_none(self, mock_mongo_data):
+        """test_mongo_query_missing_path_returns_none"""
+
+        mock_find_one = mock_mongo_data._get_collection.return_value.find_one
+        mock_find_one.return_value = {"_id": 1, "dict_content": {}}
+
+        self.assertIsNone(_query_pid_value(1, "mock.path"))
+
+
+class TestIterPidValues(TestCase):
+    """Test Iter Pid Values"""
+
+    @patch("core_module_local_id_registry_app.utils.data.Data")
+    def test_sql_query_streams_pid_path(self, mock_data):
+        """test_sql_query_streams_pid_path"""
+
+        mock_values_list = mock_data.objects.order_by.return_value.values_list
+        mock_values_list.return_value.iterator.return_value = iter(
+            [(1, "mock_pid")]
+        )
+
+        result = list(iter_pid_values("mock.path", chunk_size=10))
+
+        mock_values_list.assert_called_with("pk", "dict_content__mock__path")
+        mock_values_list.return_value.iterator.assert_called_with(
+            chunk_size=10
+        )
+        self.assertEqual(result, [(1, "mock_pid")])
+
+    @patch("core_module_local_id_registry_app.utils.data.Data")
+    def test_sql_query_starts_after_primary_key(self, mock_data):
+        """test_sql_query_starts_after_primary_key"""
+
+        list(iter_pid_values("mock.path", start_after=5))
+
+        mock_data.objects.order_by.return_value.filter.assert_called_with(
+            pk__gt=5
+        )
+
+    @override_settings(MONGODB_INDEXING=True)
+    @patch("core_main_app.components.mongo.models.MongoData", create=True)
+    def test_mongo_query_streams_pid_path(self, mock_mongo_data):
+        """test_mongo_query_streams_pid_path"""
+
+        mock_find = mock_mongo_data._get_collection.return_value.find
+        mock_find.return_value.sort.return_value.batch_size.return_value = [
+            {"_id": 6, "dict_content": {"mock": {"path": "mock_pid"}}},
+            {"_id": 7, "dict_content": {}},
+        ]
+
+        result = list(iter_pid_values("mock.path", start_after=5))
+
+        mock_find.assert_called_with(
+            {"_id": {"$gt": 5}}, {"dict_content.mock.path": 1}
+        )
+        self.assertEqual(result, [(6, "mock_pid"), (7, None)])
+
+
+class TestPidValueCache(TestCase):
+    """Test Pid Value Cache"""
+
+    def test_django_cache_returns_stored_value(self):
+        """test_django_cache_returns_stored_value"""
+
+        cache = PidValueCache(60, "default")
+        cache.set(1, ("mock.path", "mock_pid"))
+
+        self.assertEqual(cache.get(1), ("mock.path", "mock_pid"))
+        self.assertEqual(
+            caches["default"].get(cache._get_key(1)),
+            ("mock.path", "mock_pid"),
+        )
+
+    def test_django_cache_delete_removes_value(self):
+        """test_django_cache_delete_removes_value"""
+
+        cache = PidValueCache(60, "default")
+        cache.set(1, ("mock.path", "mock_pid"))
+        cache.delete(1)
+
+        self.assertIsNone(cache.get(1))
+
+
+class TestGetPidValueForDataId(TestCase):
+    """Test Get Pid Value For Data Id"""
+
+    def setUp(self) -> None:
+        pid_value_cache.clear()
+
+        patch_query_pid_value = patch(
+            "core_module_local_id_registry_app.utils.data._query_pid_value",
+            return_value="mock_pid",
+        )
+        self.mock_query_pid_value = patch_query_pid_value.start()
+        self.addCleanup(patch_query_pid_value.stop)
+
+    def test_returns_pid_value(self):
+        """test_returns_pid_value"""
+
+        self.assertEqual(get_pid_value_for_data_id(1, "mock.path"), "mock_pid")
+
+    def test_second_call_uses_cache(self):
+        """test_second_call_uses_cache"""
+
+        get_pid_value_for_data_id(1, "mock.path")
+        get_pid_value_for_data_id(1, "mock.path")
+
+        self.assertEqual(self.mock_query_pid_value.call_count, 1)
+
+    def test_none_value_is_cached(self):
+        """test_none_value_is_cached"""
+
+        self.mock_query_pid_value.return_value = None
+
+        get_pid_value_for_data_id(1, "mock.path")
+        get_pid_value_for_data_id(1, "mock.path")
+
+        self.assertEqual(self.mock_query_pid_value.call_count, 1)
+
+    def test_path_change_queries_again(self):
+        """test_path_change_queries_again"""
+
+        get_pid_value_for_data_id(1, "mock.path")
+        get_pid_value_for_data_id(1, "mock.other_path")
+
+        self.assertEqual(self.mock_query_pid_value.call_count, 2)
+
+    def test_without_cache_reads_stored_value(self):
+        """test_without_cache_reads_stored_value"""
+
+        get_pid_value_for_data_id(1, "mock.path")
+        self.mock_query_pid_value.return_value = "mock_stored_pid"
+
+        self.assertEqual(
+            get_pid_value_for_data_id(1, "mock.path", use_cache=False),
+            "mock_stored_pid",
+        )
+        self.assertEqual(get_pid_value_for_data_id(1, "mock.path"), "mock_pid")
+
+    def test_data_save_signal_clears_cache(self):
+        """test_data_save_signal_clears_cache"""
+
+        get_pid_value_for_data_id(1, "mock.path")
+        watch.clear_data_caches(Mock(), MockData(pk=1))
+        get_pid_value_for_data_id(1, "mock.path")
+
+        self.assertEqual(self.mock_query_pid_value.call_count, 2)
@@ -0,0 +1,167 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_module_local_id_registry_app.utils.data_structure import (
+    curate_data_structure_id_cache,
+    get_curate_data_structure_by_id,
+    get_curate_data_structure_from_module_id,
+)
+
+
+class TestGetCurateDataStructureFromModuleId(TestCase):
+    """Test Get Curate Data Structure From Module Id"""
+
+    def setUp(self) -> None:
+        curate_data_structure_id_cache.clear()
+
+        patch_get_element = patch(
+            "core_module_local_id_registry_app.utils.data_structure."
+            "data_structure_element_api.get_by_id",
+            return_value=Mock(data_structure_id=1),
+        )
+        self.mock_get_element = patch_get_element.start()
+        self.addCleanup(patch_get_element.stop)
+
+        self.mock_curate_data_structure = Mock(pk=1)
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.utils.data_structure."
+            "curate_data_structure_api.get_by_id",
+            return_value=self.mock_curate_data_structure,
+        )
+        self.mock_get_curate_data_structure = (
+            patch_get_curate_data_structure.start()
+        )
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        self.request = Mock()
+        self.request.user = create_mock_user("1")
+
+    def test_returns_curate_data_structure(self):
+        """test_returns_curate_data_structure"""
+
+        result = get_curate_data_structure_from_module_id(1, self.request)
+
+        self.assertEqual(result, self.mock_curate_data_structure)
+
+    def test_curate_data_structure_retrieved_from_element_data_structure(
+        self,
+    ):
+        """test_curate_data_structure_retrieved_from_element_data_structure"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+
+        self.mock_get_curate_data_structure.assert_called_with(
+            1, self.request.user
+        )
+
+    def test_same_request_is_memoized(self):
+        """test_same_request_is_memoized"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+        get_curate_data_structure_from_module_id(1, self.request)
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 1)
+
+    def test_cached_id_skips_element_lookup(self):
+        """test_cached_id_skips_element_lookup"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+
+        request = Mock()
+        request.user = self.request.user
+        get_curate_data_structure_from_module_id(1, request)
+
+        self.assertEqual(self.mock_get_element.call_count, 1)
+
+    def test_cached_id_is_per_user(self):
+        """test_cached_id_is_per_user"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+
+        request = Mock()
+        request.user = create_mock_user("2")
+        get_curate_data_structure_from_module_id(1, request)
+
+        self.assertEqual(self.mock_get_element.call_count, 2)
+
+    def test_deleted_curate_data_structure_is_resolved_again(self):
+        """test_deleted_curate_data_structure_is_resolved_again"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+        self.mock_get_curate_data_structure.side_effect = [
+            DoesNotExist("mock_error"),
+            self.mock_curate_data_structure,
+        ]
+
+        request = Mock()
+        request.user = self.request.user
+        result = get_curate_data_structure_from_module_id(1, request)
+
+        self.assertEqual(result, self.mock_curate_data_structure)
+        self.assertEqual(self.mock_get_element.call_count, 2)
+
+    def test_modules_of_same_form_share_curate_data_structure_fetch(self):
+        """test_modules_of_same_form_share_curate_data_structure_fetch"""
+
+        get_curate_data_structure_from_module_id(1, self.request)
+        get_curate_data_structure_from_module_id(2, self.request)
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 1)
+
+
+class TestGetCurateDataStructureById(TestCase):
+    """Test Get Curate Data Structure By Id"""
+
+    def setUp(self) -> None:
+        self.mock_curate_data_structure = Mock(pk=1)
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.utils.data_structure."
+            "curate_data_structure_api.get_by_id",
+            return_value=self.mock_curate_data_structure,
+        )
+        self.mock_get_curate_data_structure = (
+            patch_get_curate_data_structure.start()
+        )
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        self.request = Mock()
+        self.request.user = create_mock_user("1")
+
+    def test_returns_curate_data_structure(self):
+        """test_returns_curate_data_structure"""
+
+        result = get_curate_data_structure_by_id(1, self.request)
+
+        self.assertEqual(result, self.mock_curate_data_structure)
+
+    def test_access_is_checked_for_request_user(self):
+        """test_access_is_checked_for_request_user"""
+
+        get_curate_data_structure_by_id(1, self.request)
+
+        self.mock_get_curate_data_structure.assert_called_once_with(
+            1, self.request.user
+        )
+
+    def test_same_id_is_fetched_once_per_request(self):
+        """test_same_id_is_fetched_once_per_request"""
+
+        get_curate_data_structure_by_id(1, self.request)
+        get_curate_data_structure_by_id("1", self.request)
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 1)
+
+    def test_other_request_fetches_again(self):
+        """test_other_request_fetches_again"""
+
+        get_curate_data_structure_by_id(1, self.request)
+
+        request = Mock()
+        request.user = self.request.user
+        get_curate_data_structure_by_id(1, request)
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 2)
@@ -0,0 +1,81 @@
+"""Fixtures for HTTP utilities tests"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+
+
+class StubResolverHandler(BaseHTTPRequestHandler):
+    """Answer 404 for paths containing `missing`, 500 for paths containing
+    `error`, and 200 otherwise.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        server = self.server
+
+        with server.lock:
+            server.client_ports.append(self.client_address[1])
+            server.active_requests += 1
+            server.max_active_requests = max(
+                server.max_active_requests, server.active_requests
+            )
+
+        sleep(server.delay)
+
+        with server.lock:
+            server.active_requests -= 1
+
+        if "missing" in self.path:
+            self.send_response(404)
+        elif "error" in self.path:
+            self.send_response(500)
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StubResolver:
+    """Local HTTP server resolving PIDs, run in a thread"""
+
+    def __init__(self, delay=0):
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), StubResolverHandler
+        )
+        self.server.daemon_threads = True
+        self.server.lock = Lock()
+        self.server.client_ports = list()
+        self.server.active_requests = 0
+        self.server.max_active_requests = 0
+        self.server.delay = delay
+        self.url = "http://127.0.0.1:%d" % self.server.server_address[1]
+        self._thread = Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    def start(self):
+        """Start serving"""
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def client_ports(self):
+        """Client port of each request"""
+        return self.server.client_ports
+
+    @property
+    def max_active_requests(self):
+        """Maximum number of requests processed at once"""
+        return self.server.max_active_requests
@@ -0,0 +1,107 @@
+"""Test units"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.utils import http
+from core_module_local_id_registry_app.utils.http import (
+    build_session,
+    get_session,
+    reset_session,
+)
+from tests.utils.http.fixtures import StubResolver
+
+
+class TestBuildSession(TestCase):
+    """Test Build Session"""
+
+    def setUp(self) -> None:
+        self.resolver = StubResolver(delay=0.05)
+        self.resolver.start()
+        self.addCleanup(self.resolver.stop)
+
+    def test_connection_is_kept_alive(self):
+        """test_connection_is_kept_alive"""
+
+        session = build_session(2, 0)
+        self.addCleanup(session.close)
+
+        for _ in range(3):
+            session.head(self.resolver.url + "/mock_prefix/mock_record")
+
+        self.assertEqual(len(set(self.resolver.client_ports)), 1)
+
+    def test_connections_to_host_are_limited(self):
+        """test_connections_to_host_are_limited"""
+
+        session = build_session(2, 0)
+        self.addCleanup(session.close)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(
+                executor.map(
+                    lambda index: session.head(
+                        "%s/mock_prefix/%d" % (self.resolver.url, index)
+                    ),
+                    range(12),
+                )
+            )
+
+        self.assertLessEqual(self.resolver.max_active_requests, 2)
+        self.assertLessEqual(len(set(self.resolver.client_ports)), 2)
+
+
+class TestGetSession(TestCase):
+    """Test Get Session"""
+
+    def setUp(self) -> None:
+        reset_session()
+        self.addCleanup(reset_session)
+
+    def test_returns_shared_session(self):
+        """test_returns_shared_session"""
+
+        self.assertIs(get_session(), get_session())
+
+    @patch(
+        "core_module_local_id_registry_app.utils.http.settings."
+        "REMOTE_PID_CHECK_MAX_CONNECTIONS",
+        3,
+    )
+    def test_session_uses_connection_limit(self):
+        """test_session_uses_connection_limit"""
+
+        adapter = get_session().get_adapter("http://mock_host")
+
+        self.assertEqual(adapter._pool_maxsize, 3)
+
+    def test_reset_builds_new_session(self):
+        """test_reset_builds_new_session"""
+
+        session = get_session()
+        reset_session()
+
+        self.assertIsNot(get_session(), session)
+
+    def test_forked_process_builds_new_session(self):
+        """test_forked_process_builds_new_session"""
+
+        session = get_session()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            # Child process: report whether the session was inherited.
+            os.close(read_fd)
+            os.write(write_fd, b"0" if http._session is None else b"1")
+            os._exit(0)
+
+        os.close(write_fd)
+        inherited = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(inherited, b"0")
+        self.assertIs(get_session(), session)
@@ -0,0 +1,434 @@
+"""Test units"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from core_module_local_id_registry_app.utils import local_id as local_id_utils
+from core_module_local_id_registry_app.utils.local_id import (
+    SORTABLE_LOCAL_ID_CHARACTERS,
+    LocalIdPool,
+    NodeIdLease,
+    SortableLocalIdGenerator,
+    reserve_local_id,
+)
+
+
+class TestLocalIdPoolReserve(TestCase):
+    """Test Local Id Pool Reserve"""
+
+    def setUp(self) -> None:
+        patch_get_used_local_ids = patch(
+            "core_module_local_id_registry_app.utils.local_id."
+            "get_used_local_ids",
+            return_value=set(),
+        )
+        self.mock_get_used_local_ids = patch_get_used_local_ids.start()
+        self.addCleanup(patch_get_used_local_ids.stop)
+
+        self.pool = LocalIdPool(20, 2, 10)
+
+    def test_local_id_has_expected_length(self):
+        """test_local_id_has_expected_length"""
+
+        self.assertEqual(len(self.pool.reserve()), 20)
+
+    def test_first_reserve_fills_pool(self):
+        """test_first_reserve_fills_pool"""
+
+        self.pool.reserve()
+
+        self.assertEqual(len(self.pool), 9)
+
+    def test_pool_refilled_with_one_query(self):
+        """test_pool_refilled_with_one_query"""
+
+        self.pool.reserve()
+
+        self.assertEqual(self.mock_get_used_local_ids.call_count, 1)
+
+    def test_pool_not_refilled_above_low_watermark(self):
+        """test_pool_not_refilled_above_low_watermark"""
+
+        for _ in range(8):
+            self.pool.reserve()
+
+        self.assertEqual(self.mock_get_used_local_ids.call_count, 1)
+
+    def test_pool_refilled_at_low_watermark(self):
+        """test_pool_refilled_at_low_watermark"""
+
+        for _ in range(9):
+            self.pool.reserve()
+
+        self.assertEqual(self.mock_get_used_local_ids.call_count, 2)
+
+    def test_reserved_local_ids_are_unique(self):
+        """test_reserved_local_ids_are_unique"""
+
+        local_id_list = [self.pool.reserve() for _ in range(50)]
+
+        self.assertEqual(len(set(local_id_list)), 50)
+
+    def test_used_local_ids_are_not_reserved(self):
+        """test_used_local_ids_are_not_reserved"""
+
+        self.mock_get_used_local_ids.return_value = {"ID0", "ID1"}
+        local_id_iter = iter("ID%d" % index for index in range(100))
+
+        with patch.object(
+            self.pool,
+            "_generate_local_id",
+            side_effect=lambda: next(local_id_iter),
+        ):
+            local_id_list = [self.pool.reserve() for _ in range(5)]
+
+        self.assertNotIn("ID0", local_id_list)
+        self.assertNotIn("ID1", local_id_list)
+
+
+class TestSortableLocalIdGeneratorInit(TestCase):
+    """Test Sortable Local Id Generator Init"""
+
+    def test_too_short_local_ids_raise_value_error(self):
+        """test_too_short_local_ids_raise_value_error"""
+
+        with self.assertRaises(ValueError):
+            SortableLocalIdGenerator(12, 0, 10, 12)
+
+    def test_shortest_local_ids_are_accepted(self):
+        """test_shortest_local_ids_are_accepted"""
+
+        self.assertEqual(
+            len(SortableLocalIdGenerator(13, 0, 10, 12).generate()), 13
+        )
+
+    def test_node_id_out_of_range_raises_value_error(self):
+        """test_node_id_out_of_range_raises_value_error"""
+
+        with self.assertRaises(ValueError):
+            SortableLocalIdGenerator(20, 1024, 10, 12)
+
+
+class TestSortableLocalIdGeneratorGenerate(TestCase):
+    """Test Sortable Local Id Generator Generate"""
+
+    def setUp(self) -> None:
+        self.generator = SortableLocalIdGenerator(20, 5, 10, 12)
+
+    def test_local_id_has_expected_length_and_characters(self):
+        """test_local_id_has_expected_length_and_characters"""
+
+        local_id = self.generator.generate()
+
+        self.assertEqual(len(local_id), 20)
+        self.assertTrue(set(local_id) <= set(SORTABLE_LOCAL_ID_CHARACTERS))
+
+    def test_local_ids_are_sorted_by_creation(self):
+        """test_local_ids_are_sorted_by_creation"""
+
+        local_id_list = [self.generator.generate() for _ in range(10000)]
+
+        self.assertEqual(local_id_list, sorted(local_id_list))
+        self.assertEqual(len(set(local_id_list)), len(local_id_list))
+
+    def test_local_ids_encode_time_node_and_sequence(self):
+        """test_local_ids_encode_time_node_and_sequence"""
+
+        with patch.object(
+            SortableLocalIdGenerator, "_get_timestamp", return_value=1
+        ):
+            local_id_list = [self.generator.generate() for _ in range(2)]
+
+        self.assertEqual(
+            [int(local_id, 36) for local_id in local_id_list],
+            [(1 << 22) | (5 << 12), (1 << 22) | (5 << 12) | 1],
+        )
+
+    def test_late_clock_does_not_go_backwards(self):
+        """test_late_clock_does_not_go_backwards"""
+
+        with patch.object(
+            SortableLocalIdGenerator, "_get_timestamp", side_effect=[10, 5]
+        ):
+            local_id_list = [self.generator.generate() for _ in range(2)]
+
+        self.assertLess(local_id_list[0], local_id_list[1])
+
+    def test_exhausted_sequence_uses_next_millisecond(self):
+        """test_exhausted_sequence_uses_next_millisecond"""
+
+        generator = SortableLocalIdGenerator(20, 0, 10, 1)
+
+        with patch.object(
+            SortableLocalIdGenerator, "_get_timestamp", return_value=10
+        ):
+            local_id_list = [generator.generate() for _ in range(3)]
+
+        self.assertEqual(
+            [int(local_id, 36) >> 11 for local_id in local_id_list],
+            [10, 10, 11],
+        )
+
+    def test_nodes_do_not_collide(self):
+        """test_nodes_do_not_collide"""
+
+        other_generator = SortableLocalIdGenerator(20, 6, 10, 12)
+
+        with patch.object(
+            SortableLocalIdGenerator, "_get_timestamp", return_value=10
+        ):
+            local_id_list = [
+                generator.generate()
+                for generator in [self.generator, other_generator]
+                for _ in range(100)
+            ]
+
+        self.assertEqual(len(set(local_id_list)), 200)
+
+    def test_concurrent_local_ids_are_unique(self):
+        """test_concurrent_local_ids_are_unique"""
+
+        with ThreadPoolExecutor(8) as executor:
+            local_id_list = list(
+                executor.map(lambda _: self.generator.generate(), range(10000))
+            )
+
+        self.assertEqual(len(set(local_id_list)), 10000)
+
+
+class TestReserveLocalId(TestCase):
+    """Test Reserve Local Id"""
+
+    def setUp(self) -> None:
+        local_id_utils._local_id_pools.clear()
+        local_id_utils._forget_sortable_local_id_generators()
+        self.addCleanup(local_id_utils._forget_sortable_local_id_generators)
+        caches["default"].clear()
+
+    @patch(
+        "core_module_local_id_registry_app.utils.local_id.get_used_local_ids",
+        return_value=set(),
+    )
+    def test_pool_is_shared_for_same_length(self, mock_get_used_local_ids):
+        """test_pool_is_shared_for_same_length"""
+
+        reserve_local_id(20)
+        reserve_local_id(20)
+
+        self.assertEqual(mock_get_used_local_ids.call_count, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.local_id."
+        "generate_unique_local_id",
+        return_value="mock_local_id",
+    )
+    def test_disabled_pool_generates_local_id(
+        self, mock_generate_unique_local_id
+    ):
+        """test_disabled_pool_generates_local_id"""
+
+        with patch(
+            "core_module_local_id_registry_app.settings."
+            "LOCAL_ID_POOL_HIGH_WATERMARK",
+            0,
+        ):
+            result = reserve_local_id(20)
+
+        self.assertEqual(result, "mock_local_id")
+
+    @patch(
+        "core_module_local_id_registry_app.utils.local_id.get_used_local_ids"
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_CACHE_ALIAS",
+        "default",
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_sortable_generator_with_leased_node_id_does_not_query(
+        self, mock_get_used_local_ids
+    ):
+        """test_sortable_generator_with_leased_node_id_does_not_query"""
+
+        local_id_list = [reserve_local_id(20) for _ in range(3)]
+
+        self.assertFalse(mock_get_used_local_ids.called)
+        self.assertEqual(local_id_list, sorted(set(local_id_list)))
+
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_CACHE_ALIAS",
+        "default",
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_forked_process_leases_other_node_id(self):
+        """test_forked_process_leases_other_node_id"""
+
+        parent_local_id = reserve_local_id(20)
+        # As run in the child process after a fork.
+        local_id_utils._forget_sortable_local_id_generators()
+        child_local_id = reserve_local_id(20)
+
+        self.assertEqual((int(parent_local_id, 36) >> 12) & 1023, 0)
+        self.assertEqual((int(child_local_id, 36) >> 12) & 1023, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_CACHE_ALIAS",
+        "default",
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_lost_lease_is_acquired_again(self):
+        """test_lost_lease_is_acquired_again"""
+
+        reserve_local_id(20)
+        lease = local_id_utils._node_id_lease
+        lease._renew_at = 0
+        caches["default"].set(lease._get_key(0), "mock_other_process")
+
+        local_id = reserve_local_id(20)
+
+        self.assertEqual((int(local_id, 36) >> 12) & 1023, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.local_id.get_used_local_ids"
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_ID",
+        0,
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_sortable_generator_with_node_id_skips_used_local_ids(
+        self, mock_get_used_local_ids
+    ):
+        """test_sortable_generator_with_node_id_skips_used_local_ids"""
+
+        mock_get_used_local_ids.side_effect = lambda local_id_list: (
+            set(local_id_list)
+            if mock_get_used_local_ids.call_count == 1
+            else set()
+        )
+
+        local_id = reserve_local_id(20)
+
+        self.assertEqual(mock_get_used_local_ids.call_count, 2)
+        self.assertEqual(mock_get_used_local_ids.call_args.args[0], [local_id])
+
+    @patch(
+        "core_module_local_id_registry_app.utils.local_id.get_used_local_ids",
+        return_value=set(),
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_ID",
+        7,
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_sortable_generator_uses_configured_node_id(
+        self, mock_get_used_local_ids
+    ):
+        """test_sortable_generator_uses_configured_node_id"""
+
+        local_id = reserve_local_id(20)
+
+        self.assertEqual((int(local_id, 36) >> 12) & 1023, 7)
+
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_NODE_ID",
+        None,
+    )
+    @patch(
+        "core_module_local_id_registry_app.settings.LOCAL_ID_GENERATOR",
+        "sortable",
+    )
+    def test_sortable_generator_without_node_id_raises_improperly_configured(
+        self,
+    ):
+        """test_sortable_generator_without_node_id_raises_improperly_configured"""
+
+        with self.assertRaises(ImproperlyConfigured):
+            reserve_local_id(20)
+
+
+class TestNodeIdLease(TestCase):
+    """Test Node Id Lease"""
+
+    def setUp(self) -> None:
+        caches["default"].clear()
+
+    def test_processes_lease_distinct_node_ids(self):
+        """test_processes_lease_distinct_node_ids"""
+
+        self.assertEqual(NodeIdLease("default", 2, 60).acquire(), 0)
+        self.assertEqual(NodeIdLease("default", 2, 60).acquire(), 1)
+
+    def test_all_node_ids_leased_raises_improperly_configured(self):
+        """test_all_node_ids_leased_raises_improperly_configured"""
+
+        NodeIdLease("default", 1, 60).acquire()
+        NodeIdLease("default", 1, 60).acquire()
+
+        with self.assertRaises(ImproperlyConfigured):
+            NodeIdLease("default", 1, 60).acquire()
+
+    @patch("core_module_local_id_registry_app.utils.local_id.time.monotonic")
+    def test_renew_extends_lease(self, mock_monotonic):
+        """test_renew_extends_lease"""
+
+        mock_monotonic.return_value = 0
+        lease = NodeIdLease("default", 2, 60)
+        lease.acquire()
+        mock_monotonic.return_value = 30
+
+        with patch.object(caches["default"], "touch") as mock_touch:
+            self.assertTrue(lease.renew())
+
+        mock_touch.assert_called_with(lease._get_key(0), 60)
+
+    @patch("core_module_local_id_registry_app.utils.local_id.time.monotonic")
+    def test_expired_lease_is_not_renewed(self, mock_monotonic):
+        """test_expired_lease_is_not_renewed"""
+
+        mock_monotonic.return_value = 0
+        lease = NodeIdLease("default", 2, 60)
+        lease.acquire()
+        caches["default"].delete(lease._get_key(0))
+        mock_monotonic.return_value = 30
+
+        self.assertFalse(lease.renew())
+
+
+class TestGetUsedLocalIds(TestCase):
+    """Test Get Used Local Ids"""
+
+    @override_settings(MONGODB_INDEXING=False)
+    @patch("core_module_local_id_registry_app.utils.local_id.Data")
+    def test_single_query_returns_set(self, mock_data):
+        """test_single_query_returns_set"""
+
+        mock_data.objects.filter.return_value.values_list.return_value = [
+            "mock_local_id"
+        ]
+
+        result = local_id_utils.get_used_local_ids(
+            ["mock_local_id", "mock_local_id_2"]
+        )
+
+        self.assertEqual(result, {"mock_local_id"})
+        self.assertEqual(mock_data.objects.filter.call_count, 1)
@@ -0,0 +1,220 @@
+"""Test units"""
+
+import json
+import re
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.utils.manifest import (
+    ValidationManifestCache,
+    build_validation_manifest,
+    to_js_pattern,
+)
+
+
+class TestToJsPattern(TestCase):
+    """Test To Js Pattern"""
+
+    def test_pattern_is_anchored_as_validator(self):
+        """test_pattern_is_anchored_as_validator"""
+
+        self.assertEqual(
+            to_js_pattern(r"[a-z0-9\-]+"), (r"^([a-z0-9\-]+|)$", "")
+        )
+
+    def test_named_groups_are_converted(self):
+        """test_named_groups_are_converted"""
+
+        self.assertEqual(
+            to_js_pattern(r"(?P<year>\d{4})-(?P=year)")[0],
+            r"^((?<year>\d{4})-\k<year>|)$",
+        )
+
+    def test_python_anchors_are_converted(self):
+        """test_python_anchors_are_converted"""
+
+        self.assertEqual(to_js_pattern(r"\Aabc\Z")[0], r"^(^abc$|)$")
+
+    def test_escaped_characters_are_kept(self):
+        """test_escaped_characters_are_kept"""
+
+        self.assertEqual(to_js_pattern(r"a\++\(?")[0], r"^(a\++\(?|)$")
+
+    def test_global_flags_are_converted(self):
+        """test_global_flags_are_converted"""
+
+        self.assertEqual(to_js_pattern(r"(?i)[a-z]+"), (r"^([a-z]+|)$", "i"))
+
+    def test_open_lower_bound_is_converted(self):
+        """test_open_lower_bound_is_converted"""
+
+        self.assertEqual(to_js_pattern(r"a{,3}")[0], r"^(a{0,3}|)$")
+
+    def test_shared_group_extensions_are_kept(self):
+        """test_shared_group_extensions_are_kept"""
+
+        self.assertEqual(
+            to_js_pattern(r"(?:ab)(?=c)(?!d)(?<=e)(?<!f)")[0],
+            r"^((?:ab)(?=c)(?!d)(?<=e)(?<!f)|)$",
+        )
+
+    def test_characters_in_class_are_literal(self):
+        """test_characters_in_class_are_literal"""
+
+        self.assertEqual(to_js_pattern(r"[(?+]+")[0], r"^([(?+]+|)$")
+
+    def test_unsupported_constructs_return_none(self):
+        """test_unsupported_constructs_return_none"""
+
+        for pid_format in [
+            r"(?x) a b",
+            r"(?a)\w+",
+            r"a(?i:b)",
+            r"(?>ab)",
+            r"a++",
+            r"a{2}+",
+            r"(a)?(?(1)b|c)",
+            r"a(?#comment)",
+            r"[]a]",
+            r"[^]a]",
+        ]:
+            with self.subTest(pid_format=pid_format):
+                self.assertIsNone(to_js_pattern(pid_format))
+
+    def test_converted_pattern_matches_as_python(self):
+        """test_converted_pattern_matches_as_python"""
+
+        pid_format = r"(?P<prefix>[a-z]{2})-\d{,3}"
+        source, _ = to_js_pattern(pid_format)
+        # Named groups are the only difference with Python in this pattern.
+        python_source = source.replace("(?<", "(?P<")
+
+        for value in ["ab-123", "ab-", "", "AB-1", "ab-1234"]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    re.match(python_source, value) is None,
+                    re.match(r"^(%s|)$" % pid_format, value) is None,
+                )
+
+
+class TestBuildValidationManifest(TestCase):
+    """Test Build Validation Manifest"""
+
+    def test_manifest_contains_checks(self):
+        """test_manifest_contains_checks"""
+
+        manifest = build_validation_manifest(
+            "[a-z]+",
+            frozenset(["mock_prefix_2", "mock_prefix_1"]),
+            "http://mock_host/pid/",
+            {"info": "mock_box"},
+        )
+
+        self.assertEqual(manifest["host_url"], "http://mock_host/pid/")
+        self.assertEqual(
+            manifest["prefixes"], ["mock_prefix_1", "mock_prefix_2"]
+        )
+        self.assertEqual(
+            manifest["format"], {"source": "^([a-z]+|)$", "flags": ""}
+        )
+        self.assertEqual(manifest["status_boxes"], {"info": "mock_box"})
+
+    def test_unsupported_format_is_null(self):
+        """test_unsupported_format_is_null"""
+
+        manifest = build_validation_manifest(
+            "(?x)[a-z]+", ["mock_prefix"], "mock_host", {"info": "mock_box"}
+        )
+
+        self.assertIsNone(manifest["format"])
+
+    @patch(
+        "core_module_local_id_registry_app.utils.manifest.settings."
+        "PREFIX_SELECT_MAX_OPTIONS",
+        1,
+    )
+    def test_prefixes_above_limit_are_null(self):
+        """test_prefixes_above_limit_are_null"""
+
+        manifest = build_validation_manifest(
+            "[a-z]+",
+            ["mock_prefix_1", "mock_prefix_2"],
+            "mock_host",
+            {"info": "box"},
+        )
+
+        self.assertIsNone(manifest["prefixes"])
+
+    def test_version_is_stable(self):
+        """test_version_is_stable"""
+
+        self.assertEqual(
+            build_validation_manifest(
+                "[a-z]+",
+                ["mock_prefix_1", "mock_prefix_2"],
+                "mock_host",
+                {"info": "box"},
+            )["version"],
+            build_validation_manifest(
+                "[a-z]+",
+                ["mock_prefix_2", "mock_prefix_1"],
+                "mock_host",
+                {"info": "box"},
+            )["version"],
+        )
+
+    def test_version_changes_with_checks(self):
+        """test_version_changes_with_checks"""
+
+        self.assertNotEqual(
+            build_validation_manifest(
+                "[a-z]+", ["mock_prefix"], "mock_host", {"info": "box"}
+            )["version"],
+            build_validation_manifest(
+                "[a-z0-9]+", ["mock_prefix"], "mock_host", {"info": "box"}
+            )["version"],
+        )
+
+
+class TestValidationManifestCache(TestCase):
+    """Test Validation Manifest Cache"""
+
+    def setUp(self) -> None:
+        self.cache = ValidationManifestCache()
+        self.prefixes = frozenset(["mock_prefix"])
+
+    def test_returns_serialized_manifest(self):
+        """test_returns_serialized_manifest"""
+
+        version, content = self.cache.get(
+            "[a-z]+", self.prefixes, "mock_host", {"info": "box"}
+        )
+
+        self.assertEqual(json.loads(content)["version"], version)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.manifest."
+        "build_validation_manifest",
+        wraps=build_validation_manifest,
+    )
+    def test_manifest_built_once(self, mock_build_validation_manifest):
+        """test_manifest_built_once"""
+
+        for _ in range(2):
+            self.cache.get(
+                "[a-z]+", self.prefixes, "mock_host", {"info": "box"}
+            )
+
+        self.assertEqual(mock_build_validation_manifest.call_count, 1)
+
+    def test_manifest_built_again_for_new_settings(self):
+        """test_manifest_built_again_for_new_settings"""
+
+        first_version, _ = self.cache.get(
+            "[a-z]+", self.prefixes, "mock_host", {"info": "box"}
+        )
+        second_version, _ = self.cache.get(
+            "[a-z]+", self.prefixes, "mock_other_host", {"info": "box"}
+        )
+
+        self.assertNotEqual(first_version, second_version)
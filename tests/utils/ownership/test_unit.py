@@ -0,0 +1,336 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from core_module_local_id_registry_app import watch
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.ownership import (
+    PidOwnershipIndex,
+    pid_ownership_index,
+)
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import MockData
+
+
+class MockThread:
+    """Thread running its target on start"""
+
+    def __init__(self, target, args, **kwargs):
+        self.target = target
+        self.args = args
+
+    def start(self):
+        self.target(*self.args)
+
+
+class TestPidOwnershipIndexBuild(TestCase):
+    """Test Pid Ownership Index Build"""
+
+    def setUp(self) -> None:
+        self.index = PidOwnershipIndex(3600)
+        self.index.build(
+            iter([(1, "mock_pid_1"), (2, None), (3, 3), (4, "mock_pid_1")]),
+            "mock.path",
+        )
+
+    def test_pid_is_owned_by_its_data(self):
+        """test_pid_is_owned_by_its_data"""
+
+        self.assertEqual(self.index.get_owner("mock_pid_1", "mock.path"), 1)
+
+    def test_unknown_pid_has_no_owner(self):
+        """test_unknown_pid_has_no_owner"""
+
+        self.assertIsNone(self.index.get_owner("mock_pid_2", "mock.path"))
+
+    def test_non_string_pids_are_not_indexed(self):
+        """test_non_string_pids_are_not_indexed"""
+
+        self.assertEqual(len(self.index), 1)
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_index_is_built_once(self, mock_iter_pid_values, mock_thread):
+        """test_index_is_built_once"""
+
+        mock_thread.side_effect = MockThread
+        self.index.clear()
+        mock_iter_pid_values.return_value = iter([(1, "mock_pid_1")])
+
+        self.index.get_owner("mock_pid_1", "mock.path")
+        self.index.get_owner("mock_pid_1", "mock.path")
+
+        mock_iter_pid_values.assert_called_once_with("mock.path")
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_index_is_built_in_background(
+        self, mock_iter_pid_values, mock_thread
+    ):
+        """test_index_is_built_in_background"""
+
+        self.index.clear()
+
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+        mock_thread.return_value.start.assert_called_once_with()
+        self.assertFalse(mock_iter_pid_values.called)
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_index_is_built_by_one_thread(
+        self, mock_iter_pid_values, mock_thread
+    ):
+        """test_index_is_built_by_one_thread"""
+
+        self.index.clear()
+
+        self.index.get_owner("mock_pid_1", "mock.path")
+        self.index.get_owner("mock_pid_1", "mock.path")
+
+        mock_thread.assert_called_once()
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_path_change_builds_again(self, mock_iter_pid_values, mock_thread):
+        """test_path_change_builds_again"""
+
+        mock_thread.side_effect = MockThread
+        mock_iter_pid_values.return_value = iter([(2, "mock_pid_1")])
+
+        self.assertEqual(
+            self.index.get_owner("mock_pid_1", "mock.other_path"), 2
+        )
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.monotonic")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_expired_index_is_used_while_built_again(
+        self, mock_iter_pid_values, mock_monotonic, mock_thread
+    ):
+        """test_expired_index_is_used_while_built_again"""
+
+        mock_monotonic.return_value = 0
+        self.index.build(iter([(1, "mock_pid_1")]), "mock.path")
+        mock_monotonic.return_value = 3600
+
+        self.assertEqual(self.index.get_owner("mock_pid_1", "mock.path"), 1)
+        mock_thread.return_value.start.assert_called_once_with()
+
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.monotonic")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_expired_index_is_built_again(
+        self, mock_iter_pid_values, mock_monotonic, mock_thread
+    ):
+        """test_expired_index_is_built_again"""
+
+        mock_thread.side_effect = MockThread
+        mock_monotonic.return_value = 0
+        self.index.build(iter([(1, "mock_pid_1")]), "mock.path")
+        mock_iter_pid_values.return_value = iter([(2, "mock_pid_1")])
+        mock_monotonic.return_value = 3600
+
+        self.index.get_owner("mock_pid_1", "mock.path")
+
+        self.assertEqual(self.index.get_owner("mock_pid_1", "mock.path"), 2)
+
+    @patch("core_module_local_id_registry_app.utils.ownership.connections")
+    @patch("core_module_local_id_registry_app.utils.ownership.Thread")
+    @patch("core_module_local_id_registry_app.utils.ownership.iter_pid_values")
+    def test_failed_background_build_is_retried(
+        self, mock_iter_pid_values, mock_thread, mock_connections
+    ):
+        """test_failed_background_build_is_retried"""
+
+        mock_thread.side_effect = MockThread
+        self.index.clear()
+        mock_iter_pid_values.side_effect = ConnectionError()
+
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+
+        self.assertEqual(mock_iter_pid_values.call_count, 2)
+        mock_connections.close_all.assert_called_with()
+
+    def test_failed_build_keeps_index(self):
+        """test_failed_build_keeps_index"""
+
+        def records():
+            yield 2, "mock_pid_2"
+            raise ConnectionError()
+
+        with self.assertRaises(ConnectionError):
+            self.index.build(records(), "mock.path")
+
+        self.assertEqual(self.index.get_owner("mock_pid_1", "mock.path"), 1)
+        self.assertIsNone(self.index.get_owner("mock_pid_2", "mock.path"))
+
+
+class TestPidOwnershipIndexUpdate(TestCase):
+    """Test Pid Ownership Index Update"""
+
+    def setUp(self) -> None:
+        self.index = PidOwnershipIndex(3600)
+        self.index.build(iter([(1, "mock_pid_1")]), "mock.path")
+
+    def test_saved_pid_is_indexed(self):
+        """test_saved_pid_is_indexed"""
+
+        self.index.update(2, "mock_pid_2")
+
+        self.assertEqual(self.index.get_owner("mock_pid_2", "mock.path"), 2)
+
+    def test_changed_pid_is_released(self):
+        """test_changed_pid_is_released"""
+
+        self.index.update(1, "mock_pid_2")
+
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+        self.assertEqual(self.index.get_owner("mock_pid_2", "mock.path"), 1)
+
+    def test_removed_pid_is_released(self):
+        """test_removed_pid_is_released"""
+
+        self.index.remove(1)
+
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+
+    def test_update_before_build_is_ignored(self):
+        """test_update_before_build_is_ignored"""
+
+        self.index.clear()
+        self.index.update(2, "mock_pid_2")
+
+        self.assertEqual(len(self.index), 0)
+
+    def test_update_during_build_is_applied(self):
+        """test_update_during_build_is_applied"""
+
+        def records():
+            yield 1, "mock_pid_1"
+            self.index.update(1, "mock_pid_2")
+
+        self.index.clear()
+        self.index.build(records(), "mock.path")
+
+        self.assertIsNone(self.index.get_owner("mock_pid_1", "mock.path"))
+        self.assertEqual(self.index.get_owner("mock_pid_2", "mock.path"), 1)
+
+
+class TestPidOwnershipIndexVerify(TestCase):
+    """Test Pid Ownership Index Verify"""
+
+    def setUp(self) -> None:
+        self.index = PidOwnershipIndex(3600)
+        self.index.build(
+            iter([(1, "mock_pid_1"), (2, "mock_pid_2")]), "mock.path"
+        )
+
+    def test_consistent_index_has_no_issue(self):
+        """test_consistent_index_has_no_issue"""
+
+        self.assertEqual(
+            self.index.verify(iter([(1, "mock_pid_1"), (2, "mock_pid_2")])),
+            [],
+        )
+
+    def test_inconsistencies_are_returned(self):
+        """test_inconsistencies_are_returned"""
+
+        issues = self.index.verify(
+            iter(
+                [
+                    (1, "mock_pid_1"),
+                    (2, "mock_pid_3"),
+                    (3, "mock_pid_1"),
+                    (4, None),
+                ]
+            )
+        )
+
+        self.assertEqual(
+            issues,
+            [
+                {
+                    "pid": "mock_pid_3",
+                    "data_id": 2,
+                    "indexed_data_id": None,
+                    "issue": "missing",
+                },
+                {
+                    "pid": "mock_pid_1",
+                    "data_id": 3,
+                    "indexed_data_id": 1,
+                    "issue": "duplicate",
+                },
+                {
+                    "pid": "mock_pid_2",
+                    "data_id": None,
+                    "indexed_data_id": 2,
+                    "issue": "extra",
+                },
+            ],
+        )
+
+    def test_other_owner_is_returned(self):
+        """test_other_owner_is_returned"""
+
+        issues = self.index.verify(iter([(1, "mock_pid_2")]))
+
+        self.assertEqual(issues[0]["issue"], "owner")
+        self.assertEqual(issues[0]["indexed_data_id"], 2)
+
+
+class TestPidOwnershipIndexSignals(TestCase):
+    """Test Pid Ownership Index Signals"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        pid_ownership_index.build(
+            iter([(1, "mock_pid_1")]), test_settings.PID_PATH
+        )
+        self.addCleanup(pid_ownership_index.clear)
+
+    @patch(
+        "core_module_local_id_registry_app.watch.settings.PID_OWNERSHIP_INDEX",
+        True,
+    )
+    def test_data_save_signal_updates_index(self):
+        """test_data_save_signal_updates_index"""
+
+        watch.index_data_pid(
+            Mock(),
+            MockData(pk=2, dict_content={"mock": {"path": "mock_pid_2"}}),
+        )
+
+        self.assertEqual(
+            pid_ownership_index.get_owner(
+                "mock_pid_2", test_settings.PID_PATH
+            ),
+            2,
+        )
+
+    def test_disabled_index_is_not_updated(self):
+        """test_disabled_index_is_not_updated"""
+
+        watch.index_data_pid(
+            Mock(),
+            MockData(pk=2, dict_content={"mock": {"path": "mock_pid_2"}}),
+        )
+
+        self.assertIsNone(
+            pid_ownership_index.get_owner("mock_pid_2", test_settings.PID_PATH)
+        )
+
+    def test_data_delete_signal_updates_index(self):
+        """test_data_delete_signal_updates_index"""
+
+        watch.unindex_data_pid(Mock(), MockData(pk=1))
+
+        self.assertIsNone(
+            pid_ownership_index.get_owner("mock_pid_1", test_settings.PID_PATH)
+        )
@@ -0,0 +1,444 @@
+"""Test units"""
+
+from threading import Event
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+import requests
+from django.core.cache import caches
+from django.test import override_settings
+
+from core_module_local_id_registry_app import watch
+from core_module_local_id_registry_app.utils.data import pid_value_cache
+from core_module_local_id_registry_app.utils.pid import (
+    PidCheckUnavailableError,
+    PidVerdictCache,
+    are_pids_defined,
+    get_pid_verdict,
+    is_pid_defined,
+    pid_check_executor,
+    pid_verdict_cache,
+    provider_breaker,
+    stale_pid_verdict_cache,
+)
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.http import reset_session
+from tests import test_settings
+from tests.utils.http.fixtures import StubResolver
+from tests.views.LocalIdRegistryModule.fixtures import MockData, MockPID
+
+
+class TestPidVerdictCache(TestCase):
+    """Test Pid Verdict Cache"""
+
+    def test_local_cache_returns_stored_verdict(self):
+        """test_local_cache_returns_stored_verdict"""
+
+        cache = PidVerdictCache(30)
+        cache.set("mock_pid", False)
+
+        self.assertFalse(cache.get("mock_pid"))
+
+    def test_local_cache_missing_pid_returns_none(self):
+        """test_local_cache_missing_pid_returns_none"""
+
+        self.assertIsNone(PidVerdictCache(30).get("mock_pid"))
+
+    def test_django_cache_returns_stored_verdict(self):
+        """test_django_cache_returns_stored_verdict"""
+
+        cache = PidVerdictCache(30, "default")
+        cache.set("mock_pid", True)
+
+        self.assertTrue(cache.get("mock_pid"))
+        self.assertTrue(caches["default"].get(cache._get_key("mock_pid")))
+
+    def test_django_cache_delete_removes_verdict(self):
+        """test_django_cache_delete_removes_verdict"""
+
+        cache = PidVerdictCache(30, "default")
+        cache.set("mock_pid", True)
+        cache.delete("mock_pid")
+
+        self.assertIsNone(cache.get("mock_pid"))
+
+    def test_zero_ttl_disables_cache(self):
+        """test_zero_ttl_disables_cache"""
+
+        cache = PidVerdictCache(0, "default")
+        cache.set("mock_pid_disabled", True)
+
+        self.assertIsNone(cache.get("mock_pid_disabled"))
+
+
+class TestIsPidDefined(TestCase):
+    """Test Is Pid Defined"""
+
+    def setUp(self) -> None:
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=False,
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+    def test_returns_is_pid_defined_result(self):
+        """test_returns_is_pid_defined_result"""
+
+        self.mock_is_pid_defined.return_value = True
+
+        self.assertTrue(is_pid_defined(str(MockPID())))
+
+    def test_negative_result_is_cached(self):
+        """test_negative_result_is_cached"""
+
+        is_pid_defined(str(MockPID()))
+        is_pid_defined(str(MockPID()))
+
+        self.assertEqual(self.mock_is_pid_defined.call_count, 1)
+
+    def test_pid_is_normalized(self):
+        """test_pid_is_normalized"""
+
+        is_pid_defined(str(MockPID()))
+        is_pid_defined(" %s " % str(MockPID()))
+
+        self.mock_is_pid_defined.assert_called_once_with(str(MockPID()))
+
+
+@patch(
+    "core_module_local_id_registry_app.utils.pid.settings."
+    "REMOTE_PID_CHECK_ENABLED",
+    True,
+)
+class TestIsPidDefinedRemote(TestCase):
+    """Test Is Pid Defined Remote"""
+
+    def setUp(self) -> None:
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        reset_session()
+        self.addCleanup(reset_session)
+
+        self.resolver = StubResolver()
+        self.resolver.start()
+        self.addCleanup(self.resolver.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined"
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+    def test_resolved_pid_is_defined(self):
+        """test_resolved_pid_is_defined"""
+
+        self.assertTrue(is_pid_defined(self.resolver.url + "/prefix/record"))
+        self.mock_is_pid_defined.assert_not_called()
+
+    def test_missing_pid_is_not_defined(self):
+        """test_missing_pid_is_not_defined"""
+
+        self.assertFalse(is_pid_defined(self.resolver.url + "/prefix/missing"))
+
+    def test_resolver_error_raises_error(self):
+        """test_resolver_error_raises_error"""
+
+        with self.assertRaises(requests.HTTPError):
+            is_pid_defined(self.resolver.url + "/prefix/error")
+
+    def test_checks_reuse_connection(self):
+        """test_checks_reuse_connection"""
+
+        for index in range(3):
+            is_pid_defined("%s/prefix/%d" % (self.resolver.url, index))
+
+        self.assertEqual(len(set(self.resolver.client_ports)), 1)
+
+
+class TestArePidsDefined(TestCase):
+    """Test Are Pids Defined"""
+
+    def setUp(self) -> None:
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        reset_session()
+        self.addCleanup(reset_session)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            side_effect=lambda pid: pid.endswith("defined"),
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+    def test_returns_result_of_each_pid(self):
+        """test_returns_result_of_each_pid"""
+
+        self.assertEqual(
+            are_pids_defined(["mock_pid_defined", "mock_pid"]),
+            {"mock_pid_defined": True, "mock_pid": False},
+        )
+
+    def test_failed_check_is_skipped(self):
+        """test_failed_check_is_skipped"""
+
+        self.mock_is_pid_defined.side_effect = Exception()
+
+        self.assertEqual(are_pids_defined(["mock_pid"]), {})
+
+    @patch(
+        "core_module_local_id_registry_app.utils.pid.settings."
+        "REMOTE_PID_CHECK_ENABLED",
+        True,
+    )
+    @patch(
+        "core_module_local_id_registry_app.utils.pid.settings."
+        "REMOTE_PID_CHECK_MAX_CONNECTIONS",
+        4,
+    )
+    def test_remote_checks_run_concurrently(self):
+        """test_remote_checks_run_concurrently"""
+
+        resolver = StubResolver(delay=0.05)
+        resolver.start()
+        self.addCleanup(resolver.stop)
+        pids = ["%s/prefix/%d" % (resolver.url, index) for index in range(8)]
+
+        result = are_pids_defined(
+            pids + [resolver.url + "/prefix/missing", resolver.url + "/error"]
+        )
+
+        self.assertEqual(
+            result,
+            dict(
+                {pid: True for pid in pids},
+                **{resolver.url + "/prefix/missing": False},
+            ),
+        )
+        self.assertGreater(resolver.max_active_requests, 1)
+        self.assertLessEqual(resolver.max_active_requests, 4)
+
+
+class TestGetPidVerdict(TestCase):
+    """Test Get Pid Verdict"""
+
+    def setUp(self) -> None:
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        self.addCleanup(provider_breaker.clear)
+        self.addCleanup(pid_verdict_cache.clear)
+
+        # Released on cleanup, and waited for, so that no check outlives the
+        # test.
+        self.provider_released = Event()
+        self.provider_released.set()
+        self.addCleanup(pid_check_executor.shutdown)
+        self.addCleanup(self.provider_released.set)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            side_effect=self._is_pid_defined,
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+    def _is_pid_defined(self, pid):
+        self.provider_released.wait(5)
+        return True
+
+    def _make_provider_hang(self):
+        self.provider_released.clear()
+
+    def test_returns_fresh_verdict(self):
+        """test_returns_fresh_verdict"""
+
+        self.assertEqual(get_pid_verdict("mock_pid", 1), (True, False))
+
+    def test_without_timeout_checks_in_current_thread(self):
+        """test_without_timeout_checks_in_current_thread"""
+
+        with patch(
+            "core_module_local_id_registry_app.utils.pid.pid_check_executor"
+        ) as mock_executor:
+            self.assertEqual(get_pid_verdict("mock_pid"), (True, False))
+
+        mock_executor.submit.assert_not_called()
+
+    def test_exceeded_budget_returns_stale_verdict(self):
+        """test_exceeded_budget_returns_stale_verdict"""
+
+        stale_pid_verdict_cache.set("mock_pid", False)
+        self._make_provider_hang()
+
+        self.assertEqual(get_pid_verdict("mock_pid", 0.01), (False, True))
+
+    def test_exceeded_budget_without_verdict_returns_pending(self):
+        """test_exceeded_budget_without_verdict_returns_pending"""
+
+        self._make_provider_hang()
+
+        self.assertEqual(get_pid_verdict("mock_pid", 0.01), (None, True))
+
+    def test_background_check_refreshes_verdict(self):
+        """test_background_check_refreshes_verdict"""
+
+        self._make_provider_hang()
+        get_pid_verdict("mock_pid", 0.01)
+        self.provider_released.set()
+
+        self.assertEqual(get_pid_verdict("mock_pid", 1), (True, False))
+        self.assertEqual(self.mock_is_pid_defined.call_count, 1)
+
+    def test_open_circuit_returns_stale_verdict(self):
+        """test_open_circuit_returns_stale_verdict"""
+
+        stale_pid_verdict_cache.set("mock_pid", True)
+
+        for _ in range(provider_breaker.failure_threshold):
+            provider_breaker.record_failure()
+
+        self.assertEqual(get_pid_verdict("mock_pid", 1), (True, True))
+        self.mock_is_pid_defined.assert_not_called()
+
+    def test_open_circuit_without_verdict_raises_error(self):
+        """test_open_circuit_without_verdict_raises_error"""
+
+        for _ in range(provider_breaker.failure_threshold):
+            provider_breaker.record_failure()
+
+        with self.assertRaises(PidCheckUnavailableError):
+            get_pid_verdict("mock_pid", 1)
+
+    def test_failures_open_circuit(self):
+        """test_failures_open_circuit"""
+
+        self.mock_is_pid_defined.side_effect = Exception("mock_error")
+
+        for index in range(provider_breaker.failure_threshold):
+            with self.assertRaises(Exception):
+                is_pid_defined("mock_pid_%d" % index)
+
+        with self.assertRaises(PidCheckUnavailableError):
+            is_pid_defined("mock_pid")
+
+    def test_exceeded_budget_does_not_record_failure(self):
+        """test_exceeded_budget_does_not_record_failure"""
+
+        self._make_provider_hang()
+
+        for _ in range(provider_breaker.failure_threshold):
+            get_pid_verdict("mock_pid", 0)
+
+        self.provider_released.set()
+        pid_check_executor.shutdown()
+
+        self.assertEqual(provider_breaker.state, provider_breaker.CLOSED)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.pid.settings."
+        "PID_CHECK_DEADLINE",
+        1,
+    )
+    @patch("core_module_local_id_registry_app.utils.pid.monotonic")
+    def test_slow_check_records_one_failure(self, mock_monotonic):
+        """test_slow_check_records_one_failure"""
+
+        mock_monotonic.side_effect = [0, 2]
+
+        with patch.object(provider_breaker, "record_failure") as mock_failure:
+            self.assertEqual(get_pid_verdict("mock_pid"), (True, False))
+
+        self.assertEqual(mock_failure.call_count, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.pid.settings."
+        "PID_CHECK_DEADLINE",
+        1,
+    )
+    @patch("core_module_local_id_registry_app.utils.pid.monotonic")
+    def test_fast_check_records_success(self, mock_monotonic):
+        """test_fast_check_records_success"""
+
+        mock_monotonic.side_effect = [0, 0.5]
+
+        with patch.object(provider_breaker, "record_success") as mock_success:
+            get_pid_verdict("mock_pid")
+
+        self.assertEqual(mock_success.call_count, 1)
+
+
+class TestClearDataCaches(TestCase):
+    """Test Clear Data Caches"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        pid_verdict_cache.clear()
+
+        stale_pid_verdict_cache.clear()
+
+        provider_breaker.clear()
+        pid_value_cache.clear()
+
+    def test_current_pid_verdict_is_cleared(self):
+        """test_current_pid_verdict_is_cleared"""
+
+        pid_verdict_cache.set(str(MockPID()), False)
+
+        watch.clear_data_caches(
+            Mock(),
+            MockData(pk=1, dict_content={"mock": {"path": str(MockPID())}}),
+        )
+
+        self.assertIsNone(pid_verdict_cache.get(str(MockPID())))
+
+    def test_previous_pid_verdict_is_cleared(self):
+        """test_previous_pid_verdict_is_cleared"""
+
+        previous_pid = str(MockPID(value="mock_previous_record"))
+        pid_verdict_cache.set(previous_pid, True)
+        pid_value_cache.set(1, (test_settings.PID_PATH, previous_pid))
+
+        watch.clear_data_caches(Mock(), MockData(pk=1))
+
+        self.assertIsNone(pid_verdict_cache.get(previous_pid))
+
+    def test_saved_data_is_not_read(self):
+        """test_saved_data_is_not_read"""
+
+        with patch(
+            "core_module_local_id_registry_app.utils.data._query_pid_value"
+        ) as mock_query_pid_value:
+            watch.clear_data_caches(
+                Mock(),
+                MockData(
+                    pk=1, dict_content={"mock": {"path": str(MockPID())}}
+                ),
+            )
+
+        self.assertFalse(mock_query_pid_value.called)
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_mongo_current_pid_verdict_is_cleared(self):
+        """test_mongo_current_pid_verdict_is_cleared"""
+
+        pid_verdict_cache.set(str(MockPID()), False)
+
+        with patch(
+            "core_module_local_id_registry_app.utils.data._query_pid_value",
+            return_value=str(MockPID()),
+        ) as mock_query_pid_value:
+            watch.clear_data_caches(Mock(), MockData(pk=1))
+
+        mock_query_pid_value.assert_called_with(1, test_settings.PID_PATH)
+        self.assertIsNone(pid_verdict_cache.get(str(MockPID())))
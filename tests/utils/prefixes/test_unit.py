@@ -0,0 +1,73 @@
+"""Test units"""
+
+from unittest.case import TestCase
+
+from core_module_local_id_registry_app.utils.prefixes import PrefixIndex
+
+
+class TestPrefixIndex(TestCase):
+    """Test Prefix Index"""
+
+    def setUp(self) -> None:
+        self.index = PrefixIndex(
+            ["mock_prefix_b", "Mock_prefix_a", "other_prefix", "mock"]
+        )
+
+    def test_contains_known_prefix(self):
+        """test_contains_known_prefix"""
+
+        self.assertIn("other_prefix", self.index)
+
+    def test_does_not_contain_prefix_with_other_case(self):
+        """test_does_not_contain_prefix_with_other_case"""
+
+        self.assertNotIn("mock_prefix_a", self.index)
+
+    def test_len_returns_number_of_prefixes(self):
+        """test_len_returns_number_of_prefixes"""
+
+        self.assertEqual(len(self.index), 4)
+
+    def test_search_empty_query_returns_all_prefixes_sorted(self):
+        """test_search_empty_query_returns_all_prefixes_sorted"""
+
+        self.assertEqual(
+            self.index.search(""),
+            (["mock", "Mock_prefix_a", "mock_prefix_b", "other_prefix"], 4),
+        )
+
+    def test_search_ignores_case(self):
+        """test_search_ignores_case"""
+
+        self.assertEqual(
+            self.index.search("MOCK_"),
+            (["Mock_prefix_a", "mock_prefix_b"], 2),
+        )
+
+    def test_search_without_match_returns_empty_page(self):
+        """test_search_without_match_returns_empty_page"""
+
+        self.assertEqual(self.index.search("unknown"), ([], 0))
+
+    def test_search_returns_requested_page(self):
+        """test_search_returns_requested_page"""
+
+        self.assertEqual(
+            self.index.search("mock", offset=1, limit=1),
+            (["Mock_prefix_a"], 3),
+        )
+
+    def test_search_offset_after_matches_returns_empty_page(self):
+        """test_search_offset_after_matches_returns_empty_page"""
+
+        self.assertEqual(self.index.search("mock", offset=10), ([], 3))
+
+    def test_search_does_not_return_following_prefixes(self):
+        """test_search_does_not_return_following_prefixes"""
+
+        index = PrefixIndex(["prefix_%04d" % index for index in range(1000)])
+
+        self.assertEqual(
+            index.search("prefix_099"),
+            (["prefix_%04d" % index for index in range(990, 1000)], 10),
+        )
@@ -0,0 +1,106 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.utils.providers import (
+    ProviderCache,
+    ResolvedProvider,
+)
+from tests.views.LocalIdRegistryModule.fixtures import MockProvider
+
+
+class TestResolvedProvider(TestCase):
+    """Test Resolved Provider"""
+
+    def test_lookup_url_is_provider_lookup_url(self):
+        """test_lookup_url_is_provider_lookup_url"""
+
+        mock_provider = MockProvider()
+        resolved_provider = ResolvedProvider(mock_provider)
+
+        self.assertEqual(
+            resolved_provider.lookup_url, mock_provider.provider_lookup_url
+        )
+
+    def test_host_url_without_final_slash_is_unchanged(self):
+        """test_host_url_without_final_slash_is_unchanged"""
+
+        mock_provider = MockProvider()
+        mock_provider.provider_lookup_url = "http://mock.com/pid"
+
+        resolved_provider = ResolvedProvider(mock_provider)
+
+        self.assertEqual(resolved_provider.host_url, "http://mock.com/pid")
+
+    def test_host_url_with_final_slash_is_stripped(self):
+        """test_host_url_with_final_slash_is_stripped"""
+
+        mock_provider = MockProvider()
+        mock_provider.provider_lookup_url = "http://mock.com/pid/"
+
+        resolved_provider = ResolvedProvider(mock_provider)
+
+        self.assertEqual(resolved_provider.host_url, "http://mock.com/pid")
+
+
+class TestProviderCacheGet(TestCase):
+    """Test Provider Cache Get"""
+
+    def setUp(self) -> None:
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        self.mock_provider_manager_get = patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+
+        self.cache = ProviderCache()
+
+    def test_first_call_is_a_miss(self):
+        """test_first_call_is_a_miss"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 1})
+
+    def test_second_call_is_a_hit(self):
+        """test_second_call_is_a_hit"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+        self.cache.get("mock_provider", ["mock_prefix"])
+
+        self.assertEqual(self.cache.get_stats(), {"hits": 1, "misses": 1})
+
+    def test_provider_manager_called_once(self):
+        """test_provider_manager_called_once"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+        self.cache.get("mock_provider", ["mock_prefix"])
+
+        self.assertEqual(self.mock_provider_manager_get.call_count, 1)
+
+    def test_system_name_change_invalidates_cache(self):
+        """test_system_name_change_invalidates_cache"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+        self.cache.get("mock_provider_2", ["mock_prefix"])
+
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 2})
+
+    def test_prefixes_change_invalidates_cache(self):
+        """test_prefixes_change_invalidates_cache"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+        self.cache.get("mock_provider", ["mock_prefix", "mock_prefix_2"])
+
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 2})
+
+    def test_clear_resets_cache_and_counters(self):
+        """test_clear_resets_cache_and_counters"""
+
+        self.cache.get("mock_provider", ["mock_prefix"])
+        self.cache.clear()
+        self.cache.get("mock_provider", ["mock_prefix"])
+
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 1})
@@ -0,0 +1,205 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from django.http import HttpResponse
+
+from core_module_local_id_registry_app.utils import timing
+from core_module_local_id_registry_app.utils.timing import (
+    HistogramSink,
+    PhaseTimer,
+    create_phase_timer,
+    get_sinks,
+    report_phase_timer,
+    reset_sinks,
+    time_phase,
+)
+
+
+class TestPhaseTimer(TestCase):
+    """Test Phase Timer"""
+
+    def test_phase_adds_duration(self):
+        """test_phase_adds_duration"""
+
+        timer = PhaseTimer()
+
+        with timer.phase("mock_phase"):
+            pass
+
+        self.assertIn("mock_phase", timer.durations)
+
+    def test_repeated_phase_durations_are_summed(self):
+        """test_repeated_phase_durations_are_summed"""
+
+        timer = PhaseTimer()
+        timer.add("mock_phase", 1.5)
+        timer.add("mock_phase", 2)
+
+        self.assertEqual(timer.durations["mock_phase"], 3.5)
+
+    def test_phase_duration_added_on_error(self):
+        """test_phase_duration_added_on_error"""
+
+        timer = PhaseTimer()
+
+        with self.assertRaises(ValueError):
+            with timer.phase("mock_phase"):
+                raise ValueError("mock_error")
+
+        self.assertIn("mock_phase", timer.durations)
+
+    def test_server_timing_lists_phases_in_order(self):
+        """test_server_timing_lists_phases_in_order"""
+
+        timer = PhaseTimer()
+        timer.add("mock_phase_1", 1.234)
+        timer.add("mock_phase_2", 5)
+
+        self.assertEqual(
+            timer.get_server_timing(),
+            "mock_phase_1;dur=1.23, mock_phase_2;dur=5.00",
+        )
+
+
+class TestTimePhase(TestCase):
+    """Test Time Phase"""
+
+    def test_without_timer_returns_shared_null_context(self):
+        """test_without_timer_returns_shared_null_context"""
+
+        self.assertIs(time_phase(None, "mock_phase_1"), time_phase(None, "x"))
+
+    def test_with_timer_times_phase(self):
+        """test_with_timer_times_phase"""
+
+        timer = PhaseTimer()
+
+        with time_phase(timer, "mock_phase"):
+            pass
+
+        self.assertIn("mock_phase", timer.durations)
+
+
+class TestCreatePhaseTimer(TestCase):
+    """Test Create Phase Timer"""
+
+    @patch.object(timing.settings, "PHASE_TIMING_ENABLED", False)
+    def test_disabled_returns_none(self):
+        """test_disabled_returns_none"""
+
+        self.assertIsNone(create_phase_timer())
+
+    @patch.object(timing.settings, "PHASE_TIMING_ENABLED", True)
+    def test_enabled_returns_timer(self):
+        """test_enabled_returns_timer"""
+
+        self.assertIsInstance(create_phase_timer(), PhaseTimer)
+
+
+class TestHistogramSink(TestCase):
+    """Test Histogram Sink"""
+
+    def test_duration_counted_in_bucket(self):
+        """test_duration_counted_in_bucket"""
+
+        sink = HistogramSink()
+        sink.record("mock_phase", 3)
+
+        self.assertEqual(
+            sink.get_histograms()["mock_phase"]["buckets"]["5"], 1
+        )
+
+    def test_duration_above_bounds_counted_in_inf(self):
+        """test_duration_above_bounds_counted_in_inf"""
+
+        sink = HistogramSink()
+        sink.record("mock_phase", 10000)
+
+        self.assertEqual(
+            sink.get_histograms()["mock_phase"]["buckets"]["inf"], 1
+        )
+
+    def test_count_and_sum(self):
+        """test_count_and_sum"""
+
+        sink = HistogramSink()
+        sink.record("mock_phase", 1)
+        sink.record("mock_phase", 2)
+        histogram = sink.get_histograms()["mock_phase"]
+
+        self.assertEqual((histogram["count"], histogram["sum"]), (2, 3))
+
+    def test_clear_empties_histograms(self):
+        """test_clear_empties_histograms"""
+
+        sink = HistogramSink()
+        sink.record("mock_phase", 1)
+        sink.clear()
+
+        self.assertEqual(sink.get_histograms(), {})
+
+
+class TestReportPhaseTimer(TestCase):
+    """Test Report Phase Timer"""
+
+    def setUp(self) -> None:
+        reset_sinks()
+        self.addCleanup(reset_sinks)
+
+        self.timer = PhaseTimer()
+        self.timer.add("mock_phase", 1)
+        self.request = Mock(method="POST", path="/mock_path")
+        self.response = HttpResponse()
+
+    @patch.object(timing.settings, "PHASE_TIMING_SINKS", [])
+    def test_sets_server_timing_header(self):
+        """test_sets_server_timing_header"""
+
+        report_phase_timer(self.timer, self.request, self.response)
+
+        self.assertEqual(self.response["Server-Timing"], "mock_phase;dur=1.00")
+
+    def test_without_timer_does_not_set_header(self):
+        """test_without_timer_does_not_set_header"""
+
+        report_phase_timer(None, self.request, self.response)
+
+        self.assertFalse(self.response.has_header("Server-Timing"))
+
+    @patch.object(timing.settings, "PHASE_TIMING_SINKS", [])
+    def test_logs_structured_record(self):
+        """test_logs_structured_record"""
+
+        with self.assertLogs(timing.logger, "INFO") as logs:
+            report_phase_timer(self.timer, self.request, self.response)
+
+        self.assertEqual(logs.records[0].phase_timings, {"mock_phase": 1})
+
+    @patch.object(
+        timing.settings,
+        "PHASE_TIMING_SINKS",
+        ["core_module_local_id_registry_app.utils.timing.HistogramSink"],
+    )
+    def test_records_durations_in_sinks(self):
+        """test_records_durations_in_sinks"""
+
+        report_phase_timer(self.timer, self.request, self.response)
+
+        self.assertEqual(
+            get_sinks()[0].get_histograms()["mock_phase"]["count"], 1
+        )
+
+    @patch.object(
+        timing.settings,
+        "PHASE_TIMING_SINKS",
+        ["core_module_local_id_registry_app.utils.timing.HistogramSink"],
+    )
+    def test_sink_error_is_logged(self):
+        """test_sink_error_is_logged"""
+
+        get_sinks()[0].record = Mock(side_effect=Exception("mock_error"))
+
+        with self.assertLogs(timing.logger, "WARNING"):
+            report_phase_timer(self.timer, self.request, self.response)
@@ -0,0 +1,131 @@
+"""Test units"""
+
+from unittest.case import TestCase
+
+from core_module_local_id_registry_app.utils.validators import (
+    PidValidator,
+    PidVerdict,
+    get_pid_validator,
+)
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import MockPID, MockProvider
+
+
+class TestPidValidatorValidate(TestCase):
+    """Test Pid Validator Validate"""
+
+    def setUp(self) -> None:
+        self.validator = PidValidator(
+            test_settings.PID_FORMAT,
+            test_settings.ID_PROVIDER_PREFIXES,
+            MockProvider().provider_lookup_url,
+        )
+
+    def test_valid_pid_returns_valid_verdict(self):
+        """test_valid_pid_returns_valid_verdict"""
+
+        mock_pid = MockPID()
+
+        result = self.validator.validate(str(mock_pid))
+
+        self.assertEqual(
+            result,
+            (
+                MockProvider().provider_lookup_url,
+                mock_pid.prefix,
+                mock_pid.value,
+                PidVerdict.VALID,
+            ),
+        )
+
+    def test_empty_record_returns_valid_verdict(self):
+        """test_empty_record_returns_valid_verdict"""
+
+        result = self.validator.validate(str(MockPID(value="")))
+
+        self.assertEqual(result[3], PidVerdict.VALID)
+
+    def test_record_is_stripped(self):
+        """test_record_is_stripped"""
+
+        result = self.validator.validate("%s " % str(MockPID()))
+
+        self.assertEqual(result[2], MockPID().value)
+
+    def test_single_token_returns_invalid_structure(self):
+        """test_single_token_returns_invalid_structure"""
+
+        result = self.validator.validate("mock_incorrect_url")
+
+        self.assertEqual(
+            result, (None, None, None, PidVerdict.INVALID_STRUCTURE)
+        )
+
+    def test_incorrect_host_returns_invalid_host(self):
+        """test_incorrect_host_returns_invalid_host"""
+
+        result = self.validator.validate(
+            str(MockPID(provider="mock_not_default_provider"))
+        )
+
+        self.assertEqual(result[1:], (None, None, PidVerdict.INVALID_HOST))
+
+    def test_incorrect_prefix_returns_invalid_prefix(self):
+        """test_incorrect_prefix_returns_invalid_prefix"""
+
+        mock_pid = MockPID(prefix="invalid_prefix")
+
+        result = self.validator.validate(str(mock_pid))
+
+        self.assertEqual(
+            result[1:],
+            (mock_pid.prefix, mock_pid.value, PidVerdict.INVALID_PREFIX),
+        )
+
+    def test_incorrect_format_returns_invalid_format(self):
+        """test_incorrect_format_returns_invalid_format"""
+
+        mock_pid = MockPID(value="$invalid_value")
+
+        result = self.validator.validate(str(mock_pid))
+
+        self.assertEqual(
+            result[1:],
+            (mock_pid.prefix, mock_pid.value, PidVerdict.INVALID_FORMAT),
+        )
+
+    def test_none_raises_error(self):
+        """test_none_raises_error"""
+
+        with self.assertRaises(AttributeError):
+            self.validator.validate(None)
+
+
+class TestGetPidValidator(TestCase):
+    """Test Get Pid Validator"""
+
+    def test_same_settings_return_same_validator(self):
+        """test_same_settings_return_same_validator"""
+
+        self.assertIs(
+            get_pid_validator("mock_format", ["mock_prefix"], "mock_url"),
+            get_pid_validator("mock_format", ["mock_prefix"], "mock_url"),
+        )
+
+    def test_different_settings_return_different_validator(self):
+        """test_different_settings_return_different_validator"""
+
+        self.assertIsNot(
+            get_pid_validator("mock_format", ["mock_prefix"], "mock_url"),
+            get_pid_validator("mock_format", ["mock_prefix_2"], "mock_url"),
+        )
+
+    def test_prefix_set_is_shared_with_validator(self):
+        """test_prefix_set_is_shared_with_validator"""
+
+        prefix_set = frozenset(["mock_prefix_3"])
+
+        self.assertIs(
+            get_pid_validator("mock_format", prefix_set, "mock_url").prefixes,
+            prefix_set,
+        )
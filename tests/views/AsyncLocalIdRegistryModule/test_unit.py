@@ -0,0 +1,421 @@
+"""Test units"""
+
+import json
+from threading import Event
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from core_curate_app.components.curate_data_structure.models import (
+    CurateDataStructure,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_parser_app.tools.modules.views.module import AbstractModule
+from core_module_local_id_registry_app.utils.pid import (
+    pid_verdict_cache,
+    provider_breaker,
+    stale_pid_verdict_cache,
+)
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from core_module_local_id_registry_app.utils.rendering import status_box_cache
+from core_module_local_id_registry_app.views.request_state import (
+    RequestState,
+)
+from core_module_local_id_registry_app.views.views import (
+    VERDICT_CONTENT_TYPE,
+    AsyncLocalIdRegistryModule,
+    LocalIdRegistryModule,
+)
+from core_module_local_id_registry_app.config import reload_config
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import (
+    MockPID,
+    MockProvider,
+)
+
+
+class TestAsyncLocalIdRegistryModuleAsView(TestCase):
+    """Test Async Local Id Registry Module As View"""
+
+    def test_view_is_asynchronous(self):
+        """test_view_is_asynchronous"""
+
+        self.assertTrue(
+            iscoroutinefunction(AsyncLocalIdRegistryModule.as_view())
+        )
+
+    def test_view_is_registered_as_synchronous_module(self):
+        """test_view_is_registered_as_synchronous_module"""
+
+        self.assertEqual(
+            AsyncLocalIdRegistryModule.as_view().view_class,
+            LocalIdRegistryModule,
+        )
+
+    def test_view_dispatches_to_shared_instance(self):
+        """test_view_dispatches_to_shared_instance"""
+
+        reload_config()
+        request = Mock(method="POST")
+
+        with patch.object(
+            AsyncLocalIdRegistryModule, "async_dispatch", autospec=True
+        ) as mock_async_dispatch:
+            view = AsyncLocalIdRegistryModule.as_view()
+            async_to_sync(view)(request)
+            async_to_sync(view)(request)
+
+        first_instance, second_instance = [
+            call.args[0] for call in mock_async_dispatch.call_args_list
+        ]
+        self.assertIs(first_instance, second_instance)
+        self.assertIsInstance(first_instance, AsyncLocalIdRegistryModule)
+
+    def test_as_view_with_initkwargs_raises_type_error(self):
+        """test_as_view_with_initkwargs_raises_type_error"""
+
+        with self.assertRaises(TypeError):
+            AsyncLocalIdRegistryModule.as_view(template_name="mock_template")
+
+
+class TestAsyncLocalIdRegistryModuleRetrieveDataWithPID(TestCase):
+    """Test Async Local Id Registry Module Retrieve Data With PID"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+
+        self.module_element = Mock(options={"data": None})
+        patch_element_api = patch(
+            "core_module_local_id_registry_app.views.views."
+            "data_structure_element_api"
+        )
+        self.mock_element_api = patch_element_api.start()
+        self.mock_element_api.get_by_id.return_value = self.module_element
+        self.addCleanup(patch_element_api.stop)
+
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.views.views."
+            "LocalIdRegistryModule._get_curate_datastructure_from_module_id",
+            return_value=Mock(spec=CurateDataStructure, pk=1, data_id=None),
+        )
+        self.mock_get_curate_data_structure = (
+            patch_get_curate_data_structure.start()
+        )
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=False,
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+        self.module = AsyncLocalIdRegistryModule()
+        self.request_state = RequestState()
+
+        self.request = Mock()
+        self.request.method = "POST"
+        self.request.POST = {"module_id": 1, "data": str(MockPID())}
+        self.request.user = create_mock_user("1")
+
+    def test_returns_valid_data(self):
+        """test_returns_valid_data"""
+
+        result = async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(result, str(MockPID()))
+
+    def test_valid_data_state_is_success(self):
+        """test_valid_data_state_is_success"""
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "success")
+
+    def test_curate_data_structure_resolved_from_module_id(self):
+        """test_curate_data_structure_resolved_from_module_id"""
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.mock_get_curate_data_structure.assert_called_once_with(
+            "1", self.request, module_element=self.module_element
+        )
+
+    def test_is_pid_defined_called_once(self):
+        """test_is_pid_defined_called_once"""
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.mock_is_pid_defined.call_count, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.close_old_connections"
+    )
+    def test_pid_check_thread_releases_connection(
+        self, mock_close_old_connections
+    ):
+        """test_pid_check_thread_releases_connection"""
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(mock_close_old_connections.call_count, 1)
+
+    def test_is_pid_defined_not_called_for_invalid_pid(self):
+        """test_is_pid_defined_not_called_for_invalid_pid"""
+
+        self.request.POST["data"] = "mock_incorrect_url"
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertFalse(self.mock_is_pid_defined.called)
+
+    def test_invalid_pid_state_is_invalid(self):
+        """test_invalid_pid_state_is_invalid"""
+
+        self.request.POST["data"] = "mock_incorrect_url"
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "invalid")
+
+    def test_defined_pid_without_data_state_is_invalid(self):
+        """test_defined_pid_without_data_state_is_invalid"""
+
+        self.mock_is_pid_defined.return_value = True
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "invalid")
+
+    def test_is_pid_defined_error_state_is_failure(self):
+        """test_is_pid_defined_error_state_is_failure"""
+
+        self.mock_is_pid_defined.side_effect = Exception("mock_error")
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "failure")
+
+    def test_pid_check_overlaps_data_structure_lookup(self):
+        """test_pid_check_overlaps_data_structure_lookup"""
+
+        data_structure_started = Event()
+        pid_check_started = Event()
+        overlaps = []
+
+        def _run_phase(started, other_started, result):
+            # Each phase waits for the other one: phases run one after the
+            # other time out.
+            started.set()
+            overlaps.append(other_started.wait(timeout=5))
+            return result
+
+        self.mock_get_curate_data_structure.side_effect = (
+            lambda *args, **kwargs: _run_phase(
+                data_structure_started,
+                pid_check_started,
+                Mock(spec=CurateDataStructure, pk=1, data_id=None),
+            )
+        )
+        self.mock_is_pid_defined.side_effect = lambda *args, **kwargs: (
+            _run_phase(pid_check_started, data_structure_started, False)
+        )
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(overlaps, [True, True])
+
+    def test_no_data_state_is_info(self):
+        """test_no_data_state_is_info"""
+
+        del self.request.POST["data"]
+
+        async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "info")
+
+
+class TestAsyncLocalIdRegistryModuleRetrieveDataWithoutPID(TestCase):
+    """Test Async Local Id Registry Module Retrieve Data Without PID"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
+
+        self.module = AsyncLocalIdRegistryModule()
+        self.request_state = RequestState()
+
+        self.request = Mock()
+        self.request.method = "POST"
+        self.request.POST = {"module_id": 1, "data": "mock_data"}
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    def test_data_is_set_to_request_param(
+        self, mock_get_curate_datastructure_from_module_id
+    ):
+        """test_data_is_set_to_request_param"""
+
+        result = async_to_sync(self.module._async_retrieve_data)(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(result, "mock_data")
+        self.assertFalse(mock_get_curate_datastructure_from_module_id.called)
+
+
+class TestAsyncLocalIdRegistryModulePost(TestCase):
+    """Test Async Local Id Registry Module Post"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        status_box_cache.clear()
+
+        self.module_element = Mock(options={"data": None})
+        patch_element_api = patch(
+            "core_module_local_id_registry_app.views.views."
+            "data_structure_element_api"
+        )
+        self.mock_element_api = patch_element_api.start()
+        self.mock_element_api.get_by_id.return_value = self.module_element
+        self.addCleanup(patch_element_api.stop)
+
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.views.views."
+            "LocalIdRegistryModule._get_curate_datastructure_from_module_id",
+            return_value=Mock(spec=CurateDataStructure, pk=1, data_id=None),
+        )
+        patch_get_curate_data_structure.start()
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=False,
+        )
+        patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+        render_template = AbstractModule.render_template
+        patch_render_template = patch(
+            "core_module_local_id_registry_app.views.views.AbstractModule."
+            "render_template",
+            side_effect=lambda template_name, context=None: (
+                context["display"]
+                if template_name == "core_parser_app/module.html"
+                else render_template(template_name, context)
+            ),
+        )
+        patch_render_template.start()
+        self.addCleanup(patch_render_template.stop)
+
+        self.module = AsyncLocalIdRegistryModule()
+
+        self.request = Mock()
+        self.request.method = "POST"
+        self.request.POST = {"module_id": 1, "data": str(MockPID())}
+        self.request.user = create_mock_user("1")
+        self.request.headers = {}
+
+    def test_missing_module_id_returns_400(self):
+        """test_missing_module_id_returns_400"""
+
+        del self.request.POST["module_id"]
+
+        response = async_to_sync(self.module.async_dispatch)(self.request)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_module_data_is_saved(self):
+        """test_module_data_is_saved"""
+
+        async_to_sync(self.module.async_dispatch)(self.request)
+
+        self.mock_element_api.upsert.assert_called_once_with(
+            self.module_element, self.request
+        )
+        self.assertEqual(self.module_element.options["data"], str(MockPID()))
+
+    def test_response_contains_status_box(self):
+        """test_response_contains_status_box"""
+
+        response = async_to_sync(self.module.async_dispatch)(self.request)
+
+        self.assertIn(b"text-success", response.content)
+
+    def test_verdict_is_returned_if_accepted(self):
+        """test_verdict_is_returned_if_accepted"""
+
+        self.request.headers = {"Accept": VERDICT_CONTENT_TYPE}
+
+        response = async_to_sync(self.module.async_dispatch)(self.request)
+
+        self.assertEqual(response["Content-Type"], VERDICT_CONTENT_TYPE)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "state": "success",
+                "prefix": MockPID().prefix,
+                "value": MockPID().value,
+                "message_code": "success",
+            },
+        )
+
+    def test_verdict_mode_saves_module_data(self):
+        """test_verdict_mode_saves_module_data"""
+
+        self.request.headers = {"Accept": VERDICT_CONTENT_TYPE}
+
+        async_to_sync(self.module.async_dispatch)(self.request)
+
+        self.assertEqual(self.module_element.options["data"], str(MockPID()))
@@ -75,6 +75,7 @@ class MockDataStructureApi:
 
     def __init__(self, data=MockData()):
         self.data = data
+        self.data_id = data.pk if data is not None else None
 
 
 def mock_return_fn_args_as_dict(*args, **kwargs):
@@ -1,17 +1,62 @@
 """Test units"""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from os.path import dirname, join
+from threading import Barrier
 from unittest.case import TestCase
 from unittest.mock import patch, Mock
 
+import core_parser_app
 from core_curate_app.components.curate_data_structure.models import (
     CurateDataStructure,
 )
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
-from core_module_local_id_registry_app.views.views import LocalIdRegistryModule
+from django.http import HttpResponse
+from django.contrib.auth.models import Permission, User
+from django.template import Context, Engine
+from django.test import RequestFactory, TestCase as DjangoTestCase
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+from core_parser_app.components.data_structure.models import (
+    DataStructureElement,
+)
+from core_parser_app.tools.modules.views.builtin.input_module import (
+    AbstractInputModule,
+)
+from core_parser_app.tools.modules.views.module import AbstractModule
+from core_module_local_id_registry_app.utils.data_structure import (
+    curate_data_structure_id_cache,
+)
+from core_module_local_id_registry_app.utils import timing
+from core_module_local_id_registry_app.utils.data import pid_value_cache
+from core_module_local_id_registry_app.utils.pid import (
+    pid_verdict_cache,
+    provider_breaker,
+    stale_pid_verdict_cache,
+)
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from core_module_local_id_registry_app.utils.rendering import (
+    PID_EDIT_INPUT_TEMPLATE,
+    STATUS_BOX_TEMPLATE,
+    pid_edit_input_cache,
+    status_box_cache,
+)
+from core_module_local_id_registry_app.views.request_state import (
+    RequestState,
+)
+from core_module_local_id_registry_app.views.views import (
+    CHECK_TASK_SIGNER,
+    VERDICT_CONTENT_TYPE,
+    LocalIdRegistryModule,
+)
+from core_module_local_id_registry_app.config import (
+    PidSettings,
+    reload_config,
+)
 from tests import test_settings
 from tests.views.LocalIdRegistryModule.fixtures import (
     MockPID,
-    mock_return_fn_args_as_dict,
     MockProvider,
     MockData,
     MockDataStructureApi,
@@ -21,11 +66,11 @@ from tests.views.LocalIdRegistryModule.fixtures import (
 class TestLocalIdRegistryModuleInitDefault(TestCase):
     """Test Local Id Registry Module Init Default"""
 
-    def test_error_data_is_none(self):
-        """test_error_data_is_none"""
+    def test_module_holds_no_error_data(self):
+        """test_module_holds_no_error_data"""
 
         local_id_module = LocalIdRegistryModule()
-        self.assertIsNone(local_id_module.error_data)
+        self.assertFalse(hasattr(local_id_module, "error_data"))
 
     @patch(
         "core_parser_app.tools.modules.views.builtin.input_module."
@@ -40,14 +85,100 @@ class TestLocalIdRegistryModuleInitDefault(TestCase):
         mock_abstract_input_module_init.assert_called()
 
 
+class TestLocalIdRegistryModuleSharedInstance(TestCase):
+    """Test Local Id Registry Module Shared Instance"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+
+    def test_instance_is_shared(self):
+        """test_instance_is_shared"""
+
+        self.assertIs(
+            LocalIdRegistryModule.get_shared_instance(),
+            LocalIdRegistryModule.get_shared_instance(),
+        )
+
+    def test_instance_is_built_again_on_config_reload(self):
+        """test_instance_is_built_again_on_config_reload"""
+
+        module = LocalIdRegistryModule.get_shared_instance()
+        reload_config()
+
+        self.assertIsNot(LocalIdRegistryModule.get_shared_instance(), module)
+
+    def test_view_dispatches_to_shared_instance(self):
+        """test_view_dispatches_to_shared_instance"""
+
+        request = Mock(method="POST")
+
+        with patch.object(
+            LocalIdRegistryModule, "dispatch", autospec=True
+        ) as mock_dispatch:
+            view = LocalIdRegistryModule.as_view()
+            view(request)
+            view(request)
+
+        first_module, second_module = [
+            call.args[0] for call in mock_dispatch.call_args_list
+        ]
+        self.assertIs(first_module, second_module)
+        self.assertIs(view.view_class, LocalIdRegistryModule)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_verdict",
+    )
+    def test_concurrent_requests_keep_their_state(self, mock_get_pid_verdict):
+        """test_concurrent_requests_keep_their_state"""
+
+        module = LocalIdRegistryModule.get_shared_instance()
+        barrier = Barrier(2, timeout=5)
+        valid_data = str(MockPID())
+        pending_data = str(MockPID(value="mock_pending_record"))
+
+        def get_pid_verdict(data, timeout):
+            # Both requests are processed before either one completes.
+            barrier.wait()
+            return (None, False) if data == pending_data else (False, False)
+
+        mock_get_pid_verdict.side_effect = get_pid_verdict
+
+        def process(data):
+            request_state = RequestState()
+            module._init_prefix_and_record(
+                data, MockDataStructureApi(), request_state
+            )
+            return module._get_state(request_state)
+
+        with ThreadPoolExecutor(2) as executor:
+            states = list(executor.map(process, [valid_data, pending_data]))
+
+        self.assertEqual(states, ["success", "pending"])
+
+
 class TestLocalIdRegistryModuleInitWithPID(TestCase):
     """Test Local Id Registry Module Init With PID"""
 
     def setUp(self) -> None:
         if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
     def test_placeholder_is_initialized(self):
         """test_placeholder_is_initialized"""
@@ -73,13 +204,18 @@ class TestLocalIdRegistryModuleInitWithPID(TestCase):
         """test_pid_settings_is_initialized"""
 
         self.assertEqual(
-            self.module.pid_settings,
-            {
-                "path": test_settings.PID_PATH,
-                "format": test_settings.PID_FORMAT,
-                "system": test_settings.ID_PROVIDER_SYSTEM_NAME,
-                "prefixes": test_settings.ID_PROVIDER_PREFIXES,
-            },
+            (
+                self.module.pid_settings.path,
+                self.module.pid_settings.format,
+                self.module.pid_settings.system,
+                self.module.pid_settings.prefixes,
+            ),
+            (
+                test_settings.PID_PATH,
+                test_settings.PID_FORMAT,
+                test_settings.ID_PROVIDER_SYSTEM_NAME,
+                tuple(test_settings.ID_PROVIDER_PREFIXES),
+            ),
         )
 
 
@@ -89,8 +225,10 @@ class TestLocalIdRegistryModuleInitWithoutPID(TestCase):
     def setUp(self) -> None:
         while "core_linked_records_app" in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
     def test_placeholder_is_initialized(self):
         """test_placeholder_is_initialized"""
@@ -125,6 +263,7 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
     def setUpClass(cls) -> None:
         if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
 
     def setUp(self) -> None:
         patch_provider_manager = patch(
@@ -133,106 +272,243 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
         )
         patch_provider_manager.start()
         self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
     @staticmethod
     def set_default_test_data(as_string=False):
         """set_default_test_data"""
 
         mock_data = MockPID() if not as_string else str(MockPID())
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
+
+        return [mock_data, mock_curate_data_structure]
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_verdict",
+        return_value=(None, True),
+    )
+    def test_unknown_verdict_sets_pending(self, mock_get_pid_verdict):
+        """test_unknown_verdict_sets_pending"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+
+        result = self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+
+        self.assertEqual(result, mock_data)
+        self.assertEqual(self.module._get_state(self.request_state), "pending")
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_verdict",
+        return_value=(False, True),
+    )
+    def test_stale_verdict_sets_stale(self, mock_get_pid_verdict):
+        """test_stale_verdict_sets_stale"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+
+        self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+
+        self.assertEqual(self.module._get_state(self.request_state), "stale")
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_verdict",
+        return_value=(False, False),
+    )
+    @patch("core_module_local_id_registry_app.views.request_state.monotonic")
+    def test_verdict_waits_for_remaining_budget(
+        self, mock_monotonic, mock_get_pid_verdict
+    ):
+        """test_verdict_waits_for_remaining_budget"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+        mock_monotonic.side_effect = [10, 10.5]
+
+        self.request_state = RequestState(budget=2)
+        self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+
+        mock_get_pid_verdict.assert_called_with(mock_data, 1.5)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_verdict",
+        return_value=(False, False),
+    )
+    def test_verdict_without_deadline_is_not_bounded(
+        self, mock_get_pid_verdict
+    ):
+        """test_verdict_without_deadline_is_not_bounded"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+
+        self.request_state = RequestState(budget=0)
+        self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+
+        mock_get_pid_verdict.assert_called_with(mock_data, None)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_CHECK_ASYNC_TASKS",
+        True,
+    )
+    @patch("core_module_local_id_registry_app.views.views.get_pid_verdict")
+    @patch("core_module_local_id_registry_app.views.views.check_local_id_task")
+    def test_async_tasks_enqueue_checks(
+        self, mock_check_local_id_task, mock_get_pid_verdict
+    ):
+        """test_async_tasks_enqueue_checks"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+        mock_check_local_id_task.delay.return_value = Mock(id="mock_task")
+
+        result = self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+
+        self.assertEqual(result, mock_data)
+        mock_check_local_id_task.delay.assert_called_with(
+            mock_data, mock_curate_data_structure.data_id
+        )
+        self.assertFalse(mock_get_pid_verdict.called)
+        self.assertEqual(
+            CHECK_TASK_SIGNER.unsign(self.request_state.task_id), "mock_task"
+        )
+        self.assertEqual(
+            self.module._get_state(self.request_state), "checking"
+        )
 
-        return [mock_data, mock_curate_data_structure_id, mock_user]
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_CHECK_ASYNC_TASKS",
+        True,
+    )
+    @patch("core_module_local_id_registry_app.views.views.check_local_id_task")
+    def test_async_tasks_skip_known_pids(self, mock_check_local_id_task):
+        """test_async_tasks_skip_known_pids"""
+
+        mock_data, mock_curate_data_structure = self.set_default_test_data(
+            as_string=True
+        )
+
+        self.module._init_prefix_and_record(
+            mock_data,
+            mock_curate_data_structure,
+            self.request_state,
+            pid_defined=False,
+        )
+
+        self.assertFalse(mock_check_local_id_task.delay.called)
+        self.assertIsNone(self.request_state.task_id)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_CHECK_ASYNC_TASKS",
+        True,
+    )
+    @patch("core_module_local_id_registry_app.views.views.check_local_id_task")
+    def test_async_tasks_skip_invalid_local_ids(
+        self, mock_check_local_id_task
+    ):
+        """test_async_tasks_skip_invalid_local_ids"""
+
+        self.module._init_prefix_and_record(
+            "mock_incorrect_url", MockDataStructureApi(), self.request_state
+        )
+
+        self.assertFalse(mock_check_local_id_task.delay.called)
+        self.assertEqual(self.module._get_state(self.request_state), "invalid")
 
     def test_incorrect_host_url_sets_prefix_to_none(self):
         """test_incorrect_host_url_sets_prefix_to_none"""
 
         mock_data = "mock_incorrect_url"
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
 
-        self.assertIsNone(self.module.default_prefix)
+        self.assertIsNone(self.request_state.default_prefix)
 
     def test_incorrect_host_url_sets_value_to_none(self):
         """test_incorrect_host_url_sets_value_to_none"""
 
         mock_data = "mock_incorrect_url"
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
 
-        self.assertIsNone(self.module.default_value)
+        self.assertIsNone(self.request_state.default_value)
 
     def test_incorrect_host_url_sets_error_data(self):
         """test_incorrect_host_url_sets_error_data"""
 
         mock_data = "mock_incorrect_url"
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
 
-        self.assertEqual(self.module.error_data, mock_data)
+        self.assertEqual(self.request_state.error_data, mock_data)
 
-    @patch(
-        "core_module_local_id_registry_app.views.views.curate_data_structure_api"
-    )
-    def test_correct_url_sets_correct_prefix(
-        self, mock_curate_data_structure_api
-    ):
+    def test_correct_url_sets_correct_prefix(self):
         """test_correct_url_sets_correct_prefix"""
 
-        mock_curate_data_structure_api.return_value = None
         mock_data = MockPID()
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            str(mock_data), mock_curate_data_structure_id, mock_user
+            str(mock_data), mock_curate_data_structure, self.request_state
         )
 
-        self.assertEqual(self.module.default_prefix, mock_data.prefix)
+        self.assertEqual(self.request_state.default_prefix, mock_data.prefix)
 
-    @patch(
-        "core_module_local_id_registry_app.views.views.curate_data_structure_api"
-    )
-    def test_correct_url_sets_correct_value(
-        self, mock_curate_data_structure_api
-    ):
+    def test_correct_url_sets_correct_value(self):
         """test_correct_url_sets_correct_value"""
 
-        mock_curate_data_structure_api.return_value = None
         mock_data = MockPID()
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            str(mock_data), mock_curate_data_structure_id, mock_user
+            str(mock_data), mock_curate_data_structure, self.request_state
         )
-        self.assertEqual(self.module.default_value, mock_data.value)
+        self.assertEqual(self.request_state.default_value, mock_data.value)
 
     def test_settings_host_url_uses_default_system(self):
         """test_settings_host_url_uses_default_system"""
 
         mock_data = str(MockPID(provider="mock_not_default_provider"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertEqual(self.module.error_data, mock_data)
+        self.assertEqual(self.request_state.error_data, mock_data)
 
     def test_settings_host_url_does_not_end_with_slash(self):
         """test_settings_host_url_does_not_end_with_slash"""
@@ -240,13 +516,12 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
         mock_data = str(MockPID())
         mock_data = "%s/" % mock_data if mock_data[-1] != "/" else mock_data
 
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertEqual(self.module.error_data, mock_data)
+        self.assertEqual(self.request_state.error_data, mock_data)
 
     def test_settings_host_url_not_equals_to_record_host_url_sets_prefix_to_none(
         self,
@@ -254,13 +529,12 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
         """test_settings_host_url_not_equals_to_record_host_url_sets_prefix_to_none"""
 
         mock_data = str(MockPID(provider="mock_not_default_provider"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNone(self.module.default_prefix)
+        self.assertIsNone(self.request_state.default_prefix)
 
     def test_settings_host_url_not_equals_to_record_host_url_sets_value_to_none(
         self,
@@ -268,13 +542,12 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
         """test_settings_host_url_not_equals_to_record_host_url_sets_value_to_none"""
 
         mock_data = str(MockPID(provider="mock_not_default_provider"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNone(self.module.default_value)
+        self.assertIsNone(self.request_state.default_value)
 
     def test_settings_host_url_not_equals_to_record_host_url_sets_error_data(
         self,
@@ -282,441 +555,670 @@ class TestLocalIdRegistryModuleInitPrefixAndRecord(TestCase):
         """test_settings_host_url_not_equals_to_record_host_url_sets_error_data"""
 
         mock_data = str(MockPID(provider="mock_not_default_provider"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNotNone(self.module.error_data)
+        self.assertIsNotNone(self.request_state.error_data)
 
     def test_invalid_prefix_keeps_prefix(self):
         """test_invalid_prefix_keeps_prefix"""
 
         mock_data = str(MockPID(prefix="invalid_prefix"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNotNone(self.module.default_prefix)
+        self.assertIsNotNone(self.request_state.default_prefix)
 
     def test_invalid_prefix_keeps_value(self):
         """test_invalid_prefix_keeps_value"""
 
         mock_data = str(MockPID(prefix="invalid_prefix"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNotNone(self.module.default_value)
+        self.assertIsNotNone(self.request_state.default_value)
 
     def test_invalid_prefix_sets_error_data(self):
         """test_invalid_prefix_sets_error_data"""
 
         mock_data = str(MockPID(prefix="invalid_prefix"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
+
+        self.module._init_prefix_and_record(
+            mock_data, mock_curate_data_structure, self.request_state
+        )
+        self.assertEqual(self.request_state.error_data, mock_data)
+
+    def test_invalid_prefix_sets_error_code(self):
+        """test_invalid_prefix_sets_error_code"""
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            str(MockPID(prefix="invalid_prefix")),
+            MockDataStructureApi(),
+            self.request_state,
         )
-        self.assertEqual(self.module.error_data, mock_data)
+
+        self.assertEqual(self.request_state.error_code, "invalid_prefix")
 
     def test_invalid_format_keeps_prefix(self):
         """test_invalid_format_keeps_prefix"""
 
         mock_data = str(MockPID(value="$invalid_value"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNotNone(self.module.default_prefix)
+        self.assertIsNotNone(self.request_state.default_prefix)
 
     def test_invalid_format_keeps_value(self):
         """test_invalid_format_keeps_value"""
 
         mock_data = str(MockPID(value="$invalid_value"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertIsNotNone(self.module.default_value)
+        self.assertIsNotNone(self.request_state.default_value)
 
     def test_invalid_format_sets_error_data(self):
         """test_invalid_format_sets_error_data"""
 
         mock_data = str(MockPID(value="$invalid_value"))
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
+        mock_curate_data_structure = MockDataStructureApi()
 
         self.module._init_prefix_and_record(
-            mock_data, mock_curate_data_structure_id, mock_user
+            mock_data, mock_curate_data_structure, self.request_state
         )
-        self.assertEqual(self.module.error_data, mock_data)
+        self.assertEqual(self.request_state.error_data, mock_data)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch(
-        "core_module_local_id_registry_app.views.views.curate_data_structure_api"
-    )
-    def test_unexisting_record_keeps_prefix(
-        self, mock_curate_data_structure_api, mock_is_pid_defined
-    ):
+    def test_unexisting_record_keeps_prefix(self, mock_is_pid_defined):
         """test_unexisting_record_keeps_prefix"""
 
-        mock_curate_data_structure_api.return_value = None
         mock_is_pid_defined.return_value = False
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            *self.set_default_test_data(as_string=True), self.request_state
         )
-        self.assertIsNotNone(self.module.default_prefix)
+        self.assertIsNotNone(self.request_state.default_prefix)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch(
-        "core_module_local_id_registry_app.views.views.curate_data_structure_api"
-    )
-    def test_unexisting_record_keeps_value(
-        self, mock_curate_data_structure_api, mock_is_pid_defined
-    ):
+    def test_unexisting_record_keeps_value(self, mock_is_pid_defined):
         """test_unexisting_record_keeps_value"""
 
-        mock_curate_data_structure_api.return_value = None
         mock_is_pid_defined.return_value = False
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            *self.set_default_test_data(as_string=True), self.request_state
         )
-        self.assertIsNotNone(self.module.default_value)
+        self.assertIsNotNone(self.request_state.default_value)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch(
-        "core_module_local_id_registry_app.views.views.curate_data_structure_api"
-    )
     def test_unexisting_record_sets_error_data_to_none(
-        self, mock_curate_data_structure_api, mock_is_pid_defined
+        self, mock_is_pid_defined
     ):
         """test_unexisting_record_sets_error_data_to_none"""
 
-        mock_curate_data_structure_api.return_value = None
         mock_is_pid_defined.return_value = False
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            *self.set_default_test_data(as_string=True), self.request_state
         )
-        self.assertIsNone(self.module.error_data)
+        self.assertIsNone(self.request_state.error_data)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_editing_existing_record_keeps_prefix(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_editing_existing_record_keeps_prefix"""
 
         mock_data = MockData()
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = (
-            MockDataStructureApi(data=mock_data)
-        )
-        mock_get_value_from_dot_notation.return_value = str(MockPID())
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data)
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            str(MockPID()), mock_curate_data_structure, self.request_state
         )
 
         self.assertEqual(
-            self.module.default_prefix, self.set_default_test_data()[0].prefix
+            self.request_state.default_prefix,
+            self.set_default_test_data()[0].prefix,
         )
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_editing_existing_record_keeps_value(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_editing_existing_record_keeps_value"""
 
         mock_data = MockData()
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = (
-            MockDataStructureApi(data=mock_data)
-        )
-        mock_get_value_from_dot_notation.return_value = str(MockPID())
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data)
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            str(MockPID()), mock_curate_data_structure, self.request_state
         )
 
         self.assertEqual(
-            self.module.default_value, self.set_default_test_data()[0].value
+            self.request_state.default_value,
+            self.set_default_test_data()[0].value,
         )
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_editing_existing_record_sets_error_data_to_none(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_editing_existing_record_sets_error_data_to_none"""
 
-        mock_data = {"id": "mock_id", "dict_content": {}}
+        mock_data = MockData()
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = {
-            "data": mock_data
-        }
-        mock_get_value_from_dot_notation.return_value = str(MockPID())
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data)
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
 
         self.module._init_prefix_and_record(
-            *self.set_default_test_data(as_string=True)
+            str(MockPID()), mock_curate_data_structure, self.request_state
         )
 
-        self.assertIsNone(self.module.error_data)
+        self.assertIsNone(self.request_state.error_data)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_duplicate_pid_keeps_prefix(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_duplicate_pid_keeps_prefix"""
 
         mock_data_1 = MockData(pk=1)
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = (
-            MockDataStructureApi(data=mock_data_1)
-        )
-        mock_get_value_from_dot_notation.return_value = str(
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data_1)
+        mock_get_pid_value_for_data_id.return_value = str(
             MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
 
         mock_data = MockPID()
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
 
         self.module._init_prefix_and_record(
-            str(mock_data), mock_curate_data_structure_id, mock_user
+            str(mock_data), mock_curate_data_structure, self.request_state
         )
 
-        self.assertEqual(self.module.default_prefix, mock_data.prefix)
+        self.assertEqual(self.request_state.default_prefix, mock_data.prefix)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_duplicate_pid_keeps_value(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_duplicate_pid_keeps_value"""
 
         mock_data_1 = MockData(pk=1)
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = (
-            MockDataStructureApi(data=mock_data_1)
-        )
-        mock_get_value_from_dot_notation.return_value = str(
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data_1)
+        mock_get_pid_value_for_data_id.return_value = str(
             MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
 
         mock_data = MockPID()
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
 
         self.module._init_prefix_and_record(
-            str(mock_data), mock_curate_data_structure_id, mock_user
+            str(mock_data), mock_curate_data_structure, self.request_state
         )
 
-        self.assertEqual(self.module.default_value, mock_data.value)
+        self.assertEqual(self.request_state.default_value, mock_data.value)
 
     @patch("core_linked_records_app.system.data.api.is_pid_defined")
-    @patch("core_curate_app.components.curate_data_structure.api.get_by_id")
-    @patch("core_linked_records_app.utils.dict.get_value_from_dot_notation")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
     def test_duplicate_pid_sets_error_data(
         self,
-        mock_get_value_from_dot_notation,
-        mock_curate_data_structure_api_get_by_id,
+        mock_get_pid_value_for_data_id,
         mock_is_pid_defined,
     ):
         """test_duplicate_pid_sets_error_data"""
 
         mock_data_1 = MockData(pk=1)
         mock_is_pid_defined.return_value = True
-        mock_curate_data_structure_api_get_by_id.return_value = (
-            MockDataStructureApi(data=mock_data_1)
-        )
-        mock_get_value_from_dot_notation.return_value = str(
+        mock_curate_data_structure = MockDataStructureApi(data=mock_data_1)
+        mock_get_pid_value_for_data_id.return_value = str(
             MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
 
         mock_data = MockPID()
-        mock_curate_data_structure_id = 1
-        mock_user = create_mock_user("1")
 
         self.module._init_prefix_and_record(
-            str(mock_data), mock_curate_data_structure_id, mock_user
+            str(mock_data), mock_curate_data_structure, self.request_state
         )
 
-        self.assertEqual(self.module.error_data, str(mock_data))
-
-
-class TestLocalIdRegistryModuleGetRetrieveDataWithPID(TestCase):
-    """Test Local Id Registry Module Get Retrieve Data With PID"""
+        self.assertEqual(self.request_state.error_data, str(mock_data))
 
-    def setUp(self) -> None:
-        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
-            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+    @patch("core_linked_records_app.system.data.api.is_pid_defined")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
+    def test_duplicate_pid_sets_error_code(
+        self,
+        mock_get_pid_value_for_data_id,
+        mock_is_pid_defined,
+    ):
+        """test_duplicate_pid_sets_error_code"""
 
-        patch_provider_manager = patch(
-            "core_linked_records_app.utils.providers.ProviderManager.get",
-            return_value=MockProvider(),
+        mock_is_pid_defined.return_value = True
+        mock_curate_data_structure = MockDataStructureApi(data=MockData(pk=1))
+        mock_get_pid_value_for_data_id.return_value = str(
+            MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
-        patch_provider_manager.start()
-        self.addCleanup(patch_provider_manager.stop)
 
-        self.module = LocalIdRegistryModule()
+        self.module._init_prefix_and_record(
+            str(MockPID()), mock_curate_data_structure, self.request_state
+        )
 
-        self.request = Mock()
-        self.request.method = "GET"
-        self.request.GET = dict()
-        self.request.build_absolute_uri = lambda char: ""
+        self.assertEqual(self.request_state.error_code, "pid_taken")
 
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_OWNERSHIP_INDEX",
+        True,
     )
-    def test_data_set_to_default_if_not_in_request(
-        self, mock_get_curate_datastructure_from_module_id
+    @patch("core_module_local_id_registry_app.views.views.pid_ownership_index")
+    @patch(
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
+    )
+    def test_indexed_pid_of_data_is_not_taken(
+        self, mock_get_pid_value_for_data_id, mock_pid_ownership_index
     ):
-        """test_data_set_to_default_if_not_in_request"""
+        """test_indexed_pid_of_data_is_not_taken"""
 
-        mock_get_curate_datastructure_from_module_id.return_value = Mock(
-            spec=CurateDataStructure
+        mock_pid_ownership_index.get_owner.return_value = 1
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
+
+        self.module._init_prefix_and_record(
+            str(MockPID()),
+            MockDataStructureApi(data=MockData(pk=1)),
+            self.request_state,
+            pid_defined=True,
         )
-        result = self.module._retrieve_data(self.request)
 
-        self.assertEqual(result, "")
+        mock_pid_ownership_index.get_owner.assert_called_with(
+            str(MockPID()), test_settings.PID_PATH
+        )
+        mock_get_pid_value_for_data_id.assert_called_with(
+            1, test_settings.PID_PATH
+        )
+        self.assertFalse(mock_pid_ownership_index.update.called)
+        self.assertIsNone(self.request_state.error_code)
 
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_OWNERSHIP_INDEX",
+        True,
     )
+    @patch("core_module_local_id_registry_app.views.views.pid_ownership_index")
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_init_prefix_and_record"
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
     )
-    def test_data_is_set_to_request_param(
-        self,
-        mock_init_prefix_and_record,
-        mock_get_curate_datastructure_from_module_id,
+    def test_stale_indexed_pid_of_data_is_taken(
+        self, mock_get_pid_value_for_data_id, mock_pid_ownership_index
     ):
-        """test_data_is_set_to_request_param"""
+        """test_stale_indexed_pid_of_data_is_taken"""
 
-        mock_request_data = "mock_data"
-        mock_init_prefix_and_record.return_value = mock_request_data
-        mock_get_curate_datastructure_from_module_id.return_value = Mock(
-            spec=CurateDataStructure
+        mock_pid_ownership_index.get_owner.return_value = 1
+        mock_get_pid_value_for_data_id.return_value = str(
+            MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
-        self.request.GET["data"] = mock_request_data
 
-        result = self.module._retrieve_data(self.request)
+        self.module._init_prefix_and_record(
+            str(MockPID()),
+            MockDataStructureApi(data=MockData(pk=1)),
+            self.request_state,
+            pid_defined=True,
+        )
 
-        self.assertEqual(result, mock_request_data)
+        mock_pid_ownership_index.update.assert_called_with(
+            1, str(MockPID(prefix="mock_prefix_2", value="mock_record_2"))
+        )
+        self.assertEqual(self.request_state.error_code, "pid_taken")
 
     @patch(
-        "core_module_local_id_registry_app.views.views.generate_unique_local_id"
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_OWNERSHIP_INDEX",
+        True,
     )
+    @patch("core_module_local_id_registry_app.views.views.pid_ownership_index")
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
     )
-    def test_generate_unique_local_id_not_called(
-        self,
-        mock_get_curate_datastructure_from_module_id,
-        mock_generate_unique_local_id,
+    def test_indexed_pid_of_other_data_is_taken(
+        self, mock_get_pid_value_for_data_id, mock_pid_ownership_index
     ):
-        """test_generate_unique_local_id_not_called"""
+        """test_indexed_pid_of_other_data_is_taken"""
 
-        mock_get_curate_datastructure_from_module_id.return_value = Mock(
-            spec=CurateDataStructure
+        mock_pid_ownership_index.get_owner.return_value = 2
+        mock_get_pid_value_for_data_id.return_value = str(
+            MockPID(prefix="mock_prefix_2", value="mock_record_2")
         )
-        self.module._retrieve_data(self.request)
 
-        self.assertFalse(mock_generate_unique_local_id.called)
+        self.module._init_prefix_and_record(
+            str(MockPID()),
+            MockDataStructureApi(data=MockData(pk=1)),
+            self.request_state,
+            pid_defined=True,
+        )
+
+        self.assertFalse(mock_pid_ownership_index.update.called)
+        self.assertEqual(self.request_state.error_code, "pid_taken")
 
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_OWNERSHIP_INDEX",
+        True,
     )
+    @patch("core_module_local_id_registry_app.views.views.pid_ownership_index")
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_init_prefix_and_record"
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
     )
-    def test_value_is_set_to_data(
-        self,
-        mock_init_prefix_and_record,
-        mock_get_curate_datastructure_from_module_id,
+    def test_stale_indexed_pid_of_other_data_is_not_taken(
+        self, mock_get_pid_value_for_data_id, mock_pid_ownership_index
     ):
-        """test_value_is_set_to_data"""
+        """test_stale_indexed_pid_of_other_data_is_not_taken"""
 
-        mock_get_curate_datastructure_from_module_id.return_value = Mock(
-            spec=CurateDataStructure
+        mock_pid_ownership_index.get_owner.return_value = 2
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
+
+        self.module._init_prefix_and_record(
+            str(MockPID()),
+            MockDataStructureApi(data=MockData(pk=1)),
+            self.request_state,
+            pid_defined=True,
         )
-        mock_request_data = "mock_data"
-        self.request.GET["data"] = mock_request_data
-        self.module._retrieve_data(self.request)
 
-        self.assertEqual(self.module.default_value, mock_request_data)
+        mock_pid_ownership_index.update.assert_called_with(1, str(MockPID()))
+        self.assertIsNone(self.request_state.error_code)
 
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
+        "core_module_local_id_registry_app.views.views.settings."
+        "PID_OWNERSHIP_INDEX",
+        True,
     )
+    @patch("core_module_local_id_registry_app.views.views.pid_ownership_index")
     @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_init_prefix_and_record"
+        "core_module_local_id_registry_app.views.views.get_pid_value_for_data_id"
     )
-    def test_init_prefix_and_record_called_if_data_is(
-        self,
-        mock_init_prefix_and_record,
-        mock_get_curate_datastructure_from_module_id,
+    def test_pid_not_indexed_reads_data(
+        self, mock_get_pid_value_for_data_id, mock_pid_ownership_index
     ):
-        """test_init_prefix_and_record_called_if_data_is"""
+        """test_pid_not_indexed_reads_data"""
 
-        mock_get_curate_datastructure_from_module_id.return_value = Mock(
-            spec=CurateDataStructure
+        mock_pid_ownership_index.get_owner.return_value = None
+        mock_get_pid_value_for_data_id.return_value = str(MockPID())
+
+        self.module._init_prefix_and_record(
+            str(MockPID()),
+            MockDataStructureApi(data=MockData(pk=1)),
+            self.request_state,
+            pid_defined=True,
         )
-        mock_request_data = "mock_data"
-        self.request.GET["data"] = mock_request_data
-        self.module._retrieve_data(self.request)
 
-        self.assertTrue(mock_init_prefix_and_record.called)
+        mock_get_pid_value_for_data_id.assert_called_with(
+            1, test_settings.PID_PATH
+        )
+        self.assertIsNone(self.request_state.error_code)
 
-    @patch(
-        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
-        "_get_curate_datastructure_from_module_id"
-    )
-    @patch(
+
+class TestLocalIdRegistryModuleDispatch(TestCase):
+    """Test Local Id Registry Module Dispatch"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
+
+        def mock_post(module, request, request_state):
+            with request_state.time_phase("mock_phase"):
+                return HttpResponse()
+
+        patch_post = patch.object(
+            LocalIdRegistryModule,
+            "_post",
+            autospec=True,
+            side_effect=mock_post,
+        )
+        patch_post.start()
+        self.addCleanup(patch_post.stop)
+
+        self.module = LocalIdRegistryModule()
+        self.request = Mock(method="POST", path="/mock_path")
+
+    @patch.object(timing.settings, "PHASE_TIMING_ENABLED", False)
+    def test_disabled_timing_does_not_set_server_timing(self):
+        """test_disabled_timing_does_not_set_server_timing"""
+
+        response = self.module.dispatch(self.request)
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @patch.object(timing.settings, "PHASE_TIMING_SINKS", [])
+    @patch.object(timing.settings, "PHASE_TIMING_ENABLED", True)
+    def test_enabled_timing_sets_server_timing(self):
+        """test_enabled_timing_sets_server_timing"""
+
+        response = self.module.dispatch(self.request)
+
+        self.assertTrue(
+            response["Server-Timing"].startswith("mock_phase;dur=")
+        )
+
+    def test_options_lists_allowed_methods(self):
+        """test_options_lists_allowed_methods"""
+
+        self.request.method = "OPTIONS"
+
+        response = self.module.dispatch(self.request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("HEAD", response["Allow"])
+        self.assertIn("POST", response["Allow"])
+
+    def test_head_is_handled_as_get(self):
+        """test_head_is_handled_as_get"""
+
+        self.request.method = "HEAD"
+        self.request.GET = {"module_id": 1}
+
+        with patch.object(
+            LocalIdRegistryModule, "_get", return_value=HttpResponse()
+        ) as mock_get:
+            response = self.module.dispatch(self.request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(mock_get.called)
+
+    def test_unknown_method_returns_405(self):
+        """test_unknown_method_returns_405"""
+
+        self.request.method = "PUT"
+
+        response = self.module.dispatch(self.request)
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_as_view_with_initkwargs_raises_type_error(self):
+        """test_as_view_with_initkwargs_raises_type_error"""
+
+        with self.assertRaises(TypeError):
+            LocalIdRegistryModule.as_view(template_name="mock_template")
+
+
+class TestLocalIdRegistryModuleGetRetrieveDataWithPID(TestCase):
+    """Test Local Id Registry Module Get Retrieve Data With PID"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+
+        self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
+
+        self.request = Mock()
+        self.request.method = "GET"
+        self.request.GET = dict()
+        self.request.build_absolute_uri = lambda char: ""
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    def test_data_set_to_default_if_not_in_request(
+        self, mock_get_curate_datastructure_from_module_id
+    ):
+        """test_data_set_to_default_if_not_in_request"""
+
+        mock_get_curate_datastructure_from_module_id.return_value = Mock(
+            spec=CurateDataStructure
+        )
+        result = self.module._retrieve_data(self.request, self.request_state)
+
+        self.assertEqual(result, "")
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_init_prefix_and_record"
+    )
+    def test_data_is_set_to_request_param(
+        self,
+        mock_init_prefix_and_record,
+        mock_get_curate_datastructure_from_module_id,
+    ):
+        """test_data_is_set_to_request_param"""
+
+        mock_request_data = "mock_data"
+        mock_init_prefix_and_record.return_value = mock_request_data
+        mock_get_curate_datastructure_from_module_id.return_value = Mock(
+            spec=CurateDataStructure
+        )
+        self.request.GET["data"] = mock_request_data
+
+        result = self.module._retrieve_data(self.request, self.request_state)
+
+        self.assertEqual(result, mock_request_data)
+
+    @patch("core_module_local_id_registry_app.views.views.reserve_local_id")
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    def test_reserve_local_id_not_called(
+        self,
+        mock_get_curate_datastructure_from_module_id,
+        mock_reserve_local_id,
+    ):
+        """test_reserve_local_id_not_called"""
+
+        mock_get_curate_datastructure_from_module_id.return_value = Mock(
+            spec=CurateDataStructure
+        )
+        self.module._retrieve_data(self.request, self.request_state)
+
+        self.assertFalse(mock_reserve_local_id.called)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_init_prefix_and_record"
+    )
+    def test_value_is_set_to_data(
+        self,
+        mock_init_prefix_and_record,
+        mock_get_curate_datastructure_from_module_id,
+    ):
+        """test_value_is_set_to_data"""
+
+        mock_get_curate_datastructure_from_module_id.return_value = Mock(
+            spec=CurateDataStructure
+        )
+        mock_request_data = "mock_data"
+        self.request.GET["data"] = mock_request_data
+        self.module._retrieve_data(self.request, self.request_state)
+
+        self.assertEqual(self.request_state.default_value, mock_request_data)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_init_prefix_and_record"
+    )
+    def test_init_prefix_and_record_called_if_data_is(
+        self,
+        mock_init_prefix_and_record,
+        mock_get_curate_datastructure_from_module_id,
+    ):
+        """test_init_prefix_and_record_called_if_data_is"""
+
+        mock_get_curate_datastructure_from_module_id.return_value = Mock(
+            spec=CurateDataStructure
+        )
+        mock_request_data = "mock_data"
+        self.request.GET["data"] = mock_request_data
+        self.module._retrieve_data(self.request, self.request_state)
+
+        self.assertTrue(mock_init_prefix_and_record.called)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
+        "_get_curate_datastructure_from_module_id"
+    )
+    @patch(
         "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
         "_init_prefix_and_record"
     )
@@ -730,7 +1232,7 @@ class TestLocalIdRegistryModuleGetRetrieveDataWithPID(TestCase):
         mock_get_curate_datastructure_from_module_id.return_value = Mock(
             spec=CurateDataStructure
         )
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertTrue(mock_init_prefix_and_record.called)
 
@@ -741,24 +1243,22 @@ class TestLocalIdRegistryModuleGetRetrieveDataWithoutPID(TestCase):
     def setUp(self) -> None:
         while "core_linked_records_app" in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
         self.request = Mock()
         self.request.method = "GET"
         self.request.GET = dict()
 
-    @patch(
-        "core_module_local_id_registry_app.views.views.generate_unique_local_id"
-    )
-    def test_data_is_set_if_not_in_request(
-        self, mock_generate_unique_local_id
-    ):
+    @patch("core_module_local_id_registry_app.views.views.reserve_local_id")
+    def test_data_is_set_if_not_in_request(self, mock_reserve_local_id):
         """test_data_is_set_if_not_in_request"""
 
         mock_generated_data = "mock_generated_data"
-        mock_generate_unique_local_id.return_value = mock_generated_data
-        result = self.module._retrieve_data(self.request)
+        mock_reserve_local_id.return_value = mock_generated_data
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertEqual(result, mock_generated_data)
 
@@ -768,21 +1268,17 @@ class TestLocalIdRegistryModuleGetRetrieveDataWithoutPID(TestCase):
         mock_request_data = "mock_data"
         self.request.GET["data"] = mock_request_data
 
-        result = self.module._retrieve_data(self.request)
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertEqual(result, mock_request_data)
 
-    @patch(
-        "core_module_local_id_registry_app.views.views.generate_unique_local_id"
-    )
-    def test_generate_unique_local_id_called(
-        self, mock_generate_unique_local_id
-    ):
-        """test_generate_unique_local_id_called"""
+    @patch("core_module_local_id_registry_app.views.views.reserve_local_id")
+    def test_reserve_local_id_called(self, mock_reserve_local_id):
+        """test_reserve_local_id_called"""
 
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
-        self.assertTrue(mock_generate_unique_local_id.called)
+        self.assertTrue(mock_reserve_local_id.called)
 
     def test_value_is_set_to_data(self):
         """test_value_is_set_to_data"""
@@ -790,9 +1286,9 @@ class TestLocalIdRegistryModuleGetRetrieveDataWithoutPID(TestCase):
         mock_request_data = "mock_data"
         self.request.GET["data"] = mock_request_data
 
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
-        self.assertEqual(self.module.default_value, mock_request_data)
+        self.assertEqual(self.request_state.default_value, mock_request_data)
 
     @patch(
         "core_module_local_id_registry_app.views.views.LocalIdRegistryModule."
@@ -806,7 +1302,7 @@ class TestLocalIdRegistryModuleGetRetrieveDataWithoutPID(TestCase):
         mock_request_data = "mock_data"
         self.request.GET["data"] = mock_request_data
 
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertFalse(mock_init_prefix_and_record.called)
 
@@ -817,6 +1313,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
     def setUp(self) -> None:
         if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
 
         patch_provider_manager = patch(
             "core_linked_records_app.utils.providers.ProviderManager.get",
@@ -824,8 +1321,10 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
         )
         patch_provider_manager.start()
         self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
         self.request = Mock()
         self.request.method = "POST"
@@ -844,7 +1343,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
         mock_get_curate_datastructure_from_module_id.return_value = Mock(
             spec=CurateDataStructure
         )
-        result = self.module._retrieve_data(self.request)
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertEqual(result, "")
 
@@ -869,7 +1368,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
             spec=CurateDataStructure
         )
         self.request.POST["data"] = mock_data
-        result = self.module._retrieve_data(self.request)
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertEqual(result, mock_data)
 
@@ -893,7 +1392,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
         )
         mock_data = "mock_data"
         self.request.POST["data"] = mock_data
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertTrue(mock_init_prefix_and_record.called)
 
@@ -915,19 +1414,268 @@ class TestLocalIdRegistryModulePostRetrieveDataWithPID(TestCase):
         mock_get_curate_datastructure_from_module_id.return_value = Mock(
             spec=CurateDataStructure
         )
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertTrue(mock_init_prefix_and_record.called)
 
 
+class TestLocalIdRegistryModulePostRetrieveDataQueries(TestCase):
+    """Test Local Id Registry Module Post Retrieve Data Queries"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        curate_data_structure_id_cache.clear()
+
+        patch_get_element = patch(
+            "core_module_local_id_registry_app.utils.data_structure."
+            "data_structure_element_api.get_by_id",
+            return_value=Mock(data_structure_id=1),
+        )
+        self.mock_get_element = patch_get_element.start()
+        self.addCleanup(patch_get_element.stop)
+
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.utils.data_structure."
+            "curate_data_structure_api.get_by_id",
+            return_value=Mock(spec=CurateDataStructure, pk=1, data_id=1),
+        )
+        self.mock_get_curate_data_structure = (
+            patch_get_curate_data_structure.start()
+        )
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=True,
+        )
+        patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+        patch_get_pid_value = patch(
+            "core_module_local_id_registry_app.views.views."
+            "get_pid_value_for_data_id",
+            return_value=str(MockPID()),
+        )
+        patch_get_pid_value.start()
+        self.addCleanup(patch_get_pid_value.stop)
+
+        self.request = Mock()
+        self.request.method = "POST"
+        self.request.POST = {"module_id": 1, "data": str(MockPID())}
+        self.request.user = create_mock_user("1")
+        self.request_state = RequestState()
+
+    def test_curate_data_structure_fetched_once(self):
+        """test_curate_data_structure_fetched_once"""
+
+        LocalIdRegistryModule()._retrieve_data(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 1)
+
+    def test_module_access_checked_once(self):
+        """test_module_access_checked_once"""
+
+        LocalIdRegistryModule()._retrieve_data(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.mock_get_element.call_count, 1)
+
+    def test_curate_data_structure_access_checked_for_request_user(self):
+        """test_curate_data_structure_access_checked_for_request_user"""
+
+        LocalIdRegistryModule()._retrieve_data(
+            self.request, self.request_state
+        )
+
+        self.mock_get_curate_data_structure.assert_called_once_with(
+            1, self.request.user
+        )
+
+    def test_modules_of_same_request_fetch_curate_data_structure_once(self):
+        """test_modules_of_same_request_fetch_curate_data_structure_once"""
+
+        LocalIdRegistryModule()._retrieve_data(
+            self.request, self.request_state
+        )
+        self.request.POST["module_id"] = 2
+        LocalIdRegistryModule()._retrieve_data(
+            self.request, self.request_state
+        )
+
+        self.assertEqual(self.mock_get_curate_data_structure.call_count, 1)
+
+    def test_phases_are_timed(self):
+        """test_phases_are_timed"""
+
+        request_state = RequestState(timing.PhaseTimer())
+        LocalIdRegistryModule()._retrieve_data(self.request, request_state)
+
+        self.assertEqual(
+            list(request_state.phase_timer.durations),
+            ["data_structure", "provider", "pid_defined", "pid_value"],
+        )
+
+    def test_owned_pid_is_valid(self):
+        """test_owned_pid_is_valid"""
+
+        module = LocalIdRegistryModule()
+        module._retrieve_data(self.request, self.request_state)
+
+        self.assertEqual(module._get_state(self.request_state), "success")
+
+
+class TestLocalIdRegistryModulePostRetrieveDataDatabaseQueries(DjangoTestCase):
+    """Test Local Id Registry Module Post Retrieve Data Database Queries"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=True,
+        )
+        patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+        provider_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+        curate_data_structure_id_cache.clear()
+        pid_value_cache.clear()
+
+        user = User.objects.create(username="mock_user")
+        user.user_permissions.add(
+            Permission.objects.get(
+                content_type__app_label="core_curate_app",
+                codename="access_curate_data_structure",
+            )
+        )
+        template = Template.objects.create(
+            filename="mock_template.xsd", file="mock_template.xsd"
+        )
+        data = Data.objects.create(
+            template=template,
+            user_id=str(user.id),
+            title="mock_data",
+            dict_content={"mock": {"path": str(MockPID())}},
+        )
+        curate_data_structure = CurateDataStructure.objects.create(
+            user=str(user.id),
+            template=template,
+            name="mock_form",
+            data=data,
+        )
+        self.module_element = DataStructureElement.objects.create(
+            user=str(user.id),
+            tag="module",
+            data_structure=curate_data_structure,
+        )
+
+        self.user = user
+        self.request = self._build_request()
+
+    def _build_request(self):
+        request = RequestFactory().post(
+            "/",
+            {"module_id": str(self.module_element.pk), "data": str(MockPID())},
+        )
+        request.user = self.user
+
+        return request
+
+    def test_first_edit_queries(self):
+        """test_first_edit_queries"""
+
+        # Module element, its access check (data structure, concrete data
+        # structure, user and group permissions), curate data structure and
+        # PID of the data.
+        with self.assertNumQueries(7):
+            LocalIdRegistryModule()._retrieve_data(
+                self.request, RequestState()
+            )
+
+    def test_post_retrieves_module_element_once(self):
+        """test_post_retrieves_module_element_once"""
+
+        module = LocalIdRegistryModule()
+        request_state = RequestState()
+
+        # The module element retrieved by the post is reused by the
+        # retrieval of its data, with the queries of the first edit.
+        with self.assertNumQueries(7):
+            module._get_module_element(
+                self.request.POST["module_id"], self.request, request_state
+            )
+            module._retrieve_data(self.request, request_state)
+
+    def test_modules_of_same_request_query_once(self):
+        """test_modules_of_same_request_query_once"""
+
+        module = LocalIdRegistryModule()
+        module._retrieve_data(self.request, RequestState())
+
+        with self.assertNumQueries(0):
+            module._retrieve_data(self.request, RequestState())
+
+    def test_next_edit_skips_element_lookup(self):
+        """test_next_edit_skips_element_lookup"""
+
+        LocalIdRegistryModule()._retrieve_data(self.request, RequestState())
+        self.request = self._build_request()
+
+        # Curate data structure only: its id and the PID of the data are
+        # cached.
+        with self.assertNumQueries(1):
+            LocalIdRegistryModule()._retrieve_data(
+                self.request, RequestState()
+            )
+
+    def test_owned_pid_is_valid(self):
+        """test_owned_pid_is_valid"""
+
+        module = LocalIdRegistryModule()
+        request_state = RequestState()
+        module._retrieve_data(self.request, request_state)
+
+        self.assertEqual(module._get_state(request_state), "success")
+
+
 class TestLocalIdRegistryModulePostRetrieveDataWithoutPID(TestCase):
     """Test Local Id Registry Module Post Retrieve Data Without PID"""
 
     def setUp(self) -> None:
         while "core_linked_records_app" in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
 
         self.request = Mock()
         self.request.method = "POST"
@@ -936,7 +1684,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithoutPID(TestCase):
     def test_data_none_if_not_in_request(self):
         """test_data_none_if_not_in_request"""
 
-        result = self.module._retrieve_data(self.request)
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertIsNone(result)
 
@@ -945,7 +1693,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithoutPID(TestCase):
 
         mock_data = "mock_data"
         self.request.POST["data"] = mock_data
-        result = self.module._retrieve_data(self.request)
+        result = self.module._retrieve_data(self.request, self.request_state)
 
         self.assertEqual(result, mock_data)
 
@@ -960,8 +1708,8 @@ class TestLocalIdRegistryModulePostRetrieveDataWithoutPID(TestCase):
 
         mock_data = "mock_data"
         self.request.POST["data"] = mock_data
-        self.module._retrieve_data(self.request)
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertFalse(mock_init_prefix_and_record.called)
 
@@ -974,7 +1722,7 @@ class TestLocalIdRegistryModulePostRetrieveDataWithoutPID(TestCase):
     ):
         """test_init_prefix_and_record_not_called"""
 
-        self.module._retrieve_data(self.request)
+        self.module._retrieve_data(self.request, self.request_state)
 
         self.assertFalse(mock_init_prefix_and_record.called)
 
@@ -985,46 +1733,321 @@ class TestLocalIdRegistryModuleRenderDataWithPID(TestCase):
     def setUp(self) -> None:
         if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
 
-        patch_render_template = patch(
-            "core_module_local_id_registry_app.views.views."
-            "LocalIdRegistryModule.render_template",
-            side_effect=mock_return_fn_args_as_dict,
-        )
-        patch_render_template.start()
-        self.addCleanup(patch_render_template.stop)
+        status_box_cache.clear()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
         self.request = Mock()
 
     def test_no_value_and_no_error_return_info_box(self):
         """test_no_value_and_no_error_return_info_box"""
 
-        self.module.default_value = None
-        self.module.error_data = None
+        self.request_state.default_value = None
+        self.request_state.error_data = None
 
-        result = self.module._render_data(self.request)
+        result = self.module._render_data(self.request, self.request_state)
 
-        self.assertEqual(result["arg1"]["type"], "info")
+        self.assertIn('class="text-info"', result)
 
     def test_error_return_danger_box(self):
         """test_error_return_danger_box"""
 
-        self.module.error_data = "mock_data"
+        self.request_state.error_data = "mock_data"
 
-        result = self.module._render_data(self.request)
+        result = self.module._render_data(self.request, self.request_state)
 
-        self.assertEqual(result["arg1"]["type"], "danger")
+        self.assertIn('class="text-danger"', result)
 
     def test_no_error_return_success_box(self):
         """test_no_error_return_success_box"""
 
-        self.module.default_value = "mock_data"
-        self.module.error_data = None
+        self.request_state.default_value = "mock_data"
+        self.request_state.error_data = None
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertIn('class="text-success"', result)
+
+    def test_pending_verdict_return_warning_box(self):
+        """test_pending_verdict_return_warning_box"""
+
+        self.request_state.default_value = "mock_data"
+        self.request_state.verdict_pending = True
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertIn('class="text-warning"', result)
+        self.assertIn("fa-hourglass-half", result)
 
-        result = self.module._render_data(self.request)
+    def test_stale_verdict_return_warning_box(self):
+        """test_stale_verdict_return_warning_box"""
 
-        self.assertEqual(result["arg1"]["type"], "success")
+        self.request_state.default_value = "mock_data"
+        self.request_state.verdict_stale = True
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertIn('class="text-warning"', result)
+        self.assertIn("fa-history", result)
+
+    def test_error_takes_precedence_over_stale_verdict(self):
+        """test_error_takes_precedence_over_stale_verdict"""
+
+        self.request_state.error_data = "mock_data"
+        self.request_state.verdict_stale = True
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertIn('class="text-danger"', result)
+
+    def test_error_box_contains_escaped_error_data(self):
+        """test_error_box_contains_escaped_error_data"""
+
+        self.request_state.error_data = "<mock_data>"
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertIn("(&lt;mock_data&gt;)", result)
+
+    def test_error_box_matches_template_rendering(self):
+        """test_error_box_matches_template_rendering"""
+
+        self.request_state.error_data = "mock_data & <mock_data>"
+
+        result = self.module._render_data(self.request, self.request_state)
+
+        self.assertEqual(
+            result,
+            LocalIdRegistryModule.render_template(
+                STATUS_BOX_TEMPLATE,
+                {
+                    "icon": "fa-times-circle",
+                    "type": "danger",
+                    "message": "Invalid local ID provided (%s). Select a "
+                    "valid prefix and record name."
+                    % self.request_state.error_data,
+                },
+            ),
+        )
+
+    def test_error_box_fragment_rendered_once(self):
+        """test_error_box_fragment_rendered_once"""
+
+        with patch.object(
+            LocalIdRegistryModule,
+            "render_template",
+            wraps=LocalIdRegistryModule.render_template,
+        ) as mock_render_template:
+            for error_data in ["mock_data_1", "mock_data_2"]:
+                self.request_state.error_data = error_data
+                result = self.module._render_data(
+                    self.request, self.request_state
+                )
+
+        self.assertEqual(mock_render_template.call_count, 1)
+        self.assertIn("(mock_data_2)", result)
+
+    def test_static_box_rendered_once(self):
+        """test_static_box_rendered_once"""
+
+        self.request_state.default_value = "mock_data"
+        self.request_state.error_data = None
+
+        with patch.object(
+            LocalIdRegistryModule,
+            "render_template",
+            wraps=LocalIdRegistryModule.render_template,
+        ) as mock_render_template:
+            self.module._render_data(self.request, self.request_state)
+            self.module._render_data(self.request, self.request_state)
+
+        self.assertEqual(mock_render_template.call_count, 1)
+
+
+class TestLocalIdRegistryModuleGetVerdict(TestCase):
+    """Test Local Id Registry Module Get Verdict"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
+
+    def test_valid_local_id_returns_success(self):
+        """test_valid_local_id_returns_success"""
+
+        self.request_state.default_prefix = "mock_prefix"
+        self.request_state.default_value = "mock_record"
+
+        self.assertEqual(
+            self.module._get_verdict(self.request_state),
+            {
+                "state": "success",
+                "prefix": "mock_prefix",
+                "value": "mock_record",
+                "message_code": "success",
+            },
+        )
+
+    def test_invalid_local_id_returns_error_code(self):
+        """test_invalid_local_id_returns_error_code"""
+
+        self.request_state.error_data = "mock_data"
+        self.request_state.error_code = "invalid_host"
+
+        verdict = self.module._get_verdict(self.request_state)
+
+        self.assertEqual(verdict["state"], "invalid")
+        self.assertEqual(verdict["message_code"], "invalid_host")
+
+    def test_checks_left_to_a_task_return_task_id(self):
+        """test_checks_left_to_a_task_return_task_id"""
+
+        self.request_state.default_prefix = "mock_prefix"
+        self.request_state.default_value = "mock_record"
+        self.request_state.task_id = "mock_task"
+
+        verdict = self.module._get_verdict(self.request_state)
+
+        self.assertEqual(verdict["state"], "checking")
+        self.assertEqual(verdict["message_code"], "checking")
+        self.assertEqual(verdict["task_id"], "mock_task")
+
+    def test_verdict_does_not_render_templates(self):
+        """test_verdict_does_not_render_templates"""
+
+        self.request_state.default_value = "mock_record"
+
+        with patch.object(
+            LocalIdRegistryModule, "render_template"
+        ) as mock_render_template:
+            self.module._get_verdict(self.request_state)
+
+        self.assertFalse(mock_render_template.called)
+
+
+class TestLocalIdRegistryModulePost(TestCase):
+    """Test Local Id Registry Module Post"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+        status_box_cache.clear()
+
+        self.module_element = Mock(options={"data": None})
+        patch_element_api = patch(
+            "core_module_local_id_registry_app.views.views."
+            "data_structure_element_api"
+        )
+        self.mock_element_api = patch_element_api.start()
+        self.mock_element_api.get_by_id.return_value = self.module_element
+        self.addCleanup(patch_element_api.stop)
+
+        def retrieve_data(module, request, request_state):
+            request_state.default_prefix = "mock_prefix"
+            request_state.default_value = "mock_record"
+            return "mock_data"
+
+        patch_retrieve_data = patch.object(
+            LocalIdRegistryModule,
+            "_retrieve_data",
+            autospec=True,
+            side_effect=retrieve_data,
+        )
+        self.mock_retrieve_data = patch_retrieve_data.start()
+        self.addCleanup(patch_retrieve_data.stop)
+
+        render_template = AbstractModule.render_template
+        patch_render_template = patch(
+            "core_module_local_id_registry_app.views.views.AbstractModule."
+            "render_template",
+            side_effect=lambda template_name, context=None: (
+                context["display"]
+                if template_name == "core_parser_app/module.html"
+                else render_template(template_name, context)
+            ),
+        )
+        patch_render_template.start()
+        self.addCleanup(patch_render_template.stop)
+
+        self.module = LocalIdRegistryModule()
+        self.request = Mock(method="POST", path="/mock_path")
+        self.request.POST = {"module_id": 1, "data": "mock_data"}
+        self.request.headers = {}
+
+    def test_html_is_returned_by_default(self):
+        """test_html_is_returned_by_default"""
+
+        response = self.module.dispatch(self.request)
+
+        self.assertIn("text-success", json.loads(response.content)["html"])
+        self.assertNotEqual(response["Content-Type"], VERDICT_CONTENT_TYPE)
+
+    def test_verdict_is_returned_if_accepted(self):
+        """test_verdict_is_returned_if_accepted"""
+
+        self.request.headers = {"Accept": VERDICT_CONTENT_TYPE}
+
+        response = self.module.dispatch(self.request)
+
+        self.assertEqual(response["Content-Type"], VERDICT_CONTENT_TYPE)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "state": "success",
+                "prefix": "mock_prefix",
+                "value": "mock_record",
+                "message_code": "success",
+            },
+        )
+
+    def test_response_varies_with_accept(self):
+        """test_response_varies_with_accept"""
+
+        response = self.module.dispatch(self.request)
+
+        self.assertEqual(response["Vary"], "Accept")
+
+    def test_html_contains_task_id_of_checks(self):
+        """test_html_contains_task_id_of_checks"""
+
+        def retrieve_data(module, request, request_state):
+            request_state.default_prefix = "mock_prefix"
+            request_state.default_value = "mock_record"
+            request_state.task_id = "mock_task"
+            return "mock_data"
+
+        self.mock_retrieve_data.side_effect = retrieve_data
+
+        response = self.module.dispatch(self.request)
+
+        content = json.loads(response.content)
+
+        self.assertEqual(content["task_id"], "mock_task")
+        self.assertIn("fa-spinner", content["html"])
+
+    def test_html_without_task_has_no_task_id(self):
+        """test_html_without_task_has_no_task_id"""
+
+        response = self.module.dispatch(self.request)
+
+        self.assertNotIn("task_id", json.loads(response.content))
+
+    def test_module_data_is_saved_in_both_modes(self):
+        """test_module_data_is_saved_in_both_modes"""
+
+        for accept in ["", VERDICT_CONTENT_TYPE]:
+            self.request.headers = {"Accept": accept}
+            self.module_element.options = {"data": None}
+
+            self.module.dispatch(self.request)
+
+            self.assertEqual(self.module_element.options["data"], "mock_data")
 
 
 class TestLocalIdRegistryModuleRenderDataWithoutPID(TestCase):
@@ -1033,14 +2056,16 @@ class TestLocalIdRegistryModuleRenderDataWithoutPID(TestCase):
     def setUp(self) -> None:
         while "core_linked_records_app" in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
         self.request = Mock()
 
     def test_returns_empty_string(self):
         """test_returns_empty_string"""
 
-        result = self.module._render_data(self.request)
+        result = self.module._render_data(self.request, self.request_state)
 
         self.assertEqual(result, "")
 
@@ -1052,52 +2077,194 @@ class TestLocalIdRegistryModuleRenderModuleWithPID(TestCase):
     def setUpClass(cls) -> None:
         if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
 
     def setUp(self) -> None:
         self.mock_abstract_render_module = "mock_abstract_render_module"
         patch_render_module = patch(
             "core_module_local_id_registry_app.views.views."
-            "AbstractInputModule._render_module",
+            "LocalIdRegistryModule._render_input",
             return_value=self.mock_abstract_render_module,
         )
         patch_render_module.start()
         self.addCleanup(patch_render_module.stop)
 
-        patch_render_template = patch(
-            "core_module_local_id_registry_app.views.views."
-            "AbstractInputModule.render_template",
-            side_effect=mock_return_fn_args_as_dict,
-        )
-        patch_render_template.start()
-        self.addCleanup(patch_render_template.stop)
-
         patch_provider_manager = patch(
             "core_linked_records_app.utils.providers.ProviderManager.get",
             return_value=MockProvider(),
         )
         patch_provider_manager.start()
         self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        pid_edit_input_cache.clear()
 
         self.module = LocalIdRegistryModule()
-        self.module.default_prefix = "mock_default_prefix"
+        self.request_state = RequestState()
+        self.request_state.default_prefix = "mock_default_prefix"
         self.request = Mock()
 
+    def _render_template(self, prefixes, default_prefix):
+        """Render the wrapper template directly, for comparison."""
+
+        return LocalIdRegistryModule.render_template(
+            PID_EDIT_INPUT_TEMPLATE,
+            context={
+                "pid_host_url": "http://hostname.com/pid/mock_provider",
+                "pid_prefixes": prefixes,
+                "default_prefix": default_prefix,
+                "default_input_module": self.mock_abstract_render_module,
+                "manifest_url": "/module-local-id-registry/manifest",
+                "check_url": "/module-local-id-registry/check",
+            },
+        )
+
     def test_context_pid_host_does_not_contains_final_slash(self):
         """test_context_pid_host_does_not_contains_final_slash"""
 
-        result = self.module._render_module(self.request)
+        result = self.module._render_module(self.request, self.request_state)
 
-        self.assertNotEqual(result["context"]["pid_host_url"][-1], "/")
+        self.assertIn(
+            '<div class="pid-host-url">http://hostname.com/pid/mock_provider'
+            "</div>",
+            result,
+        )
 
     def test_context_contains_input_module(self):
         """test_context_contains_input_module"""
 
-        result = self.module._render_module(self.request)
+        result = self.module._render_module(self.request, self.request_state)
+
+        self.assertIn(self.mock_abstract_render_module, result)
+
+    def test_default_prefix_is_selected(self):
+        """test_default_prefix_is_selected"""
+
+        self.request_state.default_prefix = "mock_prefix"
+
+        result = self.module._render_module(self.request, self.request_state)
 
         self.assertEqual(
-            result["context"]["default_input_module"],
-            self.mock_abstract_render_module,
+            result, self._render_template(["mock_prefix"], "mock_prefix")
+        )
+
+    def test_unknown_prefix_is_not_selected(self):
+        """test_unknown_prefix_is_not_selected"""
+
+        result = self.module._render_module(self.request, self.request_state)
+
+        self.assertEqual(
+            result,
+            self._render_template(["mock_prefix"], "mock_default_prefix"),
+        )
+
+    def test_many_prefixes_render_as_template(self):
+        """test_many_prefixes_render_as_template"""
+
+        prefixes = ["mock_prefix_%d" % index for index in range(10)] + [
+            "mock<prefix>"
+        ]
+        self.module.pid_settings = PidSettings(
+            test_settings.PID_PATH,
+            test_settings.PID_FORMAT,
+            test_settings.ID_PROVIDER_SYSTEM_NAME,
+            prefixes,
+        )
+
+        for default_prefix in ["mock_prefix_3", "mock<prefix>", None]:
+            self.request_state.default_prefix = default_prefix
+
+            self.assertEqual(
+                self.module._render_module(self.request, self.request_state),
+                self._render_template(prefixes, default_prefix),
+            )
+
+    def test_wrapper_rendered_once(self):
+        """test_wrapper_rendered_once"""
+
+        with patch.object(
+            AbstractInputModule,
+            "render_template",
+            wraps=AbstractInputModule.render_template,
+        ) as mock_render_template:
+            self.module._render_module(self.request, self.request_state)
+            self.request_state.default_prefix = "mock_prefix"
+            self.module._render_module(self.request, self.request_state)
+
+        self.assertEqual(mock_render_template.call_count, 1)
+
+    @patch(
+        "core_module_local_id_registry_app.utils.rendering.settings."
+        "PREFIX_SELECT_MAX_OPTIONS",
+        2,
+    )
+    def test_prefixes_above_limit_render_selected_prefix_only(self):
+        """test_prefixes_above_limit_render_selected_prefix_only"""
+
+        prefixes = ["mock_prefix_%d" % index for index in range(3)] + [
+            "mock<prefix>"
+        ]
+        self.module.pid_settings = PidSettings(
+            test_settings.PID_PATH,
+            test_settings.PID_FORMAT,
+            test_settings.ID_PROVIDER_SYSTEM_NAME,
+            prefixes,
+        )
+
+        for default_prefix, expected_prefix in [
+            ("mock_prefix_2", "mock_prefix_2"),
+            ("mock<prefix>", "mock<prefix>"),
+            ("mock_default_prefix", "mock_prefix_0"),
+            (None, "mock_prefix_0"),
+        ]:
+            self.request_state.default_prefix = default_prefix
+
+            self.assertEqual(
+                self.module._render_module(self.request, self.request_state),
+                LocalIdRegistryModule.render_template(
+                    PID_EDIT_INPUT_TEMPLATE,
+                    context={
+                        "pid_host_url": "http://hostname.com/pid/mock_provider",
+                        "pid_prefixes": [expected_prefix],
+                        "default_prefix": expected_prefix,
+                        "default_input_module": self.mock_abstract_render_module,
+                        "manifest_url": "/module-local-id-registry/manifest",
+                        "check_url": "/module-local-id-registry/check",
+                        "prefix_search_url": "/module-local-id-registry/prefixes",
+                    },
+                ),
+            )
+
+    @patch(
+        "core_module_local_id_registry_app.utils.rendering.settings."
+        "PREFIX_SELECT_MAX_OPTIONS",
+        0,
+    )
+    def test_prefixes_above_limit_render_search(self):
+        """test_prefixes_above_limit_render_search"""
+
+        result = self.module._render_module(self.request, self.request_state)
+
+        self.assertIn(
+            'data-prefix-search-url="/module-local-id-registry/prefixes"',
+            result,
         )
+        self.assertIn('class="pid-prefix-search"', result)
+
+    def test_manifest_url_is_rendered(self):
+        """test_manifest_url_is_rendered"""
+
+        result = self.module._render_module(self.request, self.request_state)
+
+        self.assertIn(
+            'data-manifest-url="/module-local-id-registry/manifest"', result
+        )
+
+    def test_prefixes_below_limit_do_not_render_search(self):
+        """test_prefixes_below_limit_do_not_render_search"""
+
+        result = self.module._render_module(self.request, self.request_state)
+
+        self.assertNotIn("pid-prefix-search", result)
 
 
 class TestLocalIdRegistryModuleRenderModuleWithoutPID(TestCase):
@@ -1106,19 +2273,65 @@ class TestLocalIdRegistryModuleRenderModuleWithoutPID(TestCase):
     def setUp(self) -> None:
         while "core_linked_records_app" in test_settings.INSTALLED_APPS:
             test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
 
         self.module = LocalIdRegistryModule()
+        self.request_state = RequestState()
         self.request = Mock()
 
     @patch(
         "core_module_local_id_registry_app.views.views."
-        "AbstractInputModule._render_module"
+        "LocalIdRegistryModule._render_input"
     )
     def test_returns_input_module(self, mock_render_module):
         """test_returns_input_module"""
 
         mock_module = "mock_module"
         mock_render_module.return_value = mock_module
-        result = self.module._render_module(self.request)
+        result = self.module._render_module(self.request, self.request_state)
 
         self.assertEqual(mock_module, result)
+
+
+class TestLocalIdRegistryModuleRenderInput(TestCase):
+    """Test Local Id Registry Module Render Input"""
+
+    def setUp(self) -> None:
+        # The input template of the parser is rendered from its module
+        # templates directory.
+        engine = Engine(
+            dirs=[
+                join(
+                    dirname(core_parser_app.__file__),
+                    "tools",
+                    "modules",
+                    "templates",
+                )
+            ]
+        )
+
+        patch_render_template = patch(
+            "core_module_local_id_registry_app.views.views.AbstractModule."
+            "render_template",
+            side_effect=lambda template_name, context: engine.get_template(
+                template_name
+            ).render(Context(context)),
+        )
+        patch_render_template.start()
+        self.addCleanup(patch_render_template.stop)
+
+        self.module = LocalIdRegistryModule()
+
+    def test_no_data_renders_empty_input(self):
+        """test_no_data_renders_empty_input"""
+
+        result = self.module._render_input(None)
+
+        self.assertNotIn('value="None"', result)
+
+    def test_data_renders_input_value(self):
+        """test_data_renders_input_value"""
+
+        result = self.module._render_input(str(MockPID()))
+
+        self.assertIn('value="%s"' % str(MockPID()), result)
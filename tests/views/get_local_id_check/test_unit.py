@@ -0,0 +1,126 @@
+"""Test units"""
+
+import json
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.test import RequestFactory
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.rendering import status_box_cache
+from core_module_local_id_registry_app.views.views import (
+    CHECK_TASK_SIGNER,
+    get_local_id_check,
+)
+from tests import test_settings
+
+
+class TestGetLocalIdCheck(TestCase):
+    """Test Get Local Id Check"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+        status_box_cache.clear()
+
+        patch_async_result = patch(
+            "core_module_local_id_registry_app.views.views.AsyncResult"
+        )
+        self.mock_async_result = patch_async_result.start()
+        self.addCleanup(patch_async_result.stop)
+        self.mock_result = self.mock_async_result.return_value
+
+        self.request_factory = RequestFactory()
+        self.task_id = CHECK_TASK_SIGNER.sign("mock_task")
+
+    def _get(self, **params):
+        return get_local_id_check(
+            self.request_factory.get("/mock_path", params)
+        )
+
+    def test_without_linked_records_returns_400(self):
+        """test_without_linked_records_returns_400"""
+
+        test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        self.addCleanup(
+            test_settings.INSTALLED_APPS.append, "core_linked_records_app"
+        )
+        reload_config()
+        self.addCleanup(reload_config)
+
+        self.assertEqual(self._get(task_id=self.task_id).status_code, 400)
+
+    def test_without_task_id_returns_400(self):
+        """test_without_task_id_returns_400"""
+
+        self.assertEqual(self._get().status_code, 400)
+
+    def test_post_returns_405(self):
+        """test_post_returns_405"""
+
+        response = get_local_id_check(
+            self.request_factory.post("/mock_path", {"task_id": self.task_id})
+        )
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_running_task_returns_checking(self):
+        """test_running_task_returns_checking"""
+
+        self.mock_result.successful.return_value = False
+        self.mock_result.ready.return_value = False
+
+        content = json.loads(self._get(task_id=self.task_id).content)
+
+        self.mock_async_result.assert_called_with("mock_task")
+        self.assertEqual(content["state"], "checking")
+        self.assertIn("fa-spinner", content["html"])
+
+    def test_successful_task_returns_its_verdict(self):
+        """test_successful_task_returns_its_verdict"""
+
+        verdict = {
+            "state": "success",
+            "prefix": "mock_prefix",
+            "value": "mock_record",
+            "message_code": "success",
+            "html": "mock_html",
+        }
+        self.mock_result.successful.return_value = True
+        self.mock_result.result = verdict
+
+        content = json.loads(self._get(task_id=self.task_id).content)
+
+        self.assertEqual(content, verdict)
+
+    def test_unsigned_task_id_returns_400(self):
+        """test_unsigned_task_id_returns_400"""
+
+        response = self._get(task_id="mock_task")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.mock_async_result.called)
+
+    def test_result_of_other_task_returns_failure(self):
+        """test_result_of_other_task_returns_failure"""
+
+        self.mock_result.successful.return_value = True
+        self.mock_result.ready.return_value = True
+        self.mock_result.result = {"state": "success", "secret": "mock"}
+
+        content = json.loads(self._get(task_id=self.task_id).content)
+
+        self.assertEqual(content["state"], "failure")
+        self.assertNotIn("secret", content)
+
+    def test_failed_task_returns_failure(self):
+        """test_failed_task_returns_failure"""
+
+        self.mock_result.successful.return_value = False
+        self.mock_result.ready.return_value = True
+
+        content = json.loads(self._get(task_id=self.task_id).content)
+
+        self.assertEqual(content["state"], "failure")
+        self.assertIn("text-danger", content["html"])
@@ -0,0 +1,168 @@
+"""Test units"""
+
+import json
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.test import RequestFactory
+from django.utils.html import escape
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.utils.manifest import (
+    validation_manifest_cache,
+)
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from core_module_local_id_registry_app.utils.rendering import (
+    STATUS_BOX_MESSAGE_PLACEHOLDER,
+    status_box_cache,
+)
+from core_module_local_id_registry_app.views.views import (
+    LocalIdRegistryModule,
+    get_validation_manifest,
+)
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import MockProvider
+
+
+class TestGetValidationManifest(TestCase):
+    """Test Get Validation Manifest"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        status_box_cache.clear()
+        validation_manifest_cache.clear()
+
+        self.request_factory = RequestFactory()
+
+    def _get(self, **headers):
+        return get_validation_manifest(
+            self.request_factory.get("/mock_path", **headers)
+        )
+
+    def test_without_linked_records_returns_400(self):
+        """test_without_linked_records_returns_400"""
+
+        test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        self.addCleanup(
+            test_settings.INSTALLED_APPS.append, "core_linked_records_app"
+        )
+        reload_config()
+        self.addCleanup(reload_config)
+
+        self.assertEqual(self._get().status_code, 400)
+
+    def test_post_returns_405(self):
+        """test_post_returns_405"""
+
+        response = get_validation_manifest(
+            self.request_factory.post("/mock_path")
+        )
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_manifest_contains_pid_settings(self):
+        """test_manifest_contains_pid_settings"""
+
+        manifest = json.loads(self._get().content)
+
+        self.assertEqual(
+            manifest["host_url"], "http://hostname.com/pid/mock_provider"
+        )
+        self.assertEqual(manifest["prefixes"], ["mock_prefix"])
+        self.assertEqual(
+            manifest["format"]["source"], "^(%s|)$" % test_settings.PID_FORMAT
+        )
+
+    def test_invalid_box_matches_server_box(self):
+        """test_invalid_box_matches_server_box"""
+
+        manifest = json.loads(self._get().content)
+
+        self.assertIn("text-danger", manifest["status_boxes"]["invalid"])
+        self.assertIn(
+            "Invalid local ID provided (__LOCAL_ID_STATUS_BOX_MESSAGE__).",
+            manifest["status_boxes"]["invalid"],
+        )
+
+    def test_invalid_box_filled_with_local_id_matches_server_box(self):
+        """test_invalid_box_filled_with_local_id_matches_server_box"""
+
+        local_id = "http://mock_host/<mock_prefix>/mock&record"
+        manifest = json.loads(self._get().content)
+
+        # Filled as the browser does, with the escaped local id only.
+        box = manifest["status_boxes"]["invalid"].replace(
+            STATUS_BOX_MESSAGE_PLACEHOLDER, escape(local_id)
+        )
+
+        self.assertEqual(box.count("Invalid local ID provided"), 1)
+        self.assertEqual(
+            box,
+            LocalIdRegistryModule.get_shared_instance()._render_status_box(
+                "invalid", local_id
+            ),
+        )
+
+    def test_manifest_contains_box_of_each_state(self):
+        """test_manifest_contains_box_of_each_state"""
+
+        manifest = json.loads(self._get().content)
+
+        self.assertEqual(
+            sorted(manifest["status_boxes"]),
+            [
+                "checking",
+                "failure",
+                "info",
+                "invalid",
+                "pending",
+                "stale",
+                "success",
+            ],
+        )
+        self.assertIn("text-success", manifest["status_boxes"]["success"])
+
+    def test_response_is_tagged_with_version(self):
+        """test_response_is_tagged_with_version"""
+
+        response = self._get()
+
+        self.assertEqual(
+            response["ETag"], '"%s"' % json.loads(response.content)["version"]
+        )
+
+    def test_response_is_cacheable(self):
+        """test_response_is_cacheable"""
+
+        with patch(
+            "core_module_local_id_registry_app.views.views.settings."
+            "VALIDATION_MANIFEST_MAX_AGE",
+            60,
+        ):
+            response = self._get()
+
+        self.assertEqual(response["Cache-Control"], "max-age=60")
+
+    def test_known_version_returns_304(self):
+        """test_known_version_returns_304"""
+
+        etag = self._get()["ETag"]
+
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_outdated_version_returns_manifest(self):
+        """test_outdated_version_returns_manifest"""
+
+        response = self._get(HTTP_IF_NONE_MATCH='"mock_version"')
+
+        self.assertEqual(response.status_code, 200)
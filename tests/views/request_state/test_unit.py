@@ -0,0 +1,83 @@
+"""Test units"""
+
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from core_module_local_id_registry_app.utils.timing import PhaseTimer
+from core_module_local_id_registry_app.views.request_state import (
+    RequestState,
+)
+
+
+class TestRequestStateInit(TestCase):
+    """Test Request State Init"""
+
+    def test_state_is_empty(self):
+        """test_state_is_empty"""
+
+        request_state = RequestState()
+
+        self.assertIsNone(request_state.default_value)
+        self.assertIsNone(request_state.default_prefix)
+        self.assertIsNone(request_state.error_data)
+        self.assertIsNone(request_state.error_code)
+        self.assertFalse(request_state.has_failed)
+        self.assertFalse(request_state.verdict_pending)
+        self.assertFalse(request_state.verdict_stale)
+        self.assertIsNone(request_state.task_id)
+
+    def test_states_are_independent(self):
+        """test_states_are_independent"""
+
+        first_state = RequestState()
+        first_state.error_data = "mock_data"
+
+        self.assertIsNone(RequestState().error_data)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """test_unknown_attribute_raises_attribute_error"""
+
+        with self.assertRaises(AttributeError):
+            RequestState().data = "mock_data"
+
+
+class TestRequestStateGetRemainingTime(TestCase):
+    """Test Request State Get Remaining Time"""
+
+    def test_no_budget_returns_none(self):
+        """test_no_budget_returns_none"""
+
+        self.assertIsNone(RequestState().get_remaining_time())
+
+    def test_null_budget_returns_none(self):
+        """test_null_budget_returns_none"""
+
+        self.assertIsNone(RequestState(budget=0).get_remaining_time())
+
+    @patch("core_module_local_id_registry_app.views.request_state.monotonic")
+    def test_returns_time_left_to_budget(self, mock_monotonic):
+        """test_returns_time_left_to_budget"""
+
+        mock_monotonic.side_effect = [10, 10.5]
+
+        self.assertEqual(RequestState(budget=2).get_remaining_time(), 1.5)
+
+
+class TestRequestStateTimePhase(TestCase):
+    """Test Request State Time Phase"""
+
+    def test_phase_is_recorded_by_timer(self):
+        """test_phase_is_recorded_by_timer"""
+
+        phase_timer = PhaseTimer()
+
+        with RequestState(phase_timer).time_phase("mock_phase"):
+            pass
+
+        self.assertIn("mock_phase", phase_timer.durations)
+
+    def test_no_timer_does_not_raise(self):
+        """test_no_timer_does_not_raise"""
+
+        with RequestState().time_phase("mock_phase"):
+            pass
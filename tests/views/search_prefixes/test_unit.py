@@ -0,0 +1,120 @@
+"""Test units"""
+
+import json
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from core_module_local_id_registry_app.config import reload_config
+from core_module_local_id_registry_app.views.views import search_prefixes
+from tests import test_settings
+
+
+class TestSearchPrefixes(TestCase):
+    """Test Search Prefixes"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+
+        # Run last, once the settings are restored.
+        self.addCleanup(reload_config)
+        patch_prefixes = patch(
+            "core_linked_records_app.settings.ID_PROVIDER_PREFIXES",
+            ["mock_prefix_%02d" % index for index in range(30)],
+        )
+        patch_prefixes.start()
+        self.addCleanup(patch_prefixes.stop)
+        reload_config()
+
+        self.request = Mock()
+        self.request.method = "GET"
+
+    def _search(self, **params):
+        self.request.GET = params
+        return search_prefixes(self.request)
+
+    def test_without_linked_records_returns_400(self):
+        """test_without_linked_records_returns_400"""
+
+        test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        self.addCleanup(
+            test_settings.INSTALLED_APPS.append, "core_linked_records_app"
+        )
+        reload_config()
+
+        self.assertEqual(self._search().status_code, 400)
+
+    def test_post_returns_405(self):
+        """test_post_returns_405"""
+
+        self.request.method = "POST"
+
+        self.assertEqual(self._search().status_code, 405)
+
+    def test_default_page_returns_first_prefixes(self):
+        """test_default_page_returns_first_prefixes"""
+
+        response = self._search()
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "results": ["mock_prefix_%02d" % index for index in range(20)],
+                "total": 30,
+                "has_more": True,
+            },
+        )
+
+    def test_query_filters_prefixes(self):
+        """test_query_filters_prefixes"""
+
+        response = self._search(q="MOCK_PREFIX_1")
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "results": [
+                    "mock_prefix_%02d" % index for index in range(10, 20)
+                ],
+                "total": 10,
+                "has_more": False,
+            },
+        )
+
+    def test_offset_and_limit_select_page(self):
+        """test_offset_and_limit_select_page"""
+
+        response = self._search(offset="25", limit="10")
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "results": [
+                    "mock_prefix_%02d" % index for index in range(25, 30)
+                ],
+                "total": 30,
+                "has_more": False,
+            },
+        )
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "PREFIX_SEARCH_MAX_PAGE_SIZE",
+        5,
+    )
+    def test_limit_is_bounded(self):
+        """test_limit_is_bounded"""
+
+        response = self._search(limit="1000")
+
+        self.assertEqual(len(json.loads(response.content)["results"]), 5)
+
+    def test_invalid_offset_returns_400(self):
+        """test_invalid_offset_returns_400"""
+
+        self.assertEqual(self._search(offset="first").status_code, 400)
+
+    def test_negative_limit_returns_400(self):
+        """test_negative_limit_returns_400"""
+
+        self.assertEqual(self._search(limit="-1").status_code, 400)
@@ -0,0 +1,196 @@
+"""Test units"""
+
+import json
+from unittest.case import TestCase
+from unittest.mock import patch, Mock
+
+from core_curate_app.components.curate_data_structure.models import (
+    CurateDataStructure,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_module_local_id_registry_app.utils.pid import (
+    pid_verdict_cache,
+    provider_breaker,
+    stale_pid_verdict_cache,
+)
+from core_module_local_id_registry_app.utils.providers import provider_cache
+from core_module_local_id_registry_app.utils.rendering import status_box_cache
+from core_module_local_id_registry_app.views.views import validate_local_ids
+from core_module_local_id_registry_app.config import reload_config
+from tests import test_settings
+from tests.views.LocalIdRegistryModule.fixtures import (
+    MockPID,
+    MockProvider,
+    mock_return_fn_args_as_dict,
+)
+
+
+class TestValidateLocalIds(TestCase):
+    """Test Validate Local Ids"""
+
+    def setUp(self) -> None:
+        if "core_linked_records_app" not in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.append("core_linked_records_app")
+        reload_config()
+
+        patch_provider_manager = patch(
+            "core_linked_records_app.utils.providers.ProviderManager.get",
+            return_value=MockProvider(),
+        )
+        patch_provider_manager.start()
+        self.addCleanup(patch_provider_manager.stop)
+        provider_cache.clear()
+        status_box_cache.clear()
+        pid_verdict_cache.clear()
+        stale_pid_verdict_cache.clear()
+        provider_breaker.clear()
+
+        patch_render_template = patch(
+            "core_module_local_id_registry_app.views.views."
+            "LocalIdRegistryModule.render_template",
+            side_effect=lambda *args: json.dumps(
+                mock_return_fn_args_as_dict(*args)
+            ),
+        )
+        patch_render_template.start()
+        self.addCleanup(patch_render_template.stop)
+
+        patch_get_curate_data_structure = patch(
+            "core_module_local_id_registry_app.views.views."
+            "LocalIdRegistryModule._get_curate_datastructure_from_module_id",
+            return_value=Mock(spec=CurateDataStructure, pk=1, data_id=None),
+        )
+        patch_get_curate_data_structure.start()
+        self.addCleanup(patch_get_curate_data_structure.stop)
+
+        patch_is_pid_defined = patch(
+            "core_linked_records_app.system.data.api.is_pid_defined",
+            return_value=False,
+        )
+        self.mock_is_pid_defined = patch_is_pid_defined.start()
+        self.addCleanup(patch_is_pid_defined.stop)
+
+        self.request = Mock()
+        self.request.method = "POST"
+        self.request.user = create_mock_user("1")
+
+    def _send(self, items):
+        self.request.body = json.dumps(items)
+        return validate_local_ids(self.request)
+
+    def test_invalid_json_returns_400(self):
+        """test_invalid_json_returns_400"""
+
+        self.request.body = "{"
+
+        response = validate_local_ids(self.request)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_item_without_module_id_returns_400(self):
+        """test_item_without_module_id_returns_400"""
+
+        response = self._send([{"data": str(MockPID())}])
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "BATCH_VALIDATION_MAX_ITEMS",
+        2,
+    )
+    def test_too_many_items_returns_400(self):
+        """test_too_many_items_returns_400"""
+
+        response = self._send(
+            [{"module_id": index, "data": None} for index in range(3)]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.mock_is_pid_defined.called)
+
+    @patch(
+        "core_module_local_id_registry_app.views.views.settings."
+        "BATCH_VALIDATION_MAX_ITEMS",
+        2,
+    )
+    def test_max_items_are_validated(self):
+        """test_max_items_are_validated"""
+
+        response = self._send(
+            [{"module_id": index, "data": None} for index in range(2)]
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_returns_one_result_per_item(self):
+        """test_returns_one_result_per_item"""
+
+        response = self._send(
+            [
+                {"module_id": 1, "data": str(MockPID())},
+                {"module_id": 2, "data": "mock_incorrect_url"},
+                {"module_id": 3, "data": None},
+            ]
+        )
+
+        self.assertEqual(
+            [
+                result["state"]
+                for result in json.loads(response.content)["results"]
+            ],
+            ["success", "invalid", "info"],
+        )
+
+    def test_result_contains_status_box(self):
+        """test_result_contains_status_box"""
+
+        response = self._send([{"module_id": 1, "data": str(MockPID())}])
+        result = json.loads(response.content)["results"][0]
+
+        self.assertEqual(json.loads(result["html"])["arg1"]["type"], "success")
+
+    def test_is_pid_defined_called_once_per_distinct_pid(self):
+        """test_is_pid_defined_called_once_per_distinct_pid"""
+
+        self._send(
+            [
+                {"module_id": 1, "data": str(MockPID())},
+                {"module_id": 2, "data": str(MockPID())},
+                {"module_id": 3, "data": str(MockPID(value="mock_2"))},
+            ]
+        )
+
+        self.assertEqual(self.mock_is_pid_defined.call_count, 2)
+
+    def test_is_pid_defined_not_called_for_invalid_pid(self):
+        """test_is_pid_defined_not_called_for_invalid_pid"""
+
+        self._send([{"module_id": 1, "data": "mock_incorrect_url"}])
+
+        self.assertFalse(self.mock_is_pid_defined.called)
+
+    def test_module_lookup_error_returns_failure(self):
+        """test_module_lookup_error_returns_failure"""
+
+        with patch(
+            "core_module_local_id_registry_app.views.views."
+            "LocalIdRegistryModule._get_curate_datastructure_from_module_id",
+            side_effect=Exception("mock_error"),
+        ):
+            response = self._send([{"module_id": 1, "data": str(MockPID())}])
+
+        self.assertEqual(
+            json.loads(response.content)["results"][0]["state"], "failure"
+        )
+
+    def test_without_linked_records_returns_400(self):
+        """test_without_linked_records_returns_400"""
+
+        while "core_linked_records_app" in test_settings.INSTALLED_APPS:
+            test_settings.INSTALLED_APPS.remove("core_linked_records_app")
+        reload_config()
+
+        response = self._send([{"module_id": 1, "data": str(MockPID())}])
+
+        self.assertEqual(response.status_code, 400)